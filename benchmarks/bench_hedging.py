@@ -0,0 +1,140 @@
+"""
+Benchmark: hedged requests vs. plain requests for short dictations.
+
+Starts a local mock of the Groq transcription endpoint where a small
+fraction of responses are very slow, then sends the same short WAV file
+through GroqTranscriber with hedging off and on, and prints latency
+percentiles for both runs.
+
+Usage:
+    python benchmarks/bench_hedging.py [--requests 150] [--slow-rate 0.04] [--slow-seconds 3]
+"""
+
+import argparse
+import contextlib
+import http.server
+import io
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+class MockGroqHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every POST with a fixed transcript after a random delay."""
+
+    fast_range = (0.10, 0.25)
+    slow_rate = 0.04
+    slow_seconds = 3.0
+    rng = random.Random(42)
+    rng_lock = threading.Lock()
+    request_count = 0
+
+    def do_POST(self):
+        remaining = int(self.headers.get("content-length", 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 16)))
+
+        with self.rng_lock:
+            MockGroqHandler.request_count += 1
+            slow = self.rng.random() < self.slow_rate
+            delay = self.slow_seconds if slow else self.rng.uniform(*self.fast_range)
+        time.sleep(delay)
+
+        body = "merhaba dünya".encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "text/plain; charset=utf-8")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_mock_server() -> str:
+    """Start the mock server in a background thread and return its base URL."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), MockGroqHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def write_test_wav(path: str, seconds: float = 2.0, sample_rate: int = 16000) -> None:
+    """Write a short silent mono WAV file (~64 KB)."""
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * sample_rate))
+
+
+def run(transcriber, wav_path: str, count: int) -> list:
+    """Transcribe the file `count` times and return per-call latencies."""
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = transcriber.transcribe_detailed(wav_path, language="tr", latency_sensitive=True)
+        latencies.append(time.perf_counter() - start)
+        if result is None:
+            print("  warning: request failed")
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=150, help="requests per run")
+    parser.add_argument("--warmup", type=int, default=20, help="requests before measuring (seeds the p95 deadline)")
+    parser.add_argument("--slow-rate", type=float, default=0.04, help="fraction of slow responses")
+    parser.add_argument("--slow-seconds", type=float, default=3.0, help="latency of a slow response")
+    parser.add_argument("--max-per-minute", type=int, default=60, help="hedge budget")
+    args = parser.parse_args()
+
+    MockGroqHandler.slow_rate = args.slow_rate
+    MockGroqHandler.slow_seconds = args.slow_seconds
+
+    os.environ.update({
+        "GROQ_API_KEY": "bench",
+        "GROQ_BASE_URL": start_mock_server(),
+        "TRANSCRIPT_CACHE_ENABLED": "false",
+        "GROQ_RPM_LIMIT": "100000",
+        "GROQ_AUDIO_SECONDS_PER_HOUR": "100000000",
+    })
+
+    from core.hedging import HedgePolicy
+    from core.telemetry import percentile
+    from core.transcriber import GroqTranscriber
+
+    transcriber = GroqTranscriber()
+    wav_path = os.path.join(tempfile.mkdtemp(), "dictation.wav")
+    write_test_wav(wav_path)
+
+    transcriber.hedge_policy = HedgePolicy(enabled=False)
+    run(transcriber, wav_path, args.warmup)
+
+    results = {}
+    for name, enabled in (("plain", False), ("hedged", True)):
+        policy = HedgePolicy(enabled=enabled, max_per_minute=args.max_per_minute)
+        transcriber.hedge_policy = policy
+        sent_before = MockGroqHandler.request_count
+        print(f"Running {args.requests} {name} requests...")
+        latencies = run(transcriber, wav_path, args.requests)
+        results[name] = (latencies, MockGroqHandler.request_count - sent_before, policy.get_stats())
+
+    print()
+    print(f"{'run':<8} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'upstream':>9} {'hedges':>7} {'wins':>5}")
+    for name, (latencies, upstream, stats) in results.items():
+        p50, p95, p99 = (percentile(latencies, p) for p in (50, 95, 99))
+        print(f"{name:<8} {p50:7.3f} {p95:7.3f} {p99:7.3f} {max(latencies):7.3f} {upstream:9d} "
+              f"{stats['hedges_sent']:7d} {stats['hedge_wins']:5d}")
+    print(f"\nhedge deadline at end: {results['hedged'][2]['deadline_seconds']:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
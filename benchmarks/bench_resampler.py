@@ -0,0 +1,95 @@
+"""
+Benchmark: CPU cost of the streaming polyphase resampler.
+
+Converts synthetic speech-like audio from common device formats (44.1/48
+kHz, mono/stereo) to 16 kHz mono with PolyphaseResampler, fed in blocks of
+different sizes (a capture-buffer page, one second, an audio callback
+block), and prints CPU milliseconds per audio second and the upload bytes
+saved. If scipy is installed, resample_poly is timed for reference.
+
+Usage:
+    python benchmarks/bench_resampler.py [--seconds 60] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+FORMATS = [(48000, 1), (48000, 2), (44100, 1), (44100, 2), (32000, 1), (22050, 1)]
+
+
+def make_audio(seconds: float, sample_rate: int, channels: int) -> np.ndarray:
+    """Amplitude-modulated harmonics plus noise, as int16 (frames x channels)."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 12))
+    signal = 0.15 * voice * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t)) + rng.normal(0, 0.005, len(t))
+    mono = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+    return np.repeat(mono[:, None], channels, axis=1)
+
+
+def time_resampler(audio: np.ndarray, sample_rate: int, block_frames: int, repeat: int) -> tuple:
+    """Best-of-`repeat` CPU seconds to convert `audio` fed in blocks, and output frames."""
+    from core.resampler import PolyphaseResampler
+
+    best = float("inf")
+    frames = 0
+    for _ in range(repeat):
+        resampler = PolyphaseResampler(sample_rate, 16000, audio.shape[1])
+        start = time.process_time()
+        frames = sum(len(resampler.process(audio[i:i + block_frames])) for i in range(0, len(audio), block_frames))
+        frames += len(resampler.flush())
+        best = min(best, time.process_time() - start)
+    return best, frames
+
+
+def time_scipy(audio: np.ndarray, sample_rate: int, repeat: int):
+    """Best CPU seconds of scipy.signal.resample_poly on the whole signal, or None without scipy."""
+    try:
+        from scipy.signal import resample_poly
+    except ImportError:
+        return None
+    from math import gcd
+
+    divisor = gcd(sample_rate, 16000)
+    mono = audio.mean(axis=1, dtype=np.float32)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        resample_poly(mono, 16000 // divisor, sample_rate // divisor)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=60.0, help="audio per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (best is reported)")
+    args = parser.parse_args()
+
+    from core.resampler import PolyphaseResampler
+
+    print(f"{'format':<12} {'block':>8} {'taps':>5} {'cpu ms/audio s':>15} {'x realtime':>11} "
+          f"{'bytes in':>10} {'bytes out':>10} {'scipy ms/s':>11}")
+    for sample_rate, channels in FORMATS:
+        audio = make_audio(args.seconds, sample_rate, channels)
+        taps = PolyphaseResampler(sample_rate, 16000, channels).taps
+        scipy_seconds = time_scipy(audio, sample_rate, args.repeat)
+        scipy_text = f"{scipy_seconds / args.seconds * 1000:11.2f}" if scipy_seconds is not None else f"{'n/a':>11}"
+        # Capture-buffer page (60 s), one second, one callback block (10 ms)
+        for block_seconds in (60, 1, 0.01):
+            block_frames = max(1, int(block_seconds * sample_rate))
+            seconds, frames = time_resampler(audio, sample_rate, block_frames, args.repeat)
+            per_second_ms = seconds / args.seconds * 1000
+            realtime = args.seconds / seconds if seconds > 0 else float("inf")
+            print(f"{sample_rate / 1000:>6g}k/{channels}ch {block_seconds:>7}s {taps:>5} {per_second_ms:15.2f} "
+                  f"{realtime:11.0f} {audio.nbytes:10d} {frames * 2:10d} {scipy_text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+GroqWhisper CLI - Headless batch transcription.
+
+Runs the desktop app's pipeline (AudioSplitter, transcription backend,
+transcript merger) on files and directories without any GUI modules:
+
+    python -m src.cli transcribe recordings/ "calls/**/*.m4a" --workers 4
+
+Outputs are written next to each input (<name>.txt and/or <name>.json;
+<name>.<ext>.txt if another audio file shares the name, e.g. talk.wav and
+talk.mp3).
+Inputs whose outputs are newer than the audio are skipped, so reruns only
+process new or changed files.
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import Config
+from core.audio_splitter import AudioSplitter
+from core.ffmpeg_utils import FFMPEG_REQUIRED_FORMATS
+from core.transcript_merger import TranscriptMerger
+from core.transcription_backend import TranscriptionBackend, TranscriptionResult, create_transcriber
+from models.recording import Recording, SourceType
+
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg"} | set(FFMPEG_REQUIRED_FORMATS)
+
+# Same split rule as the dashboard (Api.check_audio_duration)
+SPLIT_THRESHOLD_SECONDS = 600
+SPLIT_THRESHOLD_MB = 24
+
+
+@dataclass
+class FileOutcome:
+    """Result of one input file."""
+    path: Path
+    status: str  # done, skipped or failed
+    audio_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    chunks: int = 0
+    error: Optional[str] = None
+
+
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    """
+    Expand files, directories (recursively) and glob patterns into audio files.
+
+    Args:
+        patterns: Command line inputs
+
+    Returns:
+        Sorted, de-duplicated list of audio files
+    """
+    found = set()
+    for pattern in patterns:
+        matches = [Path(p) for p in glob.glob(pattern, recursive=True)] if glob.has_magic(pattern) else [Path(pattern)]
+        for match in matches:
+            if match.is_dir():
+                found.update(p for p in match.rglob("*") if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS)
+            elif match.is_file() and match.suffix.lower() in AUDIO_EXTENSIONS:
+                found.add(match)
+            elif not match.exists():
+                print(f"[CLI] Warning: No such file or directory: {pattern}", file=sys.stderr)
+    return sorted(p.resolve() for p in found)
+
+
+def output_base(path: Path) -> Path:
+    """
+    Path that output suffixes are appended to for an input.
+
+    Normally <name> (talk.wav -> talk.txt). If another audio file in the same
+    directory has the same stem (talk.wav and talk.mp3), the audio suffix is
+    kept (talk.wav.txt) so the outputs do not overwrite each other. Siblings
+    are checked rather than only this run's inputs, so names stay the same
+    whichever files a run is given.
+
+    Args:
+        path: Audio file
+
+    Returns:
+        Output base path (without the output suffix)
+    """
+    siblings = path.parent.glob(glob.escape(path.stem) + ".*")
+    if any(p != path and p.stem == path.stem and p.suffix.lower() in AUDIO_EXTENSIONS for p in siblings):
+        return path
+    return path.with_suffix("")
+
+
+def output_paths(path: Path, formats: List[str]) -> List[Path]:
+    """Output files written for an input."""
+    base = output_base(path)
+    return [base.with_name(f"{base.name}.{fmt}") for fmt in formats]
+
+
+def is_done(path: Path, formats: List[str]) -> bool:
+    """True if all outputs exist and are newer than the audio file."""
+    audio_mtime = path.stat().st_mtime
+    return all(out.exists() and out.stat().st_mtime >= audio_mtime for out in output_paths(path, formats))
+
+
+class BatchTranscriber:
+    """Transcribes many files with a bounded number of concurrent uploads."""
+
+    def __init__(self, transcriber: TranscriptionBackend, workers: int, language: Optional[str],
+                 translate: bool, with_segments: bool, formats: List[str]):
+        """
+        Initialize the batch.
+
+        Args:
+            transcriber: Transcription backend (Groq or local)
+            workers: Files processed and requests in flight at once
+            language: Language code, or None for auto-detect
+            translate: If True, translate to English
+            with_segments: Request segment timestamps (stored in the JSON output)
+            formats: Output formats (txt and/or json)
+        """
+        self.transcriber = transcriber
+        self.workers = max(1, workers)
+        self.language = language
+        self.translate = translate
+        self.with_segments = with_segments
+        self.formats = formats
+        # Only used for duration probing (split jobs get their own temp dir)
+        self._probe = AudioSplitter(temp_dir=tempfile.gettempdir())
+
+    async def _transcribe(self, path: str, uploads: asyncio.Semaphore) -> Optional[TranscriptionResult]:
+        async with uploads:
+            return await self.transcriber.transcribe_detailed_async(
+                path, language=self.language, translate=self.translate, with_segments=self.with_segments
+            )
+
+    def _needs_split(self, path: Path, duration: float) -> bool:
+        size_mb = path.stat().st_size / (1024 * 1024)
+        return duration > SPLIT_THRESHOLD_SECONDS or size_mb > SPLIT_THRESHOLD_MB
+
+    async def _transcribe_split(self, path: Path, uploads: asyncio.Semaphore) -> tuple:
+        """Split a long file, transcribe its chunks concurrently and merge them."""
+        with tempfile.TemporaryDirectory(prefix="groqwhisper_") as temp_dir:
+            splitter = AudioSplitter(temp_dir=temp_dir)
+            job_id = f"cli_{int(time.time() * 1000)}"
+            metadata = await asyncio.to_thread(splitter.split, str(path), job_id)
+
+            async def run_chunk(chunk: dict) -> Recording:
+                result = await self._transcribe(str(Path(temp_dir) / chunk["filename"]), uploads)
+                if result is None:
+                    raise RuntimeError(f"chunk {chunk['part']} failed")
+                # Segment times are relative to the chunk: move them to the original file's timeline
+                result = result.offset_segments(chunk["start_seconds"])
+                return Recording(
+                    id=f"{job_id}_{chunk['part']}", filepath=chunk["filename"], created_at=datetime.now(),
+                    transcribed=True, transcript=result.text, source=SourceType.FILE, is_split=True,
+                    chunk_part=chunk["part"], parent_recording_id=job_id,
+                    chunk_start_seconds=chunk["start_seconds"], segments=result.segments,
+                )
+
+            chunks = await asyncio.gather(*(run_chunk(chunk) for chunk in metadata["chunks"]))
+
+        merger = TranscriptMerger(overlap_seconds=metadata["overlap_seconds"])
+        text = merger.merge(chunks)
+        segments = None
+        if all(chunk.segments is not None for chunk in chunks):
+            segments = merger.merge_segments(chunks)
+        return TranscriptionResult(text=text, segments=segments), len(chunks)
+
+    def _write_outputs(self, path: Path, result: TranscriptionResult, duration: float, elapsed: float,
+                       chunks: int) -> None:
+        outputs = dict(zip(self.formats, output_paths(path, self.formats)))
+        if "txt" in outputs:
+            outputs["txt"].write_text(result.text, encoding="utf-8")
+        if "json" in outputs:
+            payload = {
+                "file": path.name,
+                "backend": self.transcriber.NAME,
+                "language": self.language or "auto",
+                "translate": self.translate,
+                "duration_seconds": round(duration, 2),
+                "transcription_seconds": round(elapsed, 2),
+                "chunks": chunks,
+                "text": result.text,
+                "segments": result.segments,
+            }
+            with open(outputs["json"], "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+
+    async def _process(self, path: Path, files: asyncio.Semaphore, uploads: asyncio.Semaphore) -> FileOutcome:
+        async with files:
+            started = time.perf_counter()
+            try:
+                duration = await asyncio.to_thread(self._probe.get_audio_duration, str(path))
+                if self._needs_split(path, duration):
+                    result, chunks = await self._transcribe_split(path, uploads)
+                else:
+                    result, chunks = await self._transcribe(str(path), uploads), 1
+                if result is None:
+                    raise RuntimeError("transcription failed")
+                elapsed = time.perf_counter() - started
+                await asyncio.to_thread(self._write_outputs, path, result, duration, elapsed, chunks)
+                return FileOutcome(path, "done", duration, elapsed, chunks)
+            except Exception as e:
+                return FileOutcome(path, "failed", elapsed_seconds=time.perf_counter() - started, error=str(e))
+
+    async def run(self, paths: List[Path], force: bool = False) -> List[FileOutcome]:
+        """
+        Transcribe all files, printing one progress line per file.
+
+        Args:
+            paths: Audio files
+            force: Re-transcribe files whose outputs are up to date
+
+        Returns:
+            Outcome of every file
+        """
+        files = asyncio.Semaphore(self.workers)
+        uploads = asyncio.Semaphore(self.workers)
+        outcomes = []
+        tasks = []
+        for path in paths:
+            if not force and is_done(path, self.formats):
+                outcomes.append(FileOutcome(path, "skipped"))
+            else:
+                tasks.append(self._process(path, files, uploads))
+
+        width = len(str(len(paths)))
+        for i, outcome in enumerate(outcomes, 1):
+            print(f"[{i:>{width}}/{len(paths)}] skip  {outcome.path.name} (up to date)")
+
+        for next_done in asyncio.as_completed(tasks):
+            outcome = await next_done
+            outcomes.append(outcome)
+            prefix = f"[{len(outcomes):>{width}}/{len(paths)}]"
+            if outcome.status == "done":
+                parts = f", {outcome.chunks} chunks" if outcome.chunks > 1 else ""
+                print(f"{prefix} done  {outcome.path.name}: {outcome.audio_seconds / 60:.1f} min audio"
+                      f" in {outcome.elapsed_seconds:.1f}s{parts}")
+            else:
+                print(f"{prefix} FAIL  {outcome.path.name}: {outcome.error}")
+        return outcomes
+
+
+def print_summary(outcomes: List[FileOutcome], wall_seconds: float) -> None:
+    """Print counts and throughput in audio-hours per wall-hour."""
+    done = [o for o in outcomes if o.status == "done"]
+    skipped = sum(1 for o in outcomes if o.status == "skipped")
+    failed = sum(1 for o in outcomes if o.status == "failed")
+    audio_hours = sum(o.audio_seconds for o in done) / 3600
+    wall_hours = wall_seconds / 3600
+    throughput = audio_hours / wall_hours if wall_hours > 0 else 0.0
+
+    print("-" * 60)
+    print(f"Files: {len(done)} transcribed, {skipped} skipped, {failed} failed")
+    print(f"Audio: {audio_hours:.2f} h in {wall_seconds:.1f}s wall time")
+    print(f"Throughput: {throughput:.1f} audio-hours per wall-hour")
+
+
+def cmd_transcribe(args: argparse.Namespace) -> int:
+    """Run the transcribe command. Returns the process exit code."""
+    config = Config()
+    if args.backend:
+        os.environ["TRANSCRIPTION_BACKEND"] = args.backend
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("[CLI] No audio files found", file=sys.stderr)
+        return 2
+
+    try:
+        transcriber = create_transcriber(config)
+    except ValueError as e:
+        print(f"[CLI] {e}", file=sys.stderr)
+        return 2
+
+    language = args.language or config.get_language()
+    if language == "auto":
+        language = None
+    formats = ["txt", "json"] if args.format == "both" else [args.format]
+    workers = args.workers or transcriber.max_concurrency() or config.get_split_concurrency()
+
+    print(f"[CLI] {len(paths)} file(s), backend={transcriber.NAME}, workers={workers}")
+    batch = BatchTranscriber(
+        transcriber, workers, language, args.translate,
+        with_segments=args.segments or ("json" in formats and config.segment_timestamps_enabled()),
+        formats=formats,
+    )
+    started = time.perf_counter()
+    outcomes = asyncio.run(batch.run(paths, force=args.force))
+    print_summary(outcomes, time.perf_counter() - started)
+    return 1 if any(o.status == "failed" for o in outcomes) else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="GroqWhisper headless transcription")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    transcribe = commands.add_parser("transcribe", help="Transcribe audio files, directories or globs")
+    transcribe.add_argument("inputs", nargs="+", help="Audio files, directories (recursive) or glob patterns")
+    transcribe.add_argument("-w", "--workers", type=int, default=None,
+                            help="Parallel files/requests (default: backend workers or SPLIT_CONCURRENCY)")
+    transcribe.add_argument("-l", "--language", default=None, help="Language code or 'auto' (default: LANGUAGE)")
+    transcribe.add_argument("--translate", action="store_true", help="Translate to English")
+    transcribe.add_argument("--segments", action="store_true", help="Include segment timestamps in JSON output")
+    transcribe.add_argument("-f", "--format", choices=["txt", "json", "both"], default="txt",
+                            help="Output format written next to each input (default: txt)")
+    transcribe.add_argument("--backend", choices=["groq", "local"], default=None,
+                            help="Transcription backend (default: TRANSCRIPTION_BACKEND)")
+    transcribe.add_argument("--force", action="store_true", help="Re-transcribe files that are already done")
+    transcribe.set_defaults(func=cmd_transcribe)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -99,6 +99,7 @@ class Config:
             f.write("\n".join(lines))
 
         # Update runtime environment immediately
+        # (the shared Groq client notices the new key and rebuilds on next use)
         os.environ["GROQ_API_KEY"] = api_key
 
     def get_sample_rate(self) -> int:
@@ -191,6 +192,216 @@ class Config:
         self._save_env_value("TRANSLATE_TO_EN", value)
         os.environ["TRANSLATE_TO_EN"] = value
 
+    def segment_timestamps_enabled(self) -> bool:
+        """Get segment timestamps (verbose_json) preference."""
+        return os.getenv("SEGMENT_TIMESTAMPS", "false").lower() == "true"
+
+    def save_segment_timestamps_setting(self, enabled: bool) -> None:
+        """Save segment timestamps setting to .env and update os.environ."""
+        value = "true" if enabled else "false"
+        self._save_env_value("SEGMENT_TIMESTAMPS", value)
+        os.environ["SEGMENT_TIMESTAMPS"] = value
+
+    def get_transcription_backend(self) -> str:
+        """Get transcription backend: "groq" (cloud) or "local" (offline CPU)."""
+        backend = os.getenv("TRANSCRIPTION_BACKEND", "groq").strip().lower()
+        return backend if backend in ("groq", "local") else "groq"
+
+    def get_local_model(self) -> str:
+        """Get faster-whisper model name for the local backend."""
+        return os.getenv("LOCAL_WHISPER_MODEL", "small").strip() or "small"
+
+    def get_local_compute_type(self) -> str:
+        """Get CTranslate2 compute type for the local backend."""
+        return os.getenv("LOCAL_COMPUTE_TYPE", "int8").strip() or "int8"
+
+    def get_local_workers(self) -> int:
+        """Get number of files the local backend transcribes in parallel."""
+        default = max(1, (os.cpu_count() or 2) // 4)
+        try:
+            return max(1, int(os.getenv("LOCAL_WORKERS", str(default))))
+        except ValueError:
+            return default
+
+    def hedging_enabled(self) -> bool:
+        """Check if hedged requests are enabled for short dictations."""
+        return os.getenv("HEDGE_REQUESTS", "false").lower() == "true"
+
+    def get_hedge_max_mb(self) -> float:
+        """Get largest upload (MB) that may be hedged."""
+        try:
+            return max(0.0, float(os.getenv("HEDGE_MAX_MB", "1")))
+        except ValueError:
+            return 1.0
+
+    def get_hedge_max_per_minute(self) -> int:
+        """Get maximum number of hedge requests per minute."""
+        try:
+            return max(0, int(os.getenv("HEDGE_MAX_PER_MINUTE", "4")))
+        except ValueError:
+            return 4
+
+    def record_to_disk_enabled(self) -> bool:
+        """Check if recordings are streamed to disk while recording."""
+        return os.getenv("RECORD_TO_DISK", "false").lower() == "true"
+
+    def warm_input_stream_enabled(self) -> bool:
+        """Check if the microphone stream is kept open between recordings."""
+        return os.getenv("WARM_INPUT_STREAM", "false").lower() == "true"
+
+    def capture_process_enabled(self) -> bool:
+        """Check if the microphone is captured in a separate process (shared-memory ring)."""
+        return os.getenv("CAPTURE_PROCESS", "false").lower() == "true"
+
+    def in_memory_handoff_enabled(self) -> bool:
+        """Check if recordings are handed to the transcriber as in-memory FLAC."""
+        return os.getenv("IN_MEMORY_HANDOFF", "true").lower() == "true"
+
+    def get_pre_roll_seconds(self) -> float:
+        """Get audio (seconds) before the hotkey prepended to recordings (0 = off, max 5)."""
+        try:
+            return min(5.0, max(0.0, float(os.getenv("PRE_ROLL_SECONDS", "0"))))
+        except ValueError:
+            return 0.0
+
+    def vad_enabled(self) -> bool:
+        """Check if silence is trimmed from recordings before upload."""
+        return os.getenv("VAD_ENABLED", "false").lower() == "true"
+
+    def get_vad_threshold_db(self) -> float:
+        """Get lowest level (dBFS) counted as speech."""
+        try:
+            return float(os.getenv("VAD_THRESHOLD_DB", "-45"))
+        except ValueError:
+            return -45.0
+
+    def get_vad_min_speech_seconds(self) -> float:
+        """Get least speech (seconds) a recording needs to be transcribed."""
+        try:
+            return max(0.0, float(os.getenv("VAD_MIN_SPEECH_SECONDS", "0.3")))
+        except ValueError:
+            return 0.3
+
+    def get_vad_padding_seconds(self) -> float:
+        """Get audio (seconds) kept around detected speech."""
+        try:
+            return max(0.0, float(os.getenv("VAD_PADDING_SECONDS", "0.3")))
+        except ValueError:
+            return 0.3
+
+    def get_vad_max_pause_seconds(self) -> float:
+        """Get longest pause (seconds) kept inside recordings (0 = pauses are not shortened)."""
+        try:
+            return max(0.0, float(os.getenv("VAD_MAX_PAUSE_SECONDS", "0")))
+        except ValueError:
+            return 0.0
+
+    def get_hotkey_mode(self) -> str:
+        """Get recording hotkey mode: 'toggle' (press to start/stop) or 'hold' (push-to-talk)."""
+        mode = os.getenv("HOTKEY_MODE", "toggle").lower()
+        return mode if mode in ("toggle", "hold") else "toggle"
+
+    def speculative_transcription_enabled(self) -> bool:
+        """Check if long dictations are transcribed in segments while recording."""
+        return os.getenv("SPECULATIVE_TRANSCRIPTION", "false").lower() == "true"
+
+    def get_speculative_min_segment_seconds(self) -> float:
+        """Get shortest segment (seconds) cut off while recording."""
+        try:
+            return max(5.0, float(os.getenv("SPECULATIVE_MIN_SEGMENT_SECONDS", "30")))
+        except ValueError:
+            return 30.0
+
+    def get_job_max_attempts(self) -> int:
+        """Get failed attempts before a queued job is given up."""
+        try:
+            return max(1, int(os.getenv("JOB_MAX_ATTEMPTS", "5")))
+        except ValueError:
+            return 5
+
+    def get_job_retry_seconds(self) -> float:
+        """Get base retry delay (and offline wait) for queued jobs."""
+        try:
+            return max(1.0, float(os.getenv("JOB_RETRY_SECONDS", "30")))
+        except ValueError:
+            return 30.0
+
+    def get_split_concurrency(self) -> int:
+        """Get number of split chunks transcribed in parallel."""
+        try:
+            return max(1, int(os.getenv("SPLIT_CONCURRENCY", "3")))
+        except ValueError:
+            return 3
+
+    def get_rate_limit_rpm(self) -> int:
+        """Get Groq requests-per-minute budget."""
+        try:
+            return max(1, int(os.getenv("GROQ_RPM_LIMIT", "20")))
+        except ValueError:
+            return 20
+
+    def get_rate_limit_audio_seconds(self) -> int:
+        """Get Groq audio-seconds-per-hour budget."""
+        try:
+            return max(1, int(os.getenv("GROQ_AUDIO_SECONDS_PER_HOUR", "7200")))
+        except ValueError:
+            return 7200
+
+    def transcript_cache_enabled(self) -> bool:
+        """Get transcript cache preference."""
+        return os.getenv("TRANSCRIPT_CACHE_ENABLED", "true").lower() == "true"
+
+    def get_transcript_cache_max_mb(self) -> float:
+        """Get maximum transcript cache size in megabytes."""
+        try:
+            return max(1.0, float(os.getenv("TRANSCRIPT_CACHE_MAX_MB", "100")))
+        except ValueError:
+            return 100.0
+
+    def get_groq_pool_size(self) -> int:
+        """Get max HTTP connections kept by the shared Groq client."""
+        try:
+            return max(1, int(os.getenv("GROQ_POOL_SIZE", "10")))
+        except ValueError:
+            return 10
+
+    def get_groq_keepalive_seconds(self) -> float:
+        """Get idle keep-alive time for pooled Groq connections."""
+        try:
+            return max(0.0, float(os.getenv("GROQ_KEEPALIVE_SECONDS", "60")))
+        except ValueError:
+            return 60.0
+
+    def groq_http2_enabled(self) -> bool:
+        """Get HTTP/2 preference for the Groq client (needs the h2 package)."""
+        return os.getenv("GROQ_HTTP2", "true").lower() == "true"
+
+    def get_groq_timeout_seconds(self) -> float:
+        """Get per-request read timeout for Groq calls."""
+        try:
+            return max(1.0, float(os.getenv("GROQ_TIMEOUT_SECONDS", "120")))
+        except ValueError:
+            return 120.0
+
+    def get_circuit_failure_threshold(self) -> int:
+        """Get consecutive Groq failures that open the circuit breaker."""
+        try:
+            return max(1, int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")))
+        except ValueError:
+            return 5
+
+    def get_circuit_recovery_seconds(self) -> float:
+        """Get seconds the circuit stays open before a probe request."""
+        try:
+            return max(1.0, float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30")))
+        except ValueError:
+            return 30.0
+
+    def get_circuit_fallback(self) -> str:
+        """Get backend used while the circuit is open: "none" or "local"."""
+        fallback = os.getenv("CIRCUIT_FALLBACK", "none").strip().lower()
+        return fallback if fallback in ("none", "local") else "none"
+
     def _save_env_value(self, key: str, value: str) -> None:
         """
         Save a key-value pair to .env file.
@@ -228,12 +439,21 @@ class Config:
         except ValueError:
             return -1
 
-    def save_input_device(self, device_index: int) -> None:
+    def get_input_device_key(self) -> str:
+        """Get stable input device identity ("host API::name") from .env (empty if not saved)."""
+        return os.getenv("INPUT_DEVICE_NAME", "")
+
+    def save_input_device(self, device_index: int, device_key: str = "") -> None:
         """
-        Save input device index to .env.
+        Save input device index and stable identity to .env.
 
         Args:
             device_index: Device index.
+            device_key: Stable device key (survives index shifts), empty for the default device.
         """
         self._save_env_value("INPUT_DEVICE", str(device_index))
         os.environ["INPUT_DEVICE"] = str(device_index)
+        # Quoted: device names can contain " #" (a comment when unquoted) or quotes
+        escaped = device_key.replace("\\", "\\\\").replace('"', '\\"')
+        self._save_env_value("INPUT_DEVICE_NAME", f'"{escaped}"')
+        os.environ["INPUT_DEVICE_NAME"] = device_key
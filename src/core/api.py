@@ -1,9 +1,9 @@
 import json
-import sounddevice as sd
 import pyperclip
-import threading
 from typing import Dict, Any, List
 
+from core.device_registry import get_device_registry, resolve_input_device
+
 class Api:
     """
     API Bridge between Python backend and PyWebview JavaScript frontend.
@@ -25,11 +25,12 @@ class Api:
         return {
             "api_key_exists": api_key_length > 0,
             "api_key_length": api_key_length,
-            "input_device_index": self._config.get_input_device(),
+            "input_device_index": self._selected_microphone(),
             "sound_enabled": self._config.play_beep(),
             "auto_paste_enabled": self._config.auto_paste_enabled(),
             "always_on_top": self._config.always_on_top(),
             "translate_enabled": self._config.translate_enabled(),
+            "segment_timestamps": self._config.segment_timestamps_enabled(),
             "language": self._config.get_language()
         }
 
@@ -62,6 +63,10 @@ class Api:
         if "translate_enabled" in config:
             self._config.save_translate_setting(config["translate_enabled"])
 
+        # Save Segment Timestamps Setting
+        if "segment_timestamps" in config:
+            self._config.save_segment_timestamps_setting(config["segment_timestamps"])
+
         # Save Language
         if "language" in config:
             self._config.save_language(config["language"])
@@ -91,10 +96,16 @@ class Api:
         self._config.save_api_key(api_key)
         print("[API] API key saved successfully")
 
+    def _selected_microphone(self) -> int:
+        """Current index of the saved microphone (-1 for system default)."""
+        index = resolve_input_device(self._config.get_input_device_key(), self._config.get_input_device())
+        return -1 if index is None else index
+
     def save_microphone(self, device_index: str) -> None:
-        """Save microphone selection instantly."""
-        self._config.save_input_device(int(device_index))
-        print(f"[API] Microphone set to: {device_index}")
+        """Save microphone selection instantly (by stable name, the index is only a hint)."""
+        device = get_device_registry().by_index(int(device_index)) if int(device_index) != -1 else None
+        self._config.save_input_device(int(device_index), device.key if device is not None else "")
+        print(f"[API] Microphone set to: {device.key if device is not None else device_index}")
 
     def save_toggle(self, setting: str, value: bool) -> None:
         """Save a toggle setting instantly."""
@@ -124,23 +135,73 @@ class Api:
             "install_url": "https://ffmpeg.org/download.html"
         }
 
+    def get_rate_limit_status(self) -> Dict[str, Any]:
+        """Get shared Groq rate-limit scheduler state (budgets, queue, pauses)."""
+        from core.rate_limiter import get_scheduler
+        return get_scheduler().get_stats()
+
+    def get_upload_telemetry(self) -> Dict[str, Any]:
+        """Get Groq upload telemetry: p50/p95/p99 aggregates, recent requests and hedging counters."""
+        from core.hedging import get_hedge_policy
+        from core.telemetry import get_telemetry
+        return {**get_telemetry().get_stats(), "hedging": get_hedge_policy().get_stats()}
+
+    def get_service_health(self) -> Dict[str, Any]:
+        """Get Groq circuit breaker state and the adaptive timeout model."""
+        from core.circuit_breaker import get_adaptive_timeout, get_circuit_breaker
+        return {
+            "circuit": get_circuit_breaker().get_stats(),
+            "timeouts": get_adaptive_timeout().get_stats(),
+        }
+
+    def get_job_queue_stats(self) -> Dict[str, Any]:
+        """Get durable job queue counts (pending, running, done, failed)."""
+        from core.job_queue import get_job_queue
+        return get_job_queue().get_stats()
+
+    def get_recorder_latency(self) -> Dict[str, Any]:
+        """Get recording start/stop latency and whether the warm input stream or capture process is running."""
+        return self._app.recorder.get_latency_stats()
+
+    def get_capture_stats(self) -> Dict[str, Any]:
+        """Get audio callback health (overflows, dropped blocks, callback time, jitter) of the current or last recording."""
+        return self._app.recorder.get_capture_stats()
+
+    def get_audio_handoff_stats(self) -> Dict[str, Any]:
+        """Get in-memory FLAC handoff counters (raw vs encoded bytes, stop-to-upload gap)."""
+        from core.audio_handoff import get_audio_handoff
+        return get_audio_handoff().get_stats()
+
+    def get_vad_stats(self) -> Dict[str, Any]:
+        """Get silence trimming counters (trimmed/no-speech recordings, seconds and bytes saved)."""
+        from core.vad import get_vad_stats
+        return get_vad_stats().get_stats()
+
+    def get_transcript_cache_stats(self) -> Dict[str, Any]:
+        """Get transcript cache hit/miss counters and size."""
+        from core.transcript_cache import get_transcript_cache
+        cache = get_transcript_cache()
+        if cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **cache.get_stats()}
+
+    def clear_transcript_cache(self) -> None:
+        """Delete all cached transcripts."""
+        from core.transcript_cache import get_transcript_cache
+        cache = get_transcript_cache()
+        if cache is not None:
+            cache.clear()
+        print("[API] Transcript cache cleared")
+
     def clear_history(self) -> None:
         """Clear all recording history."""
         self._history.clear_all()
         print("[API] History cleared")
 
     def get_microphones(self) -> List[Dict[str, Any]]:
-        """Get list of available microphones (filtered for cleaner UI)."""
+        """Get list of available microphones (filtered for cleaner UI, from the device registry cache)."""
         try:
-            devices = sd.query_devices()
-            host_apis = sd.query_hostapis()
-            
-            # Find WASAPI host API index (best for Windows)
-            wasapi_index = None
-            for i, api in enumerate(host_apis):
-                if 'WASAPI' in api['name']:
-                    wasapi_index = i
-                    break
+            devices = get_device_registry().devices()
             
             mics = []
             seen_names = set()
@@ -148,10 +209,11 @@ class Api:
             # Bluetooth detection keywords
             bluetooth_keywords = ['airpods', 'bluetooth', 'hands-free', 'wireless', 'bt ', 'bth']
             
-            for i, device in enumerate(devices):
-                if device['max_input_channels'] > 0:
-                    name = device['name']
-                    is_wasapi = device.get('hostapi') == wasapi_index
+            for device in devices:
+                if device.max_input_channels > 0:
+                    name = device.name
+                    # WASAPI host API is best for Windows
+                    is_wasapi = 'WASAPI' in device.hostapi
                     
                     # ONLY show WASAPI devices (best quality on Windows)
                     if not is_wasapi:
@@ -171,7 +233,7 @@ class Api:
                     # Check if Bluetooth device
                     is_bluetooth = any(kw.lower() in name.lower() for kw in bluetooth_keywords)
                     
-                    sample_rate = int(device['default_samplerate'])
+                    sample_rate = device.default_samplerate
                     
                     # Add Bluetooth warning to display name
                     if is_bluetooth:
@@ -180,7 +242,8 @@ class Api:
                         display_name = f"{name} ({sample_rate} Hz)"
                     
                     mics.append({
-                        "index": i,
+                        "index": device.index,
+                        "key": device.key,
                         "name": display_name,
                         "sample_rate": sample_rate,
                         "is_bluetooth": is_bluetooth
@@ -194,6 +257,15 @@ class Api:
             print(f"[API] Error getting mics: {e}")
             return []
     
+    def refresh_microphones(self) -> List[Dict[str, Any]]:
+        """Rescan audio devices (e.g. after plugging in a microphone) and return the new list."""
+        self._app.recorder.refresh_devices()
+        return self.get_microphones()
+
+    def get_device_registry_stats(self) -> Dict[str, Any]:
+        """Get device registry counters (scans, cache hits, last scan time)."""
+        return get_device_registry().get_stats()
+
     def get_recommended_microphone(self) -> int:
         """Get recommended non-Bluetooth microphone index."""
         mics = self.get_microphones()
@@ -214,18 +286,36 @@ class Api:
                 "transcribed": r.transcribed,
                 "is_split": r.is_split if hasattr(r, 'is_split') else False,
                 "chunk_part": r.chunk_part if hasattr(r, 'chunk_part') else None,
-                "parent_recording_id": r.parent_recording_id if hasattr(r, 'parent_recording_id') else None
+                "parent_recording_id": r.parent_recording_id if hasattr(r, 'parent_recording_id') else None,
+                "has_segments": bool(r.segments),
+                "capture_stats": r.capture_stats
             }
             for r in recordings
         ]
     
+    def get_segments(self, recording_id: str) -> List[Dict[str, Any]]:
+        """
+        Get timestamped segments for a recording.
+
+        Args:
+            recording_id: The recording ID.
+
+        Returns:
+            Segments (start, end, text, no_speech_prob), empty if not available.
+            Chunk segments are on the original file's timeline.
+        """
+        recording = self._history.get_recording(recording_id)
+        if not recording or not recording.segments:
+            return []
+        return recording.segments
+
     def copy_to_clipboard(self, text: str) -> None:
         """Copy text to system clipboard."""
         pyperclip.copy(text)
 
     def update_history_text(self, recording_id: str, new_text: str) -> None:
         """Update transcript text for a history item (edit mode)."""
-        self._history.update_transcript(recording_id, new_text)
+        self._history.edit_transcript(recording_id, new_text)
         print(f"[API] Updated history text for {recording_id}")
 
     def delete_recording(self, recording_id: str) -> bool:
@@ -257,10 +347,73 @@ class Api:
         
         return recording_id
 
+    def merge_split_job(self, parent_recording_id: str, recording_ids: List[str] | None = None,
+                        destination: str = "clipboard") -> Dict[str, Any]:
+        """
+        Merge the chunks of a split job into one deduplicated transcript.
+
+        Overlapping words at chunk seams are removed in Python (segment
+        timestamps when available, token alignment otherwise), so the full
+        text never has to pass through the webview.
+
+        Args:
+            parent_recording_id: ID of the split job.
+            recording_ids: Optional subset of chunk IDs to merge (default: all chunks).
+            destination: "clipboard" (new history entry + clipboard) or "file" (save dialog).
+
+        Returns:
+            Dict with success status, merged entry ID / path and merge statistics.
+        """
+        from core.audio_splitter import AudioSplitter
+        from core.transcript_merger import TranscriptMerger, load_overlap_seconds
+
+        chunks = self._history.get_split_chunks(parent_recording_id, recording_ids)
+        if not chunks:
+            return {"success": False, "message": "Parça bulunamadı"}
+
+        missing_parts = [c.chunk_part for c in chunks if not c.transcribed or not c.transcript]
+        overlap = load_overlap_seconds(parent_recording_id)
+        merger = TranscriptMerger(overlap if overlap is not None else AudioSplitter.OVERLAP_SECONDS)
+
+        if destination == "file":
+            import tkinter as tk
+            from tkinter import filedialog
+
+            try:
+                root = tk.Tk()
+                root.withdraw()
+                root.attributes('-topmost', True)
+                file_path = filedialog.asksaveasfilename(
+                    title="Transcripti Kaydet",
+                    defaultextension=".txt",
+                    initialfile=f"transcript_{parent_recording_id}.txt",
+                    filetypes=[("Metin Dosyaları", "*.txt"), ("Tüm Dosyalar", "*.*")]
+                )
+                root.destroy()
+
+                if not file_path:
+                    return {"success": False, "message": "İptal edildi"}
+
+                # Stream merged text straight to disk
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    chars = merger.write(chunks, f)
+                print(f"[API] Merged {len(chunks)} chunks to: {file_path}")
+                return {"success": True, "path": file_path, "chars": chars,
+                        "missing_parts": missing_parts, "stats": merger.last_stats}
+            except Exception as e:
+                print(f"[API] Error saving merged transcript: {e}")
+                return {"success": False, "message": str(e)}
+
+        merged_text = merger.merge(chunks)
+        recording_id = self.create_merged_entry(merged_text)
+        print(f"[API] Merged {len(chunks)} chunks of job {parent_recording_id}: {merger.last_stats}")
+        return {"success": True, "recording_id": recording_id, "chars": len(merged_text),
+                "missing_parts": missing_parts, "stats": merger.last_stats}
+
     def toggle_recording(self) -> None:
         """Toggle recording state manually from UI."""
-        # Run in thread to avoid blocking UI
-        threading.Thread(target=self._app.toggle_recording, daemon=True).start()
+        # Recorder start/stop blocks: run it in the event loop's worker pool, not the UI thread
+        self._app.runtime.submit_blocking(self._app.toggle_recording)
 
     def close_app(self) -> None:
         """Close the application."""
@@ -300,8 +453,8 @@ class Api:
         Args:
             filepath: Absolute path to the file.
         """
-        # Run in thread
-        threading.Thread(target=self._app.process_file_transcription, args=(filepath,), daemon=True).start()
+        # Run on the event loop
+        self._app.runtime.submit(self._app.process_file_transcription(filepath))
 
     # === Audio Splitting Endpoints ===
 
@@ -371,12 +524,12 @@ class Api:
         Returns:
             Transcribed text or None if failed
         """
-        from core.transcriber import GroqTranscriber
+        # Reuse the app's transcriber (shared pooled client, no new handshake) on the event loop
+        result = self._app.runtime.run(
+            self._app.transcriber.transcribe_detailed_async(chunk_path, language, translate)
+        )
 
-        transcriber = GroqTranscriber(self._config.get_api_key())
-        result = transcriber.transcribe(chunk_path, language, translate)
-
-        return result
+        return result.text if result else None
 
     def start_split_workflow(self, filepath: str) -> None:
         """
@@ -385,8 +538,8 @@ class Api:
         Args:
             filepath: Path to the audio file to split and transcribe
         """
-        # Run in thread to avoid blocking
-        threading.Thread(target=self._app.process_split_transcription_workflow, args=(filepath,), daemon=True).start()
+        # Run on the event loop (chunks become concurrent tasks)
+        self._app.runtime.submit(self._app.process_split_transcription_workflow(filepath))
 
     def save_transcript_to_file(self, text: str, default_filename: str) -> bool:
         """
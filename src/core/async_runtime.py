@@ -0,0 +1,135 @@
+"""
+Async Runtime Module - The app's single asyncio event loop.
+
+Transcription workflows run as coroutines on one event loop in a daemon
+thread. UI callbacks, hotkey handlers and the pywebview Api hand work to
+it thread-safely with submit(); concurrent uploads then cost a task each
+instead of a thread each.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+
+class AsyncRuntime:
+    """Runs an asyncio event loop in a dedicated daemon thread."""
+
+    def __init__(self, name: str = "event-loop"):
+        """
+        Initialize the runtime (the loop starts on first use).
+
+        Args:
+            name: Name of the loop thread
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if it is not running yet."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                    # Cancel whatever is left after stop()
+                    pending = asyncio.all_tasks(loop)
+                    for task in pending:
+                        task.cancel()
+                    if pending:
+                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                    loop.close()
+
+                self._thread = threading.Thread(target=run, name=self._name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop."""
+        return self._ensure_started()
+
+    def in_loop_thread(self) -> bool:
+        """True if called from the event loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the loop from any thread.
+
+        Exceptions are logged; callers may also wait on the returned future.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        future.add_done_callback(self._log_exception)
+        return future
+
+    def submit_blocking(self, fn: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        """
+        Run a blocking function in the loop's worker pool (e.g. recorder start/stop).
+
+        Args:
+            fn: Function to call
+            *args: Arguments for fn
+
+        Returns:
+            concurrent.futures.Future with fn's result
+        """
+        return self.submit(asyncio.to_thread(fn, *args))
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result (not from the loop thread).
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            The coroutine's result
+        """
+        if self.in_loop_thread():
+            raise RuntimeError("AsyncRuntime.run() would deadlock when called from the event loop thread")
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started()).result(timeout)
+
+    @staticmethod
+    def _log_exception(future: concurrent.futures.Future) -> None:
+        """Print errors of fire-and-forget submissions."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"[ASYNC] Task failed: {type(error).__name__}: {error}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop (pending tasks are cancelled) and wait for the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+_runtime = AsyncRuntime()
+
+
+def get_runtime() -> AsyncRuntime:
+    """Get the process-wide async runtime."""
+    return _runtime
@@ -0,0 +1,246 @@
+"""
+Audio Buffer Module - Preallocated int16 capture buffer for the recorder.
+
+The audio callback converts each float32 block straight into a page of a
+preallocated int16 arena (no per-block allocation, half the size of
+float32). The buffer grows a page at a time, and a spare page is reserved
+outside the callback, so the callback never allocates in steady state.
+Saving writes zero-copy views of the filled pages. When recording streams
+to disk, pages that were written out are released and recycled, so memory
+stays flat however long the session runs.
+
+PreRollBuffer is a fixed-size ring filled by a warm stream while idle, so
+the last moments before the hotkey can be prepended to a new recording.
+"""
+
+import threading
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+
+class CaptureBuffer:
+    """
+    Growable int16 arena made of fixed-size pages.
+
+    Single producer (the audio callback) appends with write(); readers may
+    read any frame below `frames` (and not released) concurrently.
+    """
+
+    # Released pages kept for reuse
+    MAX_FREE_PAGES = 2
+
+    # One page holds this much audio
+    PAGE_SECONDS = 60
+
+    def __init__(self, channels: int = 1, sample_rate: int = 16000, page_seconds: Optional[float] = None):
+        """
+        Initialize the buffer with one page allocated.
+
+        Args:
+            channels: Number of audio channels
+            sample_rate: Sample rate (sizes the pages)
+            page_seconds: Audio per page (default: PAGE_SECONDS)
+        """
+        self.channels = channels
+        self._page_seconds = page_seconds or self.PAGE_SECONDS
+        self._lock = threading.Lock()
+        self._pages: List[Optional[np.ndarray]] = []
+        self._free: List[np.ndarray] = []
+        self._frames = 0
+        self._released_pages = 0
+        # Pages allocated inside the callback because no spare page was ready
+        self.callback_allocations = 0
+        self.reset(sample_rate)
+
+    def reset(self, sample_rate: Optional[int] = None) -> None:
+        """
+        Empty the buffer for a new recording (the first page is reused).
+
+        Args:
+            sample_rate: New sample rate, if it changed (resizes the pages)
+        """
+        with self._lock:
+            pool = [page for page in self._pages if page is not None] + self._free
+            if sample_rate is not None:
+                page_frames = max(1, int(sample_rate * self._page_seconds))
+                if not pool or len(pool[0]) != page_frames:
+                    pool = [self._new_page(page_frames)]
+                self.page_frames = page_frames
+            self._pages = pool[:1]
+            self._free = pool[1:1 + self.MAX_FREE_PAGES]
+            self._frames = 0
+            self._released_pages = 0
+            self.callback_allocations = 0
+
+    def _new_page(self, page_frames: Optional[int] = None) -> np.ndarray:
+        return np.empty((page_frames or self.page_frames, self.channels), dtype=np.int16)
+
+    @property
+    def frames(self) -> int:
+        """Number of frames written."""
+        return self._frames
+
+    @property
+    def nbytes(self) -> int:
+        """Allocated bytes (live pages, the spare and recycled pages)."""
+        return sum(page.nbytes for page in self._pages if page is not None) + sum(p.nbytes for p in self._free)
+
+    def reserve(self) -> None:
+        """Make sure a spare page is ready (call from a non-realtime thread)."""
+        needed = self._frames // self.page_frames + 2
+        if len(self._pages) < needed:
+            with self._lock:
+                if len(self._pages) < needed:
+                    self._pages.append(self._free.pop() if self._free else self._new_page())
+
+    def release(self, before_frame: int) -> None:
+        """
+        Release pages that lie entirely before `before_frame` (e.g. already on disk).
+
+        Released pages are recycled as spares; reading them afterwards raises.
+
+        Args:
+            before_frame: Frames below this are no longer needed
+        """
+        with self._lock:
+            last = min(before_frame, self._frames) // self.page_frames
+            for index in range(self._released_pages, last):
+                page = self._pages[index]
+                self._pages[index] = None
+                if page is not None and len(self._free) < self.MAX_FREE_PAGES:
+                    self._free.append(page)
+            self._released_pages = max(self._released_pages, last)
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Append a float32 block (frames x channels), converting to int16 in place.
+
+        int16 blocks (e.g. pre-roll audio) are copied as they are.
+
+        Args:
+            block: Audio block from the stream callback
+        """
+        scale = 1 if block.dtype == np.int16 else 32767
+        written = 0
+        total = len(block)
+        position = self._frames
+        while written < total:
+            page_index, offset = divmod(position, self.page_frames)
+            if page_index >= len(self._pages):
+                # No spare page reserved in time: allocate here (counted for diagnostics)
+                self._pages.append(self._new_page())
+                self.callback_allocations += 1
+            count = min(total - written, self.page_frames - offset)
+            np.multiply(block[written:written + count], scale,
+                        out=self._pages[page_index][offset:offset + count], casting="unsafe")
+            written += count
+            position += count
+        # Publish the frames only after the data is in place
+        self._frames = position
+
+    def views(self, start: int = 0, end: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Yield zero-copy views covering frames [start, end).
+
+        Args:
+            start: First frame
+            end: End frame (default: all written frames)
+        """
+        end = self._frames if end is None else min(end, self._frames)
+        position = start
+        while position < end:
+            page_index, offset = divmod(position, self.page_frames)
+            count = min(end - position, self.page_frames - offset)
+            page = self._pages[page_index]
+            if page is None:
+                raise ValueError(f"Frames from {position} were already released")
+            yield page[offset:offset + count]
+            position += count
+
+    def read(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """
+        Copy frames [start, end) into one contiguous int16 array.
+
+        Args:
+            start: First frame
+            end: End frame (default: all written frames)
+        """
+        parts = list(self.views(start, end))
+        if not parts:
+            return np.zeros((0, self.channels), dtype=np.int16)
+        if len(parts) == 1:
+            return parts[0].copy()
+        return np.concatenate(parts, axis=0)
+
+
+class PreRollBuffer:
+    """
+    Ring of the most recent int16 audio, written from the stream callback while idle.
+
+    Preallocated once; write() and drain_into() never allocate, so both are
+    safe to call from the audio callback.
+    """
+
+    def __init__(self, seconds: float, sample_rate: int, channels: int = 1):
+        """
+        Allocate the ring.
+
+        Args:
+            seconds: Audio to keep
+            sample_rate: Sample rate in Hz
+            channels: Number of channels
+        """
+        self.seconds = seconds
+        self.sample_rate = sample_rate
+        self._ring = np.zeros((max(1, int(seconds * sample_rate)), channels), dtype=np.int16)
+        self._position = 0
+        self._filled = 0
+
+    @property
+    def frames(self) -> int:
+        """Frames currently held (up to the ring size)."""
+        return self._filled
+
+    def clear(self) -> None:
+        """Forget the held audio."""
+        self._position = 0
+        self._filled = 0
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Add a float32 block, overwriting the oldest audio.
+
+        Args:
+            block: Audio block from the stream callback
+        """
+        size = len(self._ring)
+        if len(block) >= size:
+            block = block[-size:]
+        written = 0
+        while written < len(block):
+            count = min(len(block) - written, size - self._position)
+            np.multiply(block[written:written + count], 32767,
+                        out=self._ring[self._position:self._position + count], casting="unsafe")
+            written += count
+            self._position = (self._position + count) % size
+        self._filled = min(size, self._filled + len(block))
+
+    def drain_into(self, buffer: CaptureBuffer) -> int:
+        """
+        Append the held audio (oldest first) to a capture buffer and clear the ring.
+
+        Args:
+            buffer: Buffer of the recording that is starting
+
+        Returns:
+            Number of frames appended
+        """
+        filled = self._filled
+        start = (self._position - filled) % len(self._ring)
+        first = min(filled, len(self._ring) - start)
+        buffer.write(self._ring[start:start + first])
+        if filled > first:
+            buffer.write(self._ring[:filled - first])
+        self.clear()
+        return filled
@@ -0,0 +1,266 @@
+"""
+Audio Handoff Module - In-memory FLAC handoff from recorder to transcriber.
+
+The recorder encodes a finished recording (or speculative segment) to FLAC
+in memory and publishes it under the path it will have on disk. The
+transcriber uploads straight from memory, so the latency-critical path has
+no WAV write and read-back, and lossless FLAC is roughly half the bytes of
+16-bit WAV. The file is written to disk by a background thread, for
+history, playback and the durable job queue.
+
+Code that needs audio by path (transcriber, VAD, cache hashing) asks the
+handoff first and falls back to the file on disk.
+"""
+
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+
+def encode_flac(samples: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode int16 audio as 16-bit FLAC in memory.
+
+    Args:
+        samples: int16 audio (frames x channels)
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        FLAC file content
+    """
+    out = io.BytesIO()
+    sf.write(out, samples, sample_rate, format="FLAC", subtype="PCM_16")
+    return out.getvalue()
+
+
+def encode_flac_blocks(blocks: Iterable[np.ndarray], sample_rate: int, channels: int) -> Tuple[bytes, int]:
+    """
+    Encode int16 audio as 16-bit FLAC in memory, block by block.
+
+    The blocks are written as they come, so a long recording is never
+    concatenated into one extra array before encoding.
+
+    Args:
+        blocks: int16 audio blocks (frames x channels)
+        sample_rate: Sample rate in Hz
+        channels: Channels per frame
+
+    Returns:
+        Tuple (FLAC file content, frames encoded)
+    """
+    out = io.BytesIO()
+    frames = 0
+    with sf.SoundFile(out, "w", samplerate=sample_rate, channels=channels, format="FLAC", subtype="PCM_16") as f:
+        for block in blocks:
+            f.write(block)
+            frames += len(block)
+    return out.getvalue(), frames
+
+
+@dataclass
+class _Entry:
+    """One published recording."""
+    data: bytes
+    duration_seconds: float
+    raw_bytes: int
+    stopped_at: Optional[float]
+    persisted: threading.Event = field(default_factory=threading.Event)
+    uploaded: bool = False
+    discarded: bool = False
+
+
+class AudioHandoff:
+    """
+    Registry of encoded recordings kept in memory while they are transcribed.
+
+    Entries are evicted oldest first beyond MAX_ENTRIES / MAX_BYTES (they
+    are still on disk by then), or dropped with release().
+    """
+
+    MAX_ENTRIES = 8
+    MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._handoffs = 0
+        self._raw_bytes = 0
+        self._encoded_bytes = 0
+        self._gaps_ms: list = []
+
+    def publish(self, path: str, data: bytes, duration_seconds: float, raw_bytes: int = 0,
+                stopped_at: Optional[float] = None) -> None:
+        """
+        Make encoded audio available under `path` and write it to disk in the background.
+
+        Args:
+            path: Path the file will have on disk
+            data: Encoded file content
+            duration_seconds: Audio duration
+            raw_bytes: Size the audio would have as 16-bit WAV (for statistics)
+            stopped_at: time.perf_counter() when recording stopped (measures the stop-to-upload gap)
+        """
+        entry = _Entry(data=data, duration_seconds=duration_seconds, raw_bytes=raw_bytes, stopped_at=stopped_at)
+        key = self._key(path)
+        with self._lock:
+            self._entries[key] = entry
+            self._handoffs += 1
+            self._raw_bytes += raw_bytes
+            self._encoded_bytes += len(data)
+            self._evict()
+        threading.Thread(target=self._persist, args=(path, entry), name="handoff-persist", daemon=True).start()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def _evict(self) -> None:
+        """Drop the oldest entries beyond the limits, once they are on disk (lock held)."""
+        total = sum(len(entry.data) for entry in self._entries.values())
+        count = len(self._entries)
+        for key, entry in list(self._entries.items())[:-1]:
+            if count <= self.MAX_ENTRIES and total <= self.MAX_BYTES:
+                break
+            if entry.persisted.is_set():
+                del self._entries[key]
+                count -= 1
+                total -= len(entry.data)
+
+    @staticmethod
+    def _persist(path: str, entry: _Entry) -> None:
+        """Write the file (atomically: a partial file is never visible under `path`)."""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(entry.data)
+            if entry.discarded:
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[HANDOFF] Could not write {path}: {e}")
+        finally:
+            entry.persisted.set()
+
+    def _get(self, path: str) -> Optional[_Entry]:
+        with self._lock:
+            return self._entries.get(self._key(path))
+
+    def exists(self, path: str) -> bool:
+        """True if the audio is in memory or on disk."""
+        return self._get(path) is not None or Path(path).exists()
+
+    def size(self, path: str) -> int:
+        """File size in bytes."""
+        entry = self._get(path)
+        return len(entry.data) if entry is not None else Path(path).stat().st_size
+
+    def duration(self, path: str) -> Optional[float]:
+        """Audio duration, if the audio is in memory."""
+        entry = self._get(path)
+        return entry.duration_seconds if entry is not None else None
+
+    def stopped_at(self, path: str) -> Optional[float]:
+        """When the recording behind an in-memory file stopped (time.perf_counter()), if known."""
+        entry = self._get(path)
+        return entry.stopped_at if entry is not None else None
+
+    def get_bytes(self, path: str) -> Optional[bytes]:
+        """Encoded content, if the audio is in memory."""
+        entry = self._get(path)
+        return entry.data if entry is not None else None
+
+    def open(self, path: str) -> BinaryIO:
+        """
+        Open the audio for reading, from memory if possible.
+
+        The first open of a published recording counts as the start of its upload.
+
+        Args:
+            path: Audio file path
+
+        Returns:
+            Binary file object (with a `name` attribute)
+        """
+        entry = self._get(path)
+        if entry is None:
+            return open(path, "rb")
+        if not entry.uploaded:
+            entry.uploaded = True
+            if entry.stopped_at is not None:
+                gap_ms = (time.perf_counter() - entry.stopped_at) * 1000
+                with self._lock:
+                    self._gaps_ms = (self._gaps_ms + [gap_ms])[-50:]
+                print(f"[HANDOFF] {Path(path).name}: stop-to-upload {gap_ms:.0f} ms")
+        stream = io.BytesIO(entry.data)
+        stream.name = path
+        return stream
+
+    def read_pcm16(self, path: str) -> Tuple[np.ndarray, int]:
+        """
+        Decode audio to int16 samples.
+
+        Args:
+            path: Audio file path (any format soundfile reads)
+
+        Returns:
+            Tuple (samples as frames x channels, sample rate)
+        """
+        data = self.get_bytes(path)
+        source = io.BytesIO(data) if data is not None else path
+        samples, sample_rate = sf.read(source, dtype="int16", always_2d=True)
+        return samples, sample_rate
+
+    def wait_persisted(self, path: str, timeout: float = 10.0) -> None:
+        """Block until a published file is on disk (for consumers that need a real file)."""
+        entry = self._get(path)
+        if entry is not None:
+            entry.persisted.wait(timeout)
+
+    def release(self, path: str) -> None:
+        """Drop the in-memory copy (the file on disk stays)."""
+        with self._lock:
+            self._entries.pop(self._key(path), None)
+
+    def discard(self, path: str) -> None:
+        """Drop the in-memory copy and make sure the file is not (re)created on disk."""
+        with self._lock:
+            entry = self._entries.pop(self._key(path), None)
+        if entry is not None:
+            entry.discarded = True
+            entry.persisted.wait(10.0)
+
+    def get_stats(self) -> dict:
+        """
+        Get handoff counters.
+
+        Returns:
+            Dict with handoffs, raw (WAV) vs encoded bytes, and stop-to-upload gaps in ms
+        """
+        with self._lock:
+            gaps = list(self._gaps_ms)
+            return {
+                "handoffs": self._handoffs,
+                "in_memory": len(self._entries),
+                "raw_bytes": self._raw_bytes,
+                "encoded_bytes": self._encoded_bytes,
+                "compression_ratio": round(self._encoded_bytes / self._raw_bytes, 3) if self._raw_bytes else None,
+                "last_gap_ms": round(gaps[-1], 1) if gaps else None,
+                "avg_gap_ms": round(sum(gaps) / len(gaps), 1) if gaps else None,
+            }
+
+
+_handoff = AudioHandoff()
+
+
+def get_audio_handoff() -> AudioHandoff:
+    """Get the process-wide audio handoff."""
+    return _handoff
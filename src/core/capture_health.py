@@ -0,0 +1,154 @@
+"""
+Capture Health Module - Counters for the real-time audio callback.
+
+The PortAudio callback must not block, allocate much or print (console
+writes can stall it long enough to cause the overflows they report). It
+only bumps plain counters here; there is a single writer (the audio
+thread) and readers take a snapshot, so no lock is needed. The recorder's
+housekeeping thread logs new problems and each recording keeps the
+snapshot of its capture, so bad transcripts can be matched with input
+overflows, late callbacks or lost audio under CPU load.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class CaptureHealth:
+    """
+    Per-recording capture counters.
+
+    Counts overflows/underflows reported by PortAudio, callback run time,
+    jitter of the callback interval against the block period, and dropped
+    blocks (gaps in the stream's ADC timestamps, where supported).
+    """
+
+    # Raw counters, in the order counters() returns them (published by the capture process)
+    COUNTERS = (
+        "sample_rate", "callbacks", "frames", "overflows", "underflows", "dropped_blocks", "dropped_frames",
+        "callback_total", "callback_max", "jitter_total", "jitter_max", "intervals", "block_frames",
+    )
+
+    def __init__(self):
+        self.reset(16000)
+
+    def reset(self, sample_rate: int) -> None:
+        """
+        Zero the counters for a new recording (call before capture starts).
+
+        Args:
+            sample_rate: Stream sample rate in Hz
+        """
+        self.sample_rate = sample_rate
+        self.callbacks = 0
+        self.frames = 0
+        self.overflows = 0
+        self.underflows = 0
+        self.dropped_blocks = 0
+        self.dropped_frames = 0
+        self.callback_total = 0.0
+        self.callback_max = 0.0
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+        self.intervals = 0
+        self.started_at = time.perf_counter()
+        self._last_start: Optional[float] = None
+        self.block_frames = 0
+        self._last_adc = 0.0
+
+    def begin(self, frames: int, time_info, status) -> float:
+        """
+        Count a callback (first thing in the callback).
+
+        Args:
+            frames: Frames in the block
+            time_info: PortAudio timestamps (inputBufferAdcTime may be 0 if unsupported)
+            status: sd.CallbackFlags
+
+        Returns:
+            Callback start time, to pass to end()
+        """
+        start = time.perf_counter()
+        if status:
+            if getattr(status, "input_overflow", False):
+                self.overflows += 1
+            if getattr(status, "input_underflow", False):
+                self.underflows += 1
+
+        if self._last_start is not None:
+            # Deviation of the interval from the previous block's duration
+            jitter = abs(start - self._last_start - self.block_frames / self.sample_rate)
+            self.jitter_total += jitter
+            if jitter > self.jitter_max:
+                self.jitter_max = jitter
+            self.intervals += 1
+
+        adc = getattr(time_info, "inputBufferAdcTime", 0.0) or 0.0
+        if adc and self._last_adc:
+            # Audio between the end of the last block and the start of this one was lost
+            gap = adc - self._last_adc - self.block_frames / self.sample_rate
+            if gap > 0.5 * self.block_frames / self.sample_rate:
+                self.dropped_blocks += 1
+                self.dropped_frames += int(round(gap * self.sample_rate))
+        self._last_adc = adc
+
+        self._last_start = start
+        self.block_frames = frames
+        self.callbacks += 1
+        self.frames += frames
+        return start
+
+    def end(self, start: float) -> None:
+        """Record the callback run time (last thing in the callback)."""
+        duration = time.perf_counter() - start
+        self.callback_total += duration
+        if duration > self.callback_max:
+            self.callback_max = duration
+
+    def counters(self) -> tuple:
+        """Raw counter values in COUNTERS order."""
+        return tuple(getattr(self, name) for name in self.COUNTERS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the counters (safe to call from any thread while capturing).
+
+        Returns:
+            Dict with callback count, overflows, underflows, dropped blocks and
+            lost seconds, callback duration and interval jitter in ms
+        """
+        return self.summarize(self.counters())
+
+    @classmethod
+    def summarize(cls, counters) -> Dict[str, Any]:
+        """
+        Turn raw counters (from counters(), possibly of another process) into a snapshot.
+
+        Args:
+            counters: Values in COUNTERS order
+
+        Returns:
+            Snapshot dict (see snapshot())
+        """
+        c = dict(zip(cls.COUNTERS, counters))
+        sample_rate = int(c["sample_rate"])
+        callbacks = int(c["callbacks"])
+        intervals = int(c["intervals"])
+        block_ms = c["block_frames"] / sample_rate * 1000 if sample_rate else 0.0
+        callback_max_ms = c["callback_max"] * 1000
+        return {
+            "sample_rate": sample_rate,
+            "callbacks": callbacks,
+            "captured_seconds": round(c["frames"] / sample_rate, 2) if sample_rate else 0.0,
+            "overflows": int(c["overflows"]),
+            "underflows": int(c["underflows"]),
+            "dropped_blocks": int(c["dropped_blocks"]),
+            "dropped_seconds": round(c["dropped_frames"] / sample_rate, 3) if sample_rate else 0.0,
+            "block_ms": round(block_ms, 2),
+            "callback_avg_ms": round(c["callback_total"] / callbacks * 1000, 3) if callbacks else None,
+            "callback_max_ms": round(callback_max_ms, 3) if callbacks else None,
+            # Share of the block period used by the slowest callback (>= 1 means it fell behind)
+            "callback_max_load": round(callback_max_ms / block_ms, 3) if callbacks and block_ms else None,
+            "jitter_avg_ms": round(c["jitter_total"] / intervals * 1000, 3) if intervals else None,
+            "jitter_max_ms": round(c["jitter_max"] * 1000, 3) if intervals else None,
+        }
@@ -0,0 +1,309 @@
+"""
+Capture Process Module - Audio capture in a dedicated subprocess.
+
+In the app process the PortAudio callback shares the GIL with the UI
+bridge, JSON serialization and HTTP uploads; long split jobs can starve
+it into input overflows. With CAPTURE_PROCESS=true the input stream runs
+in a child process instead. Its callback converts each block to int16
+straight into a multiprocessing.shared_memory ring, so the app process
+receives audio without pickling or pipes: the recorder reads numpy views
+of the ring into its capture buffer.
+
+The child's CaptureHealth counters are published in the ring header by
+the callback itself, and counter resets are requested through the header
+too, so the callback stays their only writer. The pipe only carries the
+startup reply and the quit command.
+
+The ring keeps the last RING_FRAMES frames, so it also provides the
+pre-roll: a recording can start reading a little before the hotkey.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from core.capture_health import CaptureHealth
+
+
+class SharedRing:
+    """
+    Single-producer / single-consumer int16 ring over shared memory.
+
+    Layout: an int64 header (total frames written, sample rate, requested
+    and applied health resets), the producer's CaptureHealth counters as
+    float64, then RING_FRAMES x channels int16 samples. Positions are
+    absolute frame counts; the producer publishes the new position only
+    after the data is in place, and the consumer detects when it fell a
+    full ring behind.
+    """
+
+    HEADER_INTS = 8
+    COUNTER_SLOTS = 16
+    HEADER_BYTES = HEADER_INTS * 8 + COUNTER_SLOTS * 8
+
+    # Header slots
+    _POSITION, _SAMPLE_RATE, _RESET_REQUESTED, _RESET_APPLIED = range(4)
+
+    def __init__(self, buffer, frames: int, channels: int):
+        """
+        Map the ring onto a shared memory buffer.
+
+        Args:
+            buffer: SharedMemory.buf of at least size(frames, channels) bytes
+            frames: Ring capacity in frames
+            channels: Channels per frame
+        """
+        self.frames = frames
+        self.channels = channels
+        self._header = np.ndarray((self.HEADER_INTS,), dtype=np.int64, buffer=buffer)
+        self._counters = np.ndarray((self.COUNTER_SLOTS,), dtype=np.float64, buffer=buffer,
+                                    offset=self.HEADER_INTS * 8)
+        self._data = np.ndarray((frames, channels), dtype=np.int16, buffer=buffer, offset=self.HEADER_BYTES)
+
+    @classmethod
+    def size(cls, frames: int, channels: int) -> int:
+        """Bytes of shared memory needed for a ring."""
+        return cls.HEADER_BYTES + frames * channels * 2
+
+    @property
+    def position(self) -> int:
+        """Total frames written since the ring was created."""
+        return int(self._header[self._POSITION])
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the stream writing into the ring (0 until it is open)."""
+        return int(self._header[self._SAMPLE_RATE])
+
+    @sample_rate.setter
+    def sample_rate(self, value: int) -> None:
+        self._header[self._SAMPLE_RATE] = value
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Append a float32 block (frames x channels), converting to int16 in place (producer only).
+
+        Args:
+            block: Audio block from the stream callback
+        """
+        if len(block) > self.frames:
+            block = block[-self.frames:]
+        position = int(self._header[self._POSITION])
+        written = 0
+        while written < len(block):
+            offset = (position + written) % self.frames
+            count = min(len(block) - written, self.frames - offset)
+            np.multiply(block[written:written + count], 32767,
+                        out=self._data[offset:offset + count], casting="unsafe")
+            written += count
+        # Publish the frames only after the data is in place
+        self._header[self._POSITION] = position + written
+
+    def views(self, start: int, end: int) -> Iterator[np.ndarray]:
+        """
+        Yield zero-copy views covering frames [start, end) (consumer only).
+
+        The views are only valid until the producer laps them; check
+        overwritten() after copying.
+        """
+        position = start
+        while position < end:
+            offset = position % self.frames
+            count = min(end - position, self.frames - offset)
+            yield self._data[offset:offset + count]
+            position += count
+
+    def overwritten(self, start: int) -> bool:
+        """True if frames from `start` on may already have been overwritten."""
+        return self.position - start > self.frames
+
+    def request_reset(self) -> None:
+        """Ask the producer to zero its health counters (consumer side)."""
+        self._header[self._RESET_REQUESTED] += 1
+
+    @property
+    def reset_requested(self) -> int:
+        """Number of the last requested reset (read by the producer's callback)."""
+        return int(self._header[self._RESET_REQUESTED])
+
+    def publish_health(self, counters: tuple, reset_applied: int) -> None:
+        """
+        Publish the producer's CaptureHealth counters (producer only).
+
+        Args:
+            counters: CaptureHealth.counters()
+            reset_applied: Number of the last reset the counters include
+        """
+        self._counters[:len(counters)] = counters
+        self._header[self._RESET_APPLIED] = reset_applied
+
+    def read_health(self) -> Optional[dict]:
+        """
+        Get the producer's health snapshot.
+
+        Returns:
+            CaptureHealth snapshot, or None until the producer applied the last requested reset
+        """
+        if self._header[self._RESET_APPLIED] != self._header[self._RESET_REQUESTED]:
+            return None
+        return CaptureHealth.summarize(self._counters[:len(CaptureHealth.COUNTERS)].tolist())
+
+    def release(self) -> None:
+        """Drop the numpy views so the shared memory can be closed."""
+        self._header = None
+        self._counters = None
+        self._data = None
+
+
+def _capture_main(shm_name: str, frames: int, channels: int, sample_rate: int,
+                  device_key: str, device_index: Optional[int], conn) -> None:
+    """
+    Child process: open the input stream and write into the ring until told to quit.
+
+    Args:
+        shm_name: Name of the ring's shared memory block
+        frames: Ring capacity in frames
+        channels: Channels to capture
+        sample_rate: Preferred sample rate
+        device_key: Stable key of the microphone ("" for the system default)
+        device_index: Index of the microphone in the app process (used if the key is not found)
+        conn: Control pipe end
+    """
+    from core.device_registry import get_device_registry
+    from core.recorder import AudioRecorder
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = SharedRing(shm.buf, frames, channels)
+    health = CaptureHealth()
+    reset_applied = [ring.reset_requested]
+
+    def callback(indata, block_frames, time_info, status):
+        # Resets happen here, so the callback stays the only writer of the counters
+        requested = ring.reset_requested
+        if requested != reset_applied[0]:
+            health.reset(health.sample_rate)
+            reset_applied[0] = requested
+        started = health.begin(block_frames, time_info, status)
+        ring.write(indata)
+        health.end(started)
+        ring.publish_health(health.counters(), reset_applied[0])
+
+    try:
+        # Indices can differ from the app process (PortAudio was initialized at another time)
+        if device_key:
+            device = get_device_registry().resolve(device_key)
+            device_index = device.index if device is not None else None
+        stream = AudioRecorder(sample_rate, channels)._open_stream(device_index, callback=callback)
+        rate = int(stream.samplerate)
+        health.reset(rate)
+        ring.sample_rate = rate
+        stream.start()
+    except Exception as e:
+        conn.send(("error", str(e)))
+        ring.release()
+        shm.close()
+        return
+
+    conn.send(("ready", rate))
+    try:
+        while True:
+            try:
+                if conn.recv() == "quit":
+                    break
+            except EOFError:
+                break  # App process is gone
+    finally:
+        stream.stop()
+        stream.close()
+        ring.release()
+        shm.close()
+
+
+class CaptureProcess:
+    """Runs the input stream in a child process and exposes its shared ring."""
+
+    # 30 s at 48 kHz
+    RING_FRAMES = 48000 * 30
+
+    # Seconds to wait for the child to open the stream
+    START_TIMEOUT = 15.0
+
+    def __init__(self, device_index: Optional[int], device_key: str, sample_rate: int, channels: int):
+        """
+        Start the child process and wait until its stream is running.
+
+        Args:
+            device_index: Microphone device index (None for system default)
+            device_key: Stable key of that device ("" for the system default)
+            sample_rate: Preferred sample rate
+            channels: Channels to capture
+
+        Raises:
+            RuntimeError: If the child could not open the stream
+        """
+        self.device_index = device_index
+        self._shm = shared_memory.SharedMemory(create=True, size=SharedRing.size(self.RING_FRAMES, channels))
+        self.ring = SharedRing(self._shm.buf, self.RING_FRAMES, channels)
+
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_capture_main,
+            args=(self._shm.name, self.RING_FRAMES, channels, sample_rate, device_key, device_index, child_conn),
+            name="audio-capture",
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+        reply = self._conn.recv() if self._conn.poll(self.START_TIMEOUT) else ("error", "timed out")
+        if reply[0] != "ready":
+            self.close()
+            raise RuntimeError(f"Capture process failed: {reply[1]}")
+        self.sample_rate = reply[1]
+
+    def is_alive(self) -> bool:
+        """True while the child process is running."""
+        return self._process.is_alive()
+
+    def reset_health(self) -> None:
+        """Start new health counters (applied by the child's next callback)."""
+        self.ring.request_reset()
+
+    def health_snapshot(self) -> Optional[dict]:
+        """CaptureHealth snapshot of the child, or None until it applied the last reset."""
+        return self.ring.read_health()
+
+    def read_range(self, start: int, end: int) -> Tuple[Iterator[np.ndarray], int]:
+        """
+        Clamp [start, end) to the audio still in the ring.
+
+        Args:
+            start: First frame wanted
+            end: End frame (usually ring.position)
+
+        Returns:
+            Tuple (views of the available frames, frames lost because the ring lapped them)
+        """
+        lost = max(0, end - start - self.RING_FRAMES)
+        return self.ring.views(start + lost, end), lost
+
+    def close(self) -> None:
+        """Stop the child process and free the shared memory."""
+        try:
+            self._conn.send("quit")
+        except (EOFError, OSError):
+            pass
+        self._process.join(2.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(1.0)
+        self._conn.close()
+        self.ring.release()
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
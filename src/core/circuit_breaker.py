@@ -0,0 +1,268 @@
+"""
+Circuit Breaker Module - Fail fast while the Groq API is degraded.
+
+- CircuitBreaker: opens after consecutive failures, rejects requests while
+  open, then lets a single half-open probe through to test recovery.
+- AdaptiveTimeout: per-request timeouts derived from observed latency per
+  MB of upload instead of one fixed SDK timeout.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core.telemetry import UploadTelemetry, get_telemetry, percentile
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Classic three-state circuit breaker.
+
+    closed    -> requests pass; `failure_threshold` consecutive failures open it
+    open      -> requests are rejected until `recovery_seconds` have passed
+    half_open -> one probe request passes; success closes, failure re-opens
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_seconds: float = 30.0):
+        """
+        Initialize the breaker (starts closed).
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_seconds: Time the circuit stays open before a probe is allowed
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_seconds = recovery_seconds
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._listeners: List[Callable[[str], None]] = []
+
+        # Statistics
+        self._open_count = 0
+        self._rejected = 0
+        self._last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """Current state (closed, open or half_open)."""
+        with self._lock:
+            return self._state
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Register a callback invoked with the new state on every transition."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _set_state(self, state: str) -> Optional[str]:
+        """Change state (lock held). Returns the new state if it changed."""
+        if state == self._state:
+            return None
+        self._state = state
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            self._open_count += 1
+        return state
+
+    def _notify(self, state: Optional[str]) -> None:
+        """Call listeners outside the lock."""
+        if state is None:
+            return
+        print(f"[CIRCUIT] State changed to {state}")
+        for callback in list(self._listeners):
+            try:
+                callback(state)
+            except Exception as e:
+                print(f"[CIRCUIT] Warning: State listener failed: {e}")
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now.
+
+        In the open state the first caller after the recovery time becomes
+        the half-open probe; everyone else is rejected until it finishes.
+
+        Returns:
+            True if the request may proceed
+        """
+        changed = None
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_seconds:
+                changed = self._set_state(self.HALF_OPEN)
+
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                allowed = True
+            else:
+                self._rejected += 1
+                allowed = False
+
+        self._notify(changed)
+        return allowed
+
+    def record_success(self) -> None:
+        """Record a successful request (closes a half-open circuit)."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            changed = self._set_state(self.CLOSED)
+        self._notify(changed)
+
+    def release(self) -> None:
+        """Finish a request that says nothing about service health (frees the half-open probe)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """Record a failed request (may open the circuit)."""
+        changed = None
+        with self._lock:
+            self._consecutive_failures += 1
+            self._last_error = str(error)[:200] if error is not None else None
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                changed = self._set_state(self.OPEN)
+            elif self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                changed = self._set_state(self.OPEN)
+        self._notify(changed)
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit allows a probe (0 if not open)."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_seconds - (time.monotonic() - self._opened_at))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state and counters for UI/debugging."""
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "recovery_seconds": self.recovery_seconds,
+                "retry_in_seconds": round(retry_in, 1),
+                "open_count": self._open_count,
+                "rejected_requests": self._rejected,
+                "last_error": self._last_error,
+            }
+
+
+class AdaptiveTimeout:
+    """
+    Per-request timeout scaled by upload size.
+
+    Uses the p99 of observed seconds-per-MB (time to response headers,
+    which covers upload and processing) times a safety factor, bounded
+    by `min_timeout` and the configured maximum.
+    """
+
+    MIN_SAMPLES = 10
+    SAMPLE_WINDOW = 100
+    SAFETY_FACTOR = 3.0
+    # Small uploads are dominated by fixed overhead: count them as at least this size
+    MIN_SIZE_MB = 0.25
+
+    def __init__(self, max_timeout: float = 120.0, min_timeout: float = 10.0,
+                 telemetry: Optional[UploadTelemetry] = None):
+        """
+        Initialize adaptive timeouts.
+
+        Args:
+            max_timeout: Upper bound, also used until enough samples exist
+            min_timeout: Lower bound for any request
+            telemetry: Source of observed latencies
+        """
+        self.max_timeout = max_timeout
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.telemetry = telemetry or get_telemetry()
+
+    def _seconds_per_mb(self) -> List[float]:
+        """Observed seconds per MB of recent successful requests."""
+        samples = []
+        for record in self.telemetry.get_records()[-self.SAMPLE_WINDOW:]:
+            if record.success and record.ttfb_seconds and record.file_bytes:
+                size_mb = max(record.file_bytes / (1024 * 1024), self.MIN_SIZE_MB)
+                samples.append(record.ttfb_seconds / size_mb)
+        return samples
+
+    def timeout_for(self, file_bytes: int) -> float:
+        """
+        Get the timeout for an upload of `file_bytes`.
+
+        Returns:
+            Timeout in seconds
+        """
+        samples = self._seconds_per_mb()
+        if len(samples) < self.MIN_SAMPLES:
+            return self.max_timeout
+        size_mb = max(file_bytes / (1024 * 1024), self.MIN_SIZE_MB)
+        timeout = percentile(samples, 99) * size_mb * self.SAFETY_FACTOR
+        return min(self.max_timeout, max(self.min_timeout, timeout))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current latency model for UI/debugging."""
+        samples = self._seconds_per_mb()
+        p99 = percentile(samples, 99)
+        return {
+            "samples": len(samples),
+            "adaptive": len(samples) >= self.MIN_SAMPLES,
+            "p99_seconds_per_mb": round(p99, 3) if p99 is not None else None,
+            "min_timeout_seconds": self.min_timeout,
+            "max_timeout_seconds": self.max_timeout,
+            "timeout_for_1mb_seconds": round(self.timeout_for(1024 * 1024), 1),
+        }
+
+
+_breaker: Optional[CircuitBreaker] = None
+_timeout: Optional[AdaptiveTimeout] = None
+_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker for the Groq API (created from Config on first use).
+
+    Returns:
+        Shared CircuitBreaker instance
+    """
+    global _breaker
+    with _lock:
+        if _breaker is None:
+            from config import Config
+            config = Config()
+            _breaker = CircuitBreaker(
+                failure_threshold=config.get_circuit_failure_threshold(),
+                recovery_seconds=config.get_circuit_recovery_seconds(),
+            )
+        return _breaker
+
+
+def get_adaptive_timeout() -> AdaptiveTimeout:
+    """
+    Get the process-wide adaptive timeout (created from Config on first use).
+
+    Returns:
+        Shared AdaptiveTimeout instance
+    """
+    global _timeout
+    with _lock:
+        if _timeout is None:
+            from config import Config
+            _timeout = AdaptiveTimeout(max_timeout=Config().get_groq_timeout_seconds())
+        return _timeout
@@ -0,0 +1,246 @@
+"""
+Device Registry Module - Cached audio device enumeration.
+
+Enumerating devices (sd.query_devices / query_hostapis) and probing sample
+rates are PortAudio scans. The registry does them once and serves the
+settings page, the recorder and stream setup from the cache. It is
+refreshed when a device disappears (a stream fails to open) or on explicit
+request.
+
+Devices are identified by a stable "host API::name" key. PortAudio indices
+shift whenever a device is plugged in or out, so a saved index is only a hint.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import sounddevice as sd
+
+
+@dataclass(frozen=True)
+class AudioDevice:
+    """
+    One PortAudio input device.
+
+    Attributes:
+        index: PortAudio index (valid until the next rescan)
+        name: Device name
+        hostapi: Host API name (e.g. "Windows WASAPI")
+        max_input_channels: Input channels supported
+        default_samplerate: Native sample rate in Hz
+    """
+    index: int
+    name: str
+    hostapi: str
+    max_input_channels: int
+    default_samplerate: int
+
+    @property
+    def key(self) -> str:
+        """Stable identity across rescans and restarts."""
+        return f"{self.hostapi}::{self.name}"
+
+
+class DeviceRegistry:
+    """Caches input devices and their supported sample rates."""
+
+    # Rates probed per device (on first use)
+    PROBE_RATES = (16000, 22050, 32000, 44100, 48000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._devices: Optional[List[AudioDevice]] = None
+        self._rates: Dict[str, Tuple[int, ...]] = {}
+        self._scans = 0
+        self._cache_hits = 0
+        self._last_scan_ms = 0.0
+
+    def devices(self) -> List[AudioDevice]:
+        """
+        Get input devices (scanned on first use, cached afterwards).
+
+        Returns:
+            Input devices in PortAudio order
+        """
+        with self._lock:
+            if self._devices is not None:
+                self._cache_hits += 1
+                return self._devices
+        return self.refresh()
+
+    def refresh(self, reinitialize: bool = False) -> List[AudioDevice]:
+        """
+        Rescan devices and forget probed sample rates.
+
+        Args:
+            reinitialize: Restart PortAudio first so hot-plugged devices show up.
+                Only safe while no stream is open.
+
+        Returns:
+            Input devices in PortAudio order
+        """
+        start = time.perf_counter()
+        if reinitialize:
+            try:
+                sd._terminate()
+                sd._initialize()
+            except Exception as e:
+                print(f"[DEVICES] Could not restart PortAudio: {e}")
+
+        devices = []
+        try:
+            host_apis = [api['name'] for api in sd.query_hostapis()]
+            for index, device in enumerate(sd.query_devices()):
+                if device['max_input_channels'] <= 0:
+                    continue
+                hostapi = device.get('hostapi', 0)
+                devices.append(AudioDevice(
+                    index=index,
+                    name=device['name'],
+                    hostapi=host_apis[hostapi] if hostapi < len(host_apis) else str(hostapi),
+                    max_input_channels=int(device['max_input_channels']),
+                    default_samplerate=int(device['default_samplerate']),
+                ))
+        except Exception as e:
+            print(f"[DEVICES] Error querying devices: {e}")
+
+        with self._lock:
+            self._devices = devices
+            self._rates.clear()
+            self._scans += 1
+            self._last_scan_ms = (time.perf_counter() - start) * 1000
+        print(f"[DEVICES] Found {len(devices)} input device(s) in {self._last_scan_ms:.0f} ms")
+        return devices
+
+    def by_index(self, index: int) -> Optional[AudioDevice]:
+        """Get a device by its PortAudio index in the cached scan."""
+        for device in self.devices():
+            if device.index == index:
+                return device
+        return None
+
+    def resolve(self, key: str) -> Optional[AudioDevice]:
+        """
+        Find a device by its stable key.
+
+        Falls back to the same name under another host API if the exact
+        key is gone.
+
+        Args:
+            key: AudioDevice.key
+
+        Returns:
+            The device, or None if it is not connected
+        """
+        devices = self.devices()
+        for device in devices:
+            if device.key == key:
+                return device
+        name = key.split("::", 1)[-1]
+        for device in devices:
+            if device.name == name:
+                return device
+        return None
+
+    def default_input(self) -> Optional[AudioDevice]:
+        """Get the system default input device."""
+        try:
+            index = sd.default.device[0]
+        except Exception:
+            return None
+        if index is None or index < 0:
+            return None
+        return self.by_index(int(index))
+
+    def supported_rates(self, device: AudioDevice, channels: int = 1) -> Tuple[int, ...]:
+        """
+        Get the PROBE_RATES the device accepts (probed once per scan).
+
+        Args:
+            device: Device to probe
+            channels: Channels to open with
+
+        Returns:
+            Supported rates (at least the native rate)
+        """
+        cache_key = f"{device.key}#{channels}"
+        with self._lock:
+            if cache_key in self._rates:
+                self._cache_hits += 1
+                return self._rates[cache_key]
+
+        rates = []
+        for rate in self.PROBE_RATES:
+            try:
+                sd.check_input_settings(device=device.index, samplerate=rate, channels=channels, dtype='float32')
+                rates.append(rate)
+            except Exception:
+                pass
+        if device.default_samplerate not in rates:
+            rates.append(device.default_samplerate)
+
+        with self._lock:
+            self._rates[cache_key] = tuple(sorted(rates))
+            return self._rates[cache_key]
+
+    def pick_rate(self, device: Optional[AudioDevice], preferred: int, channels: int = 1) -> int:
+        """
+        Choose the capture rate: the preferred one if supported, else the device's native rate.
+
+        Args:
+            device: Device to open (None if unknown: the preferred rate is tried)
+            preferred: Desired sample rate
+            channels: Channels to open with
+
+        Returns:
+            Sample rate to open the stream with
+        """
+        if device is None or preferred in self.supported_rates(device, channels):
+            return preferred
+        return device.default_samplerate
+
+    def get_stats(self) -> dict:
+        """
+        Get registry counters.
+
+        Returns:
+            Dict with device count, scans, cache hits and the last scan time
+        """
+        with self._lock:
+            return {
+                "devices": len(self._devices) if self._devices is not None else None,
+                "scans": self._scans,
+                "cache_hits": self._cache_hits,
+                "last_scan_ms": round(self._last_scan_ms, 1),
+                "probed_devices": len(self._rates),
+            }
+
+
+_registry = DeviceRegistry()
+
+
+def get_device_registry() -> DeviceRegistry:
+    """Get the process-wide device registry."""
+    return _registry
+
+
+def resolve_input_device(key: str, index: int) -> Optional[int]:
+    """
+    Resolve the saved microphone to a current PortAudio index.
+
+    Args:
+        key: Saved stable device key (INPUT_DEVICE_NAME), may be empty
+        index: Saved index (INPUT_DEVICE), -1 for system default; used when no key is saved
+
+    Returns:
+        Device index, or None for the system default
+    """
+    if key:
+        device = get_device_registry().resolve(key)
+        if device is None:
+            print(f"[DEVICES] Saved microphone '{key}' is not connected, using the default microphone")
+            return None
+        return device.index
+    return None if index == -1 else index
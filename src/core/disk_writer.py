@@ -0,0 +1,170 @@
+"""
+Disk Writer Module - Stream a recording to a WAV file while it is captured.
+
+A background thread drains the recorder's CaptureBuffer into a WAV file in
+temp/ and releases the pages it has written, so memory stays flat for
+multi-hour sessions. The WAV header is patched periodically, so the file
+is always playable/recoverable even if the app crashes mid-recording, and
+stop only has to flush the last fraction of a second.
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import Callable, Optional
+
+from core.audio_buffer import CaptureBuffer
+from core.resampler import PolyphaseResampler
+
+
+class IncrementalWavWriter:
+    """16-bit PCM WAV file that can be appended to and have its header fixed up at any time."""
+
+    HEADER_BYTES = 44
+
+    def __init__(self, path: str, sample_rate: int, channels: int):
+        """
+        Create the file with a header for zero frames.
+
+        Args:
+            path: Output path
+            sample_rate: Sample rate in Hz
+            channels: Number of channels
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.data_bytes = 0
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self) -> None:
+        block_align = self.channels * 2
+        self._file.write(struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + self.data_bytes, b"WAVE",
+            b"fmt ", 16, 1, self.channels, self.sample_rate, self.sample_rate * block_align, block_align, 16,
+            b"data", self.data_bytes,
+        ))
+
+    def write(self, data: memoryview) -> None:
+        """Append raw int16 frames."""
+        self._file.write(data)
+        self.data_bytes += data.nbytes
+
+    def patch_header(self, sync: bool = True) -> None:
+        """
+        Update the RIFF and data sizes to cover everything written so far.
+
+        Args:
+            sync: Also fsync, so the patched file survives a crash
+        """
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", 36 + self.data_bytes))
+        self._file.seek(40)
+        self._file.write(struct.pack("<I", self.data_bytes))
+        self._file.seek(0, os.SEEK_END)
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Patch the header and close the file."""
+        if not self._file.closed:
+            self.patch_header(sync=False)
+            self._file.close()
+
+
+class DiskWriter:
+    """
+    Background thread that drains a CaptureBuffer into an IncrementalWavWriter.
+
+    Pages are released once written, except frames the caller still needs
+    (e.g. the start of the current speculative segment, see `keep_from`).
+    """
+
+    FLUSH_INTERVAL_SECONDS = 0.25
+    HEADER_PATCH_INTERVAL_SECONDS = 2.0
+
+    def __init__(self, buffer: CaptureBuffer, path: str, sample_rate: int, channels: int,
+                 keep_from: Optional[Callable[[], int]] = None, resampler: Optional[PolyphaseResampler] = None):
+        """
+        Open the output file (call start() to begin draining).
+
+        Args:
+            buffer: Capture buffer filled by the audio callback
+            path: Output WAV path
+            sample_rate: Sample rate of the file in Hz
+            channels: Number of channels of the file
+            keep_from: Returns the first frame that must stay in memory
+            resampler: Converts captured audio to the file's format (None if it already matches)
+        """
+        self.buffer = buffer
+        self.path = path
+        self._keep_from = keep_from
+        self._resampler = resampler
+        self._wav = IncrementalWavWriter(path, sample_rate, channels)
+        self._written_frames = 0
+        self._last_patch = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+
+    @property
+    def written_frames(self) -> int:
+        """Frames already on disk."""
+        return self._written_frames
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name="disk-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.FLUSH_INTERVAL_SECONDS):
+            try:
+                self._flush()
+            except Exception as e:
+                # Keep capturing in memory; close() reports the error
+                print(f"Disk writer error: {e}")
+                self._error = e
+                return
+
+    def _flush(self) -> None:
+        """Write newly captured frames (resampled if needed), release written pages, patch the header now and then."""
+        end = self.buffer.frames
+        if end > self._written_frames:
+            for view in self.buffer.views(self._written_frames, end):
+                if self._resampler is not None:
+                    view = self._resampler.process(view)
+                self._wav.write(view.data)
+            self._written_frames = end
+
+        keep = self._written_frames
+        if self._keep_from is not None:
+            keep = min(keep, self._keep_from())
+        self.buffer.release(keep)
+
+        if time.monotonic() - self._last_patch >= self.HEADER_PATCH_INTERVAL_SECONDS:
+            self._wav.patch_header()
+            self._last_patch = time.monotonic()
+
+    def close(self) -> str:
+        """
+        Stop the thread, write the remaining frames and finalize the header.
+
+        Returns:
+            Path of the finished WAV file
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            raise self._error
+        self._flush()
+        if self._resampler is not None:
+            self._wav.write(self._resampler.flush().data)
+        self._wav.close()
+        return self.path
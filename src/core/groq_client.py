@@ -0,0 +1,273 @@
+"""
+Groq Client Module - Process-wide registry for the Groq HTTP client.
+
+One long-lived client (and connection pool) is shared by every
+transcriber instance, so parallel chunk uploads reuse warm keep-alive
+connections instead of paying a TLS handshake per request. The async
+client is used only from the app's event loop thread (see async_runtime).
+"""
+
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+import sys
+
+import httpx
+from groq import AsyncGroq, Groq
+
+# Add parent directory for config import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import Config
+from core.async_runtime import get_runtime
+from core.telemetry import async_httpx_event_hooks, httpx_event_hooks
+
+
+def is_http2_available() -> bool:
+    """
+    Check if HTTP/2 support (the optional `h2` package) is installed.
+
+    Returns:
+        True if httpx can negotiate HTTP/2, False otherwise.
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+class GroqClientRegistry:
+    """
+    Holds the shared Groq clients (sync and async), one pair per API key.
+
+    Clients are cached by key fingerprint and the key is resolved on every
+    lookup, so a new key saved through Config.save_api_key (which updates
+    os.environ) takes effect on the next request without restarting the
+    app, and callers passing their own key do not rebuild the clients of
+    the configured one. The least recently used client is closed when more
+    than MAX_KEYS keys are in use.
+    """
+
+    # Clients kept per kind (sync / async)
+    MAX_KEYS = 4
+
+    def __init__(self):
+        """Initialize an empty registry (clients are built on first use)."""
+        self._lock = threading.Lock()
+        self._config: Optional[Config] = None
+        self._clients: "OrderedDict[str, Groq]" = OrderedDict()
+        self._async_clients: "OrderedDict[str, AsyncGroq]" = OrderedDict()
+        self._build_count = 0
+
+    @staticmethod
+    def _fingerprint(api_key: str) -> str:
+        """Hash the API key so the raw key is never kept for comparison."""
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def _resolve_key(self, api_key: Optional[str]) -> str:
+        """
+        Get the API key to use (lock held).
+
+        Raises:
+            ValueError: If no API key is configured
+        """
+        if self._config is None:
+            self._config = Config()
+        if api_key is None:
+            api_key = self._config.get_api_key()
+
+        if not api_key:
+            raise ValueError(
+                "Groq API key not found. Please set GROQ_API_KEY in .env file "
+                "or pass api_key parameter."
+            )
+
+        return api_key
+
+    def _lookup(self, clients: OrderedDict, api_key: str, build, close) -> object:
+        """
+        Get the client for a key from a cache, building it and evicting the oldest if needed (lock held).
+
+        Args:
+            clients: Cache of fingerprint -> client
+            api_key: Groq API key
+            build: Builds a client for (api_key, config)
+            close: Closes an evicted client
+
+        Returns:
+            Cached or new client
+        """
+        fingerprint = self._fingerprint(api_key)
+        client = clients.get(fingerprint)
+        if client is not None:
+            clients.move_to_end(fingerprint)
+            return client
+
+        client = clients[fingerprint] = build(api_key, self._config)
+        while len(clients) > self.MAX_KEYS:
+            _, evicted = clients.popitem(last=False)
+            close(evicted)
+        return client
+
+    @staticmethod
+    def _close(client: Groq) -> None:
+        """Close a sync client's connection pool."""
+        try:
+            client.close()
+        except Exception as e:
+            print(f"[CLIENT] Warning: Could not close Groq client: {e}")
+
+    @staticmethod
+    def _close_async(client: AsyncGroq) -> None:
+        """Close an async client's connection pool on the event loop that uses it."""
+        get_runtime().submit(client.close())
+
+    def get(self, api_key: Optional[str] = None) -> Groq:
+        """
+        Get the shared client, building it if needed.
+
+        Args:
+            api_key: Groq API key (if None, loads from Config)
+
+        Returns:
+            Shared Groq client
+
+        Raises:
+            ValueError: If no API key is configured
+        """
+        with self._lock:
+            api_key = self._resolve_key(api_key)
+            return self._lookup(self._clients, api_key, self._build, self._close)
+
+    def get_async(self, api_key: Optional[str] = None) -> AsyncGroq:
+        """
+        Get the shared async client, building it if needed.
+
+        Must be called from the event loop thread that will use the client.
+
+        Args:
+            api_key: Groq API key (if None, loads from Config)
+
+        Returns:
+            Shared AsyncGroq client
+
+        Raises:
+            ValueError: If no API key is configured
+        """
+        with self._lock:
+            api_key = self._resolve_key(api_key)
+            return self._lookup(self._async_clients, api_key, self._build_async, self._close_async)
+
+    @staticmethod
+    def _pool_settings(config: Config) -> dict:
+        """Connection pool, HTTP/2 and timeout settings shared by both clients."""
+        pool_size = config.get_groq_pool_size()
+        return {
+            "limits": httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=config.get_groq_keepalive_seconds(),
+            ),
+            "http2": config.groq_http2_enabled() and is_http2_available(),
+            "timeout": httpx.Timeout(config.get_groq_timeout_seconds(), connect=10.0),
+        }
+
+    def _build(self, api_key: str, config: Config) -> Groq:
+        """
+        Build a Groq client with a tuned connection pool.
+
+        Args:
+            api_key: Groq API key
+            config: Config with pool/timeout settings
+
+        Returns:
+            New Groq client
+        """
+        settings = self._pool_settings(config)
+        http_client = httpx.Client(
+            **settings,
+            # Time-to-first-byte and HTTP status for upload telemetry
+            event_hooks=httpx_event_hooks(),
+        )
+
+        self._build_count += 1
+        print(f"[CLIENT] Groq client ready (pool: {settings['limits'].max_connections}, "
+              f"http2: {settings['http2']}, timeout: {settings['timeout'].read}s)")
+
+        # SDK retries disabled: retries and 429 handling go through our scheduler
+        return Groq(api_key=api_key, http_client=http_client, timeout=settings["timeout"], max_retries=0)
+
+    def _build_async(self, api_key: str, config: Config) -> AsyncGroq:
+        """
+        Build an AsyncGroq client with the same pool settings.
+
+        Args:
+            api_key: Groq API key
+            config: Config with pool/timeout settings
+
+        Returns:
+            New AsyncGroq client
+        """
+        settings = self._pool_settings(config)
+        http_client = httpx.AsyncClient(
+            **settings,
+            event_hooks=async_httpx_event_hooks(),
+        )
+
+        self._build_count += 1
+        print(f"[CLIENT] Async Groq client ready (pool: {settings['limits'].max_connections}, "
+              f"http2: {settings['http2']})")
+        return AsyncGroq(api_key=api_key, http_client=http_client, timeout=settings["timeout"], max_retries=0)
+
+    def reset(self) -> None:
+        """Close the shared clients so the next lookup builds fresh ones."""
+        with self._lock:
+            for client in self._clients.values():
+                self._close(client)
+            for client in self._async_clients.values():
+                self._close_async(client)
+            self._clients.clear()
+            self._async_clients.clear()
+
+    def get_stats(self) -> dict:
+        """Get registry state for debugging."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "async_clients": len(self._async_clients),
+                "build_count": self._build_count,
+                "http2_available": is_http2_available(),
+            }
+
+
+_registry = GroqClientRegistry()
+
+
+def get_groq_client(api_key: Optional[str] = None) -> Groq:
+    """
+    Get the process-wide Groq client.
+
+    Args:
+        api_key: Groq API key (if None, loads from Config)
+
+    Returns:
+        Shared Groq client
+    """
+    return _registry.get(api_key)
+
+
+def get_async_groq_client(api_key: Optional[str] = None) -> AsyncGroq:
+    """
+    Get the process-wide AsyncGroq client (use from the event loop thread only).
+
+    Args:
+        api_key: Groq API key (if None, loads from Config)
+
+    Returns:
+        Shared AsyncGroq client
+    """
+    return _registry.get_async(api_key)
+
+
+def get_client_registry() -> GroqClientRegistry:
+    """Get the process-wide client registry."""
+    return _registry
@@ -0,0 +1,246 @@
+"""
+Hedging Module - Hedged requests for latency-sensitive transcriptions.
+
+If a short dictation has not been answered by an adaptive deadline (the
+recent p95 latency of small requests), a duplicate request is sent and
+whichever answers first wins; on the event loop the loser is cancelled.
+Hedges are capped per minute and must fit in the shared rate-limit
+budget, so they never cause 429 errors.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from core.rate_limiter import RequestScheduler, TokenBucket, get_scheduler
+from core.telemetry import UploadTelemetry, get_telemetry, percentile
+
+
+class HedgePolicy:
+    """
+    Decides when to hedge and runs the primary/hedge race.
+
+    The deadline adapts to observed latency: it is the p95 of recent
+    successful small requests, so only the slowest ~5% of requests get
+    a duplicate.
+    """
+
+    # Deadline used until enough requests have been observed
+    DEFAULT_DEADLINE_SECONDS = 2.0
+    MIN_DEADLINE_SECONDS = 0.25
+    MAX_DEADLINE_SECONDS = 10.0
+    # Samples needed before the p95 deadline is trusted
+    MIN_SAMPLES = 10
+    # Recent records considered for the deadline
+    SAMPLE_WINDOW = 100
+    DEADLINE_PERCENTILE = 95
+
+    def __init__(self, enabled: bool = False, max_bytes: int = 1024 * 1024, max_per_minute: int = 4,
+                 scheduler: Optional[RequestScheduler] = None, telemetry: Optional[UploadTelemetry] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            enabled: Whether hedging is used at all
+            max_bytes: Largest upload that may be hedged
+            max_per_minute: Hedge budget (duplicate requests per minute)
+            scheduler: Rate-limit scheduler hedges must get budget from
+            telemetry: Telemetry used to compute the adaptive deadline
+        """
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.max_per_minute = max_per_minute
+        self.scheduler = scheduler or get_scheduler()
+        self.telemetry = telemetry or get_telemetry()
+
+        self._lock = threading.Lock()
+        self._budget = TokenBucket(max_per_minute, max_per_minute / 60.0)
+        # Primary and hedge each need a thread; losers may keep running a while
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+        # Statistics
+        self._requests = 0
+        self._hedges_sent = 0
+        self._hedge_wins = 0
+        self._skipped_budget = 0
+
+    def applies_to(self, file_bytes: int) -> bool:
+        """True if a request of this size may be hedged."""
+        return self.enabled and self.max_per_minute > 0 and file_bytes <= self.max_bytes
+
+    def deadline(self) -> float:
+        """
+        Get the current hedge deadline in seconds.
+
+        Returns:
+            p95 latency of recent successful small requests, or the default
+        """
+        latencies = [
+            r.latency_seconds for r in self.telemetry.get_records()
+            if r.success and r.retries == 0 and 0 < r.file_bytes <= self.max_bytes
+        ][-self.SAMPLE_WINDOW:]
+        if len(latencies) < self.MIN_SAMPLES:
+            return self.DEFAULT_DEADLINE_SECONDS
+        p95 = percentile(latencies, self.DEADLINE_PERCENTILE)
+        return min(self.MAX_DEADLINE_SECONDS, max(self.MIN_DEADLINE_SECONDS, p95))
+
+    def _try_take_budget(self, audio_seconds: float) -> bool:
+        """Take one hedge token and rate-limit budget, without waiting."""
+        with self._lock:
+            if self._budget.wait_time(1) > 0:
+                self._skipped_budget += 1
+                return False
+            if not self.scheduler.try_acquire(audio_seconds):
+                self._skipped_budget += 1
+                return False
+            self._budget.consume(1)
+            self._hedges_sent += 1
+            return True
+
+    def _submit(self, fn: Callable[[], Any]) -> Future:
+        """Run fn on the pool in a copy of the caller's context (keeps the telemetry trace)."""
+        return self._executor.submit(contextvars.copy_context().run, fn)
+
+    def run(self, primary: Callable[[], Any], hedge: Callable[[], Any], audio_seconds: float = 0.0,
+            on_hedge: Optional[Callable[[], None]] = None) -> Any:
+        """
+        Run the primary request, hedging it if it misses the deadline.
+
+        Both callables must return a result or None and must not raise.
+        The first non-empty result wins; the loser is abandoned (a blocking
+        HTTP call cannot be interrupted, its response is simply discarded).
+
+        Args:
+            primary: Request with its own retry handling
+            hedge: Single duplicate attempt (budget already taken)
+            audio_seconds: Audio duration, charged to the rate-limit budget for the hedge
+            on_hedge: Called when the hedge is sent
+
+        Returns:
+            The winning result, or None if both failed
+        """
+        with self._lock:
+            self._requests += 1
+
+        deadline = self.deadline()
+        primary_future = self._submit(primary)
+        done, _ = wait([primary_future], timeout=deadline)
+        if done:
+            return primary_future.result()
+
+        if not self._try_take_budget(audio_seconds):
+            print(f"[HEDGE] No budget for hedge after {deadline:.2f}s, waiting for primary")
+            return primary_future.result()
+
+        print(f"[HEDGE] No response after {deadline:.2f}s, sending hedge request")
+        if on_hedge is not None:
+            on_hedge()
+        hedge_future = self._submit(hedge)
+
+        pending = {primary_future, hedge_future}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result:
+                    if future is hedge_future:
+                        with self._lock:
+                            self._hedge_wins += 1
+                        print("[HEDGE] Hedge request won")
+                    for loser in pending:
+                        loser.cancel()
+                    return result
+        return None
+
+    async def run_async(self, primary: Callable[[], Awaitable[Any]], hedge: Callable[[], Awaitable[Any]],
+                        audio_seconds: float = 0.0, on_hedge: Optional[Callable[[], None]] = None) -> Any:
+        """
+        Coroutine version of run(); the losing request is cancelled.
+
+        Args:
+            primary: Coroutine function for the request with its own retry handling
+            hedge: Coroutine function for a single duplicate attempt
+            audio_seconds: Audio duration, charged to the rate-limit budget for the hedge
+            on_hedge: Called when the hedge is sent
+
+        Returns:
+            The winning result, or None if both failed
+        """
+        with self._lock:
+            self._requests += 1
+
+        deadline = self.deadline()
+        primary_task = asyncio.ensure_future(primary())
+        pending = {primary_task}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=deadline)
+            if done:
+                return primary_task.result()
+
+            if not self._try_take_budget(audio_seconds):
+                print(f"[HEDGE] No budget for hedge after {deadline:.2f}s, waiting for primary")
+                pending = set()
+                return await primary_task
+
+            print(f"[HEDGE] No response after {deadline:.2f}s, sending hedge request")
+            if on_hedge is not None:
+                on_hedge()
+            hedge_task = asyncio.ensure_future(hedge())
+            pending = {primary_task, hedge_task}
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result:
+                        if task is hedge_task:
+                            with self._lock:
+                                self._hedge_wins += 1
+                            print("[HEDGE] Hedge request won")
+                        return result
+            return None
+        finally:
+            # Cancel the loser (or everything if we were cancelled ourselves)
+            for task in pending:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedging counters and the current deadline."""
+        with self._lock:
+            stats = {
+                "enabled": self.enabled,
+                "max_per_minute": self.max_per_minute,
+                "requests": self._requests,
+                "hedges_sent": self._hedges_sent,
+                "hedge_wins": self._hedge_wins,
+                "skipped_budget": self._skipped_budget,
+                "hedge_rate": round(self._hedges_sent / self._requests, 3) if self._requests else 0.0,
+            }
+        stats["deadline_seconds"] = round(self.deadline(), 3)
+        return stats
+
+
+_policy: Optional[HedgePolicy] = None
+_policy_lock = threading.Lock()
+
+
+def get_hedge_policy() -> HedgePolicy:
+    """
+    Get the process-wide hedge policy (created from Config on first use).
+
+    Returns:
+        Shared HedgePolicy instance
+    """
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            from config import Config
+            config = Config()
+            _policy = HedgePolicy(
+                enabled=config.hedging_enabled(),
+                max_bytes=int(config.get_hedge_max_mb() * 1024 * 1024),
+                max_per_minute=config.get_hedge_max_per_minute(),
+            )
+        return _policy
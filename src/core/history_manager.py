@@ -28,22 +28,25 @@ class HistoryManager:
         self._recordings: dict[str, Recording] = {}
         self._recording_counter = 0  # Counter for unique recording IDs
 
-    def add_recording(self, filepath: str, source: SourceType = SourceType.RECORDING) -> str:
+    def add_recording(self, filepath: str, source: SourceType = SourceType.RECORDING,
+                      recording_id: str | None = None, capture_stats: dict | None = None) -> str:
         """
         Add a recording to history.
 
         Args:
             filepath: Path to the audio file.
             source: Whether this is from recording or file upload.
+            recording_id: Existing ID to reuse (e.g. a job resumed from a previous run).
+            capture_stats: Audio callback health of the recording, if recorded from the mic.
 
         Returns:
             The recording ID (timestamp with counter).
         """
-        # Use timestamp + counter to ensure unique IDs even for rapid additions
-        import time
-        timestamp_ms = int(time.time() * 1000)
-        recording_id = f"{timestamp_ms}_{self._recording_counter}"
-        self._recording_counter += 1
+        if recording_id is None:
+            # Use timestamp + counter to ensure unique IDs even for rapid additions
+            timestamp_ms = int(time.time() * 1000)
+            recording_id = f"{timestamp_ms}_{self._recording_counter}"
+            self._recording_counter += 1
 
         recording = Recording(
             id=recording_id,
@@ -51,7 +54,8 @@ class HistoryManager:
             created_at=datetime.now(),
             transcribed=False,
             transcript=None,
-            source=source
+            source=source,
+            capture_stats=capture_stats
         )
         self._recordings[recording_id] = recording
         return recording_id
@@ -81,17 +85,52 @@ class HistoryManager:
         """
         return self._recordings.get(recording_id)
 
-    def update_transcript(self, recording_id: str, text: str) -> None:
+    def update_transcript(self, recording_id: str, text: str, segments: list[dict] | None = None) -> None:
         """
         Update the transcript for a recording.
 
         Args:
             recording_id: The recording ID.
             text: The transcribed text.
+            segments: Optional timestamped segments (kept if None is passed).
         """
         if recording_id in self._recordings:
             self._recordings[recording_id].transcribed = True
             self._recordings[recording_id].transcript = text
+            if segments is not None:
+                self._recordings[recording_id].segments = segments
+
+    def edit_transcript(self, recording_id: str, text: str) -> None:
+        """
+        Replace a transcript with user-edited text.
+
+        Segment timings no longer match edited text, so they are dropped.
+
+        Args:
+            recording_id: The recording ID.
+            text: The edited text.
+        """
+        if recording_id in self._recordings:
+            self.update_transcript(recording_id, text)
+            self._recordings[recording_id].segments = None
+
+    def get_split_chunks(self, parent_recording_id: str, recording_ids: list[str] | None = None) -> list[Recording]:
+        """
+        Get the chunks of a split job, ordered by part number.
+
+        Args:
+            parent_recording_id: ID of the split job.
+            recording_ids: Optional subset of chunk IDs to include.
+
+        Returns:
+            List of chunk recordings sorted by chunk_part.
+        """
+        chunks = [
+            r for r in self._recordings.values()
+            if r.parent_recording_id == parent_recording_id
+            and (recording_ids is None or r.id in recording_ids)
+        ]
+        return sorted(chunks, key=lambda r: r.chunk_part or 0)
 
     def delete_recording(self, recording_id: str) -> bool:
         """
@@ -0,0 +1,393 @@
+"""
+Job Queue Module - Durable transcription jobs that survive restarts and offline periods.
+
+Every recording, file and split chunk is journaled in a SQLite database
+before it is transcribed. Live workflows run their own jobs right away;
+a JobDrainer on the event loop picks up whatever is left over: jobs from
+a previous run (app exit or crash) and jobs deferred while offline.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.transcription_backend import TranscriptionResult
+
+
+@dataclass
+class Job:
+    """
+    A journaled transcription job.
+
+    Attributes:
+        id: Row ID in the queue.
+        kind: recording, file or chunk.
+        recording_id: History entry the result belongs to.
+        filepath: Audio file to transcribe.
+        params: Language, translate flag and chunk metadata.
+        status: pending, running, done or failed.
+        attempts: Failed attempts so far (offline waits are not counted).
+        next_attempt_at: Unix time before which a pending job is not run.
+        error: Last error message.
+    """
+    id: int
+    kind: str
+    recording_id: str
+    filepath: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    status: str = "pending"
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    error: Optional[str] = None
+
+
+class JobQueue:
+    """
+    SQLite-backed job journal.
+
+    Jobs are claimed atomically (pending -> running). On startup recover()
+    puts jobs that were running when the process died back to pending, so
+    work resumes exactly where it stopped.
+    """
+
+    KIND_RECORDING = "recording"
+    KIND_FILE = "file"
+    KIND_CHUNK = "chunk"
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    # Dictations first, then single files, then split chunks
+    PRIORITY = {KIND_RECORDING: 0, KIND_FILE: 1, KIND_CHUNK: 2}
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            recording_id TEXT NOT NULL,
+            filepath TEXT NOT NULL,
+            params TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, priority, id);
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the queue database.
+
+        Args:
+            db_path: Path of the SQLite file (parent directory is created)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        # WAL: commits are durable without a full fsync of the database each time
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            kind=row["kind"],
+            recording_id=row["recording_id"],
+            filepath=row["filepath"],
+            params=json.loads(row["params"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            next_attempt_at=row["next_attempt_at"],
+            error=row["error"],
+        )
+
+    def enqueue(self, kind: str, recording_id: str, filepath: str, params: Optional[Dict[str, Any]] = None,
+                claimed: bool = False) -> int:
+        """
+        Journal a new job.
+
+        Args:
+            kind: KIND_RECORDING, KIND_FILE or KIND_CHUNK
+            recording_id: History entry the result belongs to
+            filepath: Audio file to transcribe
+            params: JSON-serializable job parameters
+            claimed: True if the caller runs the job itself right away
+                (stored as running, so the drainer leaves it alone)
+
+        Returns:
+            Job ID
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, priority, recording_id, filepath, params, status, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, self.PRIORITY.get(kind, 9), recording_id, str(filepath), json.dumps(params or {}),
+                 self.RUNNING if claimed else self.PENDING, now, now),
+            )
+            return cursor.lastrowid
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """Get a job by ID."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def claim_next(self) -> Optional[Job]:
+        """
+        Claim the most urgent pending job that is due.
+
+        Returns:
+            The claimed job (now running), or None if nothing is due
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ("
+                " SELECT id FROM jobs WHERE status = ? AND next_attempt_at <= ? ORDER BY priority, id LIMIT 1"
+                ") RETURNING *",
+                (self.RUNNING, now, self.PENDING, now),
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def complete(self, job_id: int, result: TranscriptionResult) -> None:
+        """Mark a job done and store its result."""
+        payload = json.dumps({"text": result.text, "segments": result.segments}, ensure_ascii=False)
+        self._update(job_id, status=self.DONE, result=payload, error=None)
+
+    def defer(self, job_id: int, delay_seconds: float, error: Optional[str] = None,
+              count_attempt: bool = True) -> None:
+        """
+        Put a job back to pending, to be retried after `delay_seconds`.
+
+        Args:
+            job_id: Job to defer
+            delay_seconds: Earliest retry, from now
+            error: Reason for the retry
+            count_attempt: False for offline waits (they do not use up attempts)
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, next_attempt_at = ?, error = ?, attempts = attempts + ?,"
+                " updated_at = ? WHERE id = ?",
+                (self.PENDING, time.time() + delay_seconds, error, 1 if count_attempt else 0, time.time(), job_id),
+            )
+
+    def fail(self, job_id: int, error: Optional[str] = None) -> None:
+        """Mark a job as permanently failed."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (self.FAILED, error, time.time(), job_id),
+            )
+
+    def _update(self, job_id: int, **columns: Any) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ?",
+                (*columns.values(), time.time(), job_id),
+            )
+
+    def recover(self) -> int:
+        """
+        Return jobs left running by a previous process to pending (call once at startup).
+
+        Returns:
+            Number of recovered jobs
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, next_attempt_at = 0, updated_at = ? WHERE status = ?",
+                (self.PENDING, time.time(), self.RUNNING),
+            )
+            return cursor.rowcount
+
+    def unfinished(self) -> List[Job]:
+        """Get pending and running jobs, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY id", (self.PENDING, self.RUNNING)
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next pending job is due (None if there are none)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM jobs WHERE status = ?", (self.PENDING,)
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def purge(self, older_than_seconds: float = 7 * 24 * 3600) -> int:
+        """
+        Delete finished jobs older than the given age.
+
+        Returns:
+            Number of deleted jobs
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (self.DONE, self.FAILED, time.time() - older_than_seconds),
+            )
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts per status for UI/debugging."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (self.PENDING, self.RUNNING, self.DONE, self.FAILED)}
+        counts.update({row[0]: row[1] for row in rows})
+        counts["next_due_in_seconds"] = self.next_due_in()
+        return counts
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+
+class JobDrainer:
+    """
+    Runs queued jobs on the event loop.
+
+    Workers claim pending jobs that are due. A failed job is retried with
+    exponential backoff up to `max_attempts`; while the service is offline
+    the job just waits (without using up attempts) until it comes back.
+    """
+
+    # Check for due jobs at least this often even without wake()
+    IDLE_POLL_SECONDS = 30.0
+
+    def __init__(self, queue: JobQueue, execute: Callable[[Job], Awaitable[Optional[TranscriptionResult]]],
+                 on_done: Callable[[Job, Optional[TranscriptionResult]], None],
+                 is_offline: Callable[[], bool], workers: int = 1, max_attempts: int = 5,
+                 retry_seconds: float = 30.0):
+        """
+        Initialize the drainer.
+
+        Args:
+            queue: Job journal
+            execute: Coroutine function that transcribes a job (None on failure)
+            on_done: Called when a drained job finishes (result None = failed for good)
+            is_offline: True while the transcription service is unreachable
+            workers: Jobs drained in parallel
+            max_attempts: Failed attempts before a job is given up
+            retry_seconds: Base retry delay (doubles per attempt) and offline wait
+        """
+        self.queue = queue
+        self._execute = execute
+        self._on_done = on_done
+        self._is_offline = is_offline
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_seconds = retry_seconds
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def run(self) -> None:
+        """Drain the queue forever (run on the event loop)."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        await asyncio.gather(*(self._worker() for _ in range(self.workers)))
+
+    def wake(self) -> None:
+        """Check for due jobs now (thread-safe), e.g. when connectivity returns."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _worker(self) -> None:
+        while True:
+            job = self.queue.claim_next()
+            if job is None:
+                due_in = self.queue.next_due_in()
+                timeout = self.IDLE_POLL_SECONDS if due_in is None else min(max(due_in, 0.1), self.IDLE_POLL_SECONDS)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            print(f"[QUEUE] Running {job.kind} job {job.id} (attempt {job.attempts + 1})")
+            result = await self.execute(job)
+            status = self.queue.get(job.id).status
+            if status == JobQueue.DONE:
+                self._on_done(job, result)
+            elif status == JobQueue.FAILED:
+                self._on_done(job, None)
+
+    async def execute(self, job: Job) -> Optional[TranscriptionResult]:
+        """
+        Run one claimed job and record the outcome in the queue.
+
+        Live workflows call this for the jobs they enqueued themselves.
+
+        Returns:
+            TranscriptionResult, or None if the job failed (it is then either
+            pending for a retry or failed for good)
+        """
+        error = None
+        try:
+            result = await self._execute(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = None
+            error = f"{type(e).__name__}: {e}"
+
+        if result is not None:
+            self.queue.complete(job.id, result)
+            return result
+
+        if await asyncio.to_thread(self._is_offline):
+            print(f"[QUEUE] Offline, job {job.id} will be retried in {self.retry_seconds:.0f}s")
+            self.queue.defer(job.id, self.retry_seconds, error or "offline", count_attempt=False)
+        elif job.attempts + 1 < self.max_attempts:
+            delay = self.retry_seconds * (2 ** job.attempts)
+            print(f"[QUEUE] Job {job.id} failed, retrying in {delay:.0f}s")
+            self.queue.defer(job.id, delay, error or "transcription failed")
+        else:
+            print(f"[QUEUE] Job {job.id} failed after {job.attempts + 1} attempts")
+            self.queue.fail(job.id, error or "transcription failed")
+        self.wake()
+        return None
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Get the process-wide job queue (data/jobs.db in the project root).
+
+    Returns:
+        Shared JobQueue instance
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            project_root = Path(__file__).parent.parent.parent
+            _queue = JobQueue(str(project_root / "data" / "jobs.db"))
+        return _queue
@@ -0,0 +1,150 @@
+"""
+Local Transcriber Module - Offline CPU speech-to-text.
+
+Uses faster-whisper (CTranslate2) with int8 quantized Whisper models, so
+transcription keeps working without network access or API quota on a
+plain CPU-only machine.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from core.audio_handoff import get_audio_handoff
+from core.transcription_backend import TranscriptionBackend, TranscriptionResult
+from core.transcript_cache import get_transcript_cache
+
+
+class LocalWhisperTranscriber(TranscriptionBackend):
+    """
+    Transcribes audio files on the local CPU with faster-whisper.
+
+    Features:
+    - int8 quantized models (no GPU needed)
+    - Parallel transcription: `workers` files at once, CPU threads split between them
+    - Translation to English (task="translate")
+    - Segment timestamps
+    - Shares the transcript cache with the Groq backend
+    """
+
+    NAME = "local"
+
+    # Beam size for decoding (5 matches the reference Whisper default)
+    BEAM_SIZE = 5
+
+    def __init__(self, model_size: str = "small", compute_type: str = "int8", workers: int = 2):
+        """
+        Load the local Whisper model.
+
+        Args:
+            model_size: faster-whisper model name or path (tiny, base, small, medium, large-v3...)
+            compute_type: CTranslate2 compute type (int8 recommended on CPU)
+            workers: Number of files transcribed in parallel
+
+        Raises:
+            ValueError: If faster-whisper is not installed or the model cannot be loaded
+        """
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            raise ValueError(
+                "Local transcription requires faster-whisper. "
+                "Install it with: pip install faster-whisper"
+            )
+
+        self.model_size = model_size
+        self.workers = max(1, workers)
+        # Split CPU cores between parallel workers
+        cpu_threads = max(1, (os.cpu_count() or 1) // self.workers)
+
+        print(f"[LOCAL] Loading Whisper model '{model_size}' ({compute_type}, "
+              f"{self.workers} workers x {cpu_threads} threads)...")
+        try:
+            self._model = WhisperModel(
+                model_size,
+                device="cpu",
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=self.workers,
+            )
+        except Exception as e:
+            raise ValueError(f"Could not load local Whisper model '{model_size}': {e}")
+
+        # Model accepts `workers` concurrent calls; extra callers wait here
+        self._slots = threading.BoundedSemaphore(self.workers)
+        print("[LOCAL] Model ready")
+
+    @property
+    def model_name(self) -> str:
+        """Model identifier used for cache keys."""
+        return f"local:{self.model_size}"
+
+    def transcribe_detailed(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False,
+                            with_segments: bool = False, latency_sensitive: bool = False) -> Optional[TranscriptionResult]:
+        """
+        Transcribe an audio file on the CPU.
+
+        Args:
+            audio_file_path: Path to the audio file (.wav, .mp3, etc.)
+            language: Language code (None for auto-detect)
+            translate: If True, translate to English instead of transcribing
+            with_segments: If True, keep segment timings
+            latency_sensitive: Unused (no network tail latency to hedge)
+
+        Returns:
+            TranscriptionResult, or None if failed
+        """
+        if not get_audio_handoff().exists(audio_file_path):
+            print(f"Error: Audio file not found: {audio_file_path}")
+            return None
+
+        # The model decodes from a real file: wait for an in-memory handoff to reach disk
+        get_audio_handoff().wait_persisted(audio_file_path)
+
+        cache = get_transcript_cache()
+        cache_key = None
+        if cache is not None:
+            try:
+                cache_key = cache.make_key(cache.hash_file(audio_file_path), self.model_name, language, translate)
+                cached = cache.get(cache_key, required_field="segments" if with_segments else None)
+                if cached is not None:
+                    print(f"[CACHE] Hit for {Path(audio_file_path).name}, skipping local transcription")
+                    return TranscriptionResult(text=cached["text"], segments=cached.get("segments"))
+            except OSError as e:
+                print(f"[CACHE] Warning: Could not hash audio file: {e}")
+                cache_key = None
+
+        try:
+            with self._slots:
+                segments_iter, info = self._model.transcribe(
+                    audio_file_path,
+                    language=language,
+                    task="translate" if translate else "transcribe",
+                    beam_size=self.BEAM_SIZE,
+                )
+                # Segments are decoded lazily: consume inside the worker slot
+                segments = [
+                    {
+                        "start": float(seg.start),
+                        "end": float(seg.end),
+                        "text": seg.text.strip(),
+                        "no_speech_prob": float(seg.no_speech_prob),
+                    }
+                    for seg in segments_iter
+                ]
+        except Exception as e:
+            print(f"[LOCAL] Transcription error: {e}")
+            return None
+
+        text = " ".join(seg["text"] for seg in segments if seg["text"])
+        print(f"[LOCAL] Transcribed {Path(audio_file_path).name}: {info.duration:.1f}s audio, {len(text)} chars")
+
+        if cache_key is not None and text:
+            cache.put(cache_key, {"text": text, "segments": segments})
+
+        return TranscriptionResult(text=text, segments=segments if with_segments else None)
+
+    def max_concurrency(self) -> Optional[int]:
+        """Number of files the model transcribes in parallel."""
+        return self.workers
@@ -0,0 +1,350 @@
+"""
+Rate Limiter Module - Shared request scheduler for Groq API calls.
+
+All transcription requests acquire budget here before being sent:
+- Requests-per-minute budget (token bucket)
+- Audio-seconds-per-hour budget (token bucket)
+- Server-side pauses from Retry-After / x-ratelimit-reset-* headers
+"""
+
+import asyncio
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+class TokenBucket:
+    """
+    Classic token bucket.
+
+    Tokens refill continuously up to `capacity`. Consuming more tokens than
+    are available returns the time to wait instead of blocking.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            capacity: Maximum number of tokens.
+            refill_per_second: Tokens added per second.
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+
+    def wait_time(self, amount: float, now: Optional[float] = None) -> float:
+        """
+        Get seconds until `amount` tokens are available (0 if available now).
+
+        Amounts larger than the capacity are clamped, so an oversized request
+        waits for a full bucket instead of waiting forever.
+        """
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return float("inf")
+        return (amount - self._tokens) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Consume tokens (call only after wait_time() returned 0)."""
+        self._tokens -= min(amount, self.capacity)
+
+    def drain(self) -> None:
+        """Empty the bucket (server told us the budget is exhausted)."""
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+
+    @property
+    def available(self) -> float:
+        """Currently available tokens."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Parse a server-requested wait time from response headers.
+
+    Supports `retry-after-ms`, `retry-after` (seconds or HTTP date) and
+    Groq's `x-ratelimit-reset-*` durations (e.g. "7.66s", "2m59.56s").
+
+    Args:
+        headers: Response headers (case-insensitive mapping like httpx.Headers)
+
+    Returns:
+        Seconds to wait, or None if no usable header was found
+    """
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000.0)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    # Fall back to the longest reset among exhausted budgets
+    waits = []
+    for key, value in headers.items():
+        key = key.lower()
+        if not key.startswith("x-ratelimit-reset-"):
+            continue
+        budget = key[len("x-ratelimit-reset-"):]
+        remaining = headers.get(f"x-ratelimit-remaining-{budget}")
+        if remaining is not None and remaining.strip() not in ("0", "0.0"):
+            continue
+        seconds = parse_duration(value)
+        if seconds is not None:
+            waits.append(seconds)
+
+    return max(waits) if waits else None
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse a Go-style duration string ("1m0s", "7.66s", "250ms") to seconds.
+
+    Returns:
+        Duration in seconds, or None if the string could not be parsed
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+
+    multipliers = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(number) * multipliers[unit] for number, unit in parts)
+
+
+class RequestScheduler:
+    """
+    Process-wide scheduler that every Groq request goes through.
+
+    Callers block in acquire() until both the request and audio budgets
+    allow the request, so parallel split jobs queue up instead of hitting
+    429 errors. A 429 pauses all callers for the server-requested time.
+    """
+
+    # Upper bound for a single server-requested pause
+    MAX_PAUSE_SECONDS = 300.0
+
+    def __init__(self, requests_per_minute: int = 20, audio_seconds_per_hour: int = 7200):
+        """
+        Initialize the scheduler.
+
+        Args:
+            requests_per_minute: Request budget (RPM)
+            audio_seconds_per_hour: Audio budget in seconds (ASH)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.audio_seconds_per_hour = audio_seconds_per_hour
+
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self._audio = TokenBucket(audio_seconds_per_hour, audio_seconds_per_hour / 3600.0)
+        self._paused_until = 0.0
+
+        # Statistics
+        self._waiting = 0
+        self._total_wait_seconds = 0.0
+        self._rate_limited_count = 0
+
+    def _wait_time(self, audio_seconds: float) -> float:
+        """Seconds until a request may start (call with lock held)."""
+        now = time.monotonic()
+        return max(
+            self._paused_until - now,
+            self._requests.wait_time(1, now),
+            self._audio.wait_time(audio_seconds, now),
+        )
+
+    def _next_wait(self, audio_seconds: float, waited: float) -> float:
+        """
+        Take the budget if the request may start now, else get how long to sleep before checking again.
+
+        Shared by acquire() and acquire_async(), which only differ in how they sleep.
+
+        Args:
+            audio_seconds: Duration of the audio that will be uploaded
+            waited: Seconds this caller has waited so far
+
+        Returns:
+            0 if the budget was taken (send the request), else seconds to sleep
+        """
+        with self._lock:
+            wait = self._wait_time(audio_seconds)
+            if wait <= 0:
+                self._requests.consume(1)
+                self._audio.consume(audio_seconds)
+                self._total_wait_seconds += waited
+                return 0.0
+
+        if waited == 0.0:
+            print(f"[RATE] Budget exhausted, queuing request for {wait:.1f}s")
+        # Sleep in short steps so a 429 pause or refill is picked up quickly
+        return min(wait, 1.0)
+
+    def acquire(self, audio_seconds: float = 0.0) -> float:
+        """
+        Block until a request for `audio_seconds` of audio may be sent.
+
+        Args:
+            audio_seconds: Duration of the audio that will be uploaded
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        with self._lock:
+            self._waiting += 1
+
+        try:
+            while True:
+                step = self._next_wait(audio_seconds, waited)
+                if step <= 0:
+                    return waited
+                time.sleep(step)
+                waited += step
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    async def acquire_async(self, audio_seconds: float = 0.0) -> float:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Args:
+            audio_seconds: Duration of the audio that will be uploaded
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        with self._lock:
+            self._waiting += 1
+
+        try:
+            while True:
+                step = self._next_wait(audio_seconds, waited)
+                if step <= 0:
+                    return waited
+                await asyncio.sleep(step)
+                waited += step
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def try_acquire(self, audio_seconds: float = 0.0) -> bool:
+        """
+        Take budget for a request only if it is available right now.
+
+        Args:
+            audio_seconds: Duration of the audio that will be uploaded
+
+        Returns:
+            True if the request may be sent immediately, False otherwise
+        """
+        with self._lock:
+            if self._wait_time(audio_seconds) > 0:
+                return False
+            self._requests.consume(1)
+            self._audio.consume(audio_seconds)
+            return True
+
+    def report_rate_limited(self, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Record a 429 response and pause all requests.
+
+        Args:
+            headers: Response headers of the 429 response
+
+        Returns:
+            Pause duration in seconds
+        """
+        pause = parse_retry_after(headers)
+        if pause is None:
+            # No hint from server: wait for one request token to refill
+            pause = 60.0 / max(1, self.requests_per_minute)
+        pause = min(pause, self.MAX_PAUSE_SECONDS)
+
+        with self._lock:
+            self._rate_limited_count += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            # Our local view was too optimistic: start the request budget over
+            self._requests.drain()
+
+        print(f"[RATE] Rate limited by Groq, pausing requests for {pause:.1f}s")
+        return pause
+
+    def get_stats(self) -> dict:
+        """Get scheduler state for UI/debugging."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "requests_per_minute": self.requests_per_minute,
+                "audio_seconds_per_hour": self.audio_seconds_per_hour,
+                "available_requests": round(self._requests.available, 2),
+                "available_audio_seconds": round(self._audio.available, 1),
+                "paused_seconds": round(max(0.0, self._paused_until - now), 1),
+                "waiting_requests": self._waiting,
+                "total_wait_seconds": round(self._total_wait_seconds, 1),
+                "rate_limited_count": self._rate_limited_count,
+            }
+
+
+_scheduler: Optional[RequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """
+    Get the process-wide scheduler (created from Config on first use).
+
+    Returns:
+        Shared RequestScheduler instance
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            from config import Config
+            config = Config()
+            _scheduler = RequestScheduler(
+                requests_per_minute=config.get_rate_limit_rpm(),
+                audio_seconds_per_hour=config.get_rate_limit_audio_seconds(),
+            )
+        return _scheduler
@@ -8,8 +8,19 @@ import numpy as np
 import wave
 import tempfile
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+
+from core.audio_buffer import CaptureBuffer, PreRollBuffer
+from core.audio_handoff import encode_flac_blocks, get_audio_handoff
+from core.capture_health import CaptureHealth
+from core.capture_process import CaptureProcess
+from core.device_registry import get_device_registry
+from core.disk_writer import DiskWriter
+from core.resampler import PolyphaseResampler
+from core.speculative import PauseSegmenter, RecordedSegment
 
 
 class AudioRecorder:
@@ -18,18 +29,33 @@ class AudioRecorder:
 
     Features:
     - Records in separate thread (non-blocking)
-    - Saves to temporary .wav file
-    - Configurable sample rate and channels
+    - Captures into a preallocated int16 buffer (no per-block allocation)
+    - Saves to temporary .wav file, optionally streamed to disk while recording,
+      or hands it to the transcriber as in-memory FLAC
+    - Configurable sample rate and channels; saved as mono at the configured
+      rate (resampled if the device only supports its native rate)
     - Graceful interruption handling
+    - Optional live segmentation at pauses (speculative transcription)
+    - Optional warm input stream for instant start, with a pre-roll of
+      the audio right before the hotkey
+    - Optional capture in a subprocess (shared-memory ring), isolated
+      from the app's GIL
     """
 
+    # Saved files are always mono (Whisper does not use stereo)
+    UPLOAD_CHANNELS = 1
+
+    # Capture process counted as failed if its ring does not advance for this long
+    RING_STALL_SECONDS = 1.0
+
     def __init__(self, sample_rate: int = 16000, channels: int = 1):
         """
         Initialize the audio recorder.
 
         Args:
-            sample_rate: Audio sample rate in Hz (default: 16000 for Groq compatibility)
-            channels: Number of audio channels (1=mono, 2=stereo)
+            sample_rate: Audio sample rate in Hz (default: 16000 for Groq compatibility).
+                Saved files always use this rate, even if the device captures at another one.
+            channels: Number of audio channels captured (1=mono, 2=stereo); saved files are mono
         """
         self.sample_rate = sample_rate
         self.channels = channels
@@ -38,15 +64,179 @@ class AudioRecorder:
         # Recording state
         self._is_recording = False
         self._recording_thread: Optional[threading.Thread] = None
-        self._recorded_frames = []
+        self._buffer = CaptureBuffer(channels=channels, sample_rate=sample_rate)
         self._audio_file_path: Optional[str] = None
+        self._stream_to_disk = False
+        self._disk_writer: Optional[DiskWriter] = None
+        self._recording_stamp = 0
+        self._capturing = False
+        self._stop_event = threading.Event()
+
+        # Warm stream (kept open between recordings when enabled)
+        self._stream_lock = threading.Lock()
+        self._warm_enabled = False
+        self._warm_stream = None
+        self._warm_device: Optional[int] = None
+        self._pre_roll_seconds = 0.0
+        self._pre_roll: Optional[PreRollBuffer] = None
+        self._pre_roll_pending = False
+        self._pre_roll_frames = 0
+
+        # Capture subprocess (replaces the warm stream when enabled)
+        self._process_enabled = False
+        self._process_pre_roll_seconds = 0.0
+        self._capture_process: Optional[CaptureProcess] = None
+        self._recording_process: Optional[CaptureProcess] = None  # Process of the current/last recording
+        self._process_stats: Optional[dict] = None
+        self._ring_read = 0
+        self._ring_stop: Optional[int] = None
+        self._ring_overruns = 0
+        self._ring_lost_frames = 0
+        self._ring_progress_at = 0.0
+        self._process_error: Optional[str] = None
+
+        # Start/stop latency of recent recordings (ms)
+        self._latency_lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=50)
+        self._start_requested_at = 0.0
+        self._stop_requested_at = 0.0
+        self._encode_in_memory = False
+        self._first_block_at: Optional[float] = None
+
+        # Callback health of the current (or last) recording
+        self._health = CaptureHealth()
+        self._reported_problems = 0
+
+        # Live segmentation state (only used when on_segment is given)
+        self._on_segment: Optional[Callable[[RecordedSegment], None]] = None
+        self._min_segment_seconds = 30.0
+        self._segmenter: Optional[PauseSegmenter] = None
+        self._segment_lock = threading.Lock()
+        self._segment_index = 0
+        self._segment_start_sample = 0
+        self._segment_fed_frames = 0
+
+    def set_warm_stream(self, enabled: bool, device_index: Optional[int] = None,
+                        pre_roll_seconds: float = 0.0) -> None:
+        """
+        Keep the input stream open between recordings (or close it).
+
+        A warm stream makes start_recording() almost instant and avoids
+        clipping the first syllable; audio is discarded while idle, except
+        the last `pre_roll_seconds`, which are prepended to the next recording.
+
+        Args:
+            enabled: Keep a warm stream open
+            device_index: Microphone device index (None for system default)
+            pre_roll_seconds: Audio before start_recording() to keep (0 = off)
+        """
+        with self._stream_lock:
+            self._warm_enabled = enabled
+            self._pre_roll_seconds = pre_roll_seconds
+            if not enabled:
+                self._close_warm_stream()
+            elif self._warm_stream is None or self._warm_device != device_index or not self._warm_stream.active:
+                self._open_warm_stream(device_index)
+            else:
+                self._reset_pre_roll(int(self._warm_stream.samplerate))
+
+    def _reset_pre_roll(self, sample_rate: int) -> None:
+        """(Re)create the pre-roll ring if its length or rate changed."""
+        pre_roll = self._pre_roll
+        if self._pre_roll_seconds <= 0:
+            self._pre_roll = None
+        elif pre_roll is None or pre_roll.seconds != self._pre_roll_seconds or pre_roll.sample_rate != sample_rate:
+            self._pre_roll = PreRollBuffer(self._pre_roll_seconds, sample_rate, self.channels)
+
+    def _open_warm_stream(self, device_index: Optional[int]) -> None:
+        """(Re)open and start the warm stream (stream lock held)."""
+        self._close_warm_stream()
+        try:
+            stream = self._open_stream(device_index)
+            stream.start()
+        except Exception as e:
+            print(f"Could not open warm input stream: {e}")
+            return
+        self._reset_pre_roll(int(stream.samplerate))
+        self._warm_stream = stream
+        self._warm_device = device_index
+        print(f"Warm input stream open. Sample rate: {int(stream.samplerate)} Hz")
+
+    def _close_warm_stream(self) -> None:
+        """Stop and close the warm stream, if any (stream lock held)."""
+        stream, self._warm_stream = self._warm_stream, None
+        self._pre_roll = None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                print(f"Warning: Could not close warm input stream: {e}")
 
-    def start_recording(self, device_index: Optional[int] = None) -> None:
+    def set_capture_process(self, enabled: bool, device_index: Optional[int] = None,
+                            pre_roll_seconds: float = 0.0) -> None:
+        """
+        Capture audio in a child process (or stop it).
+
+        The child keeps the input stream open and writes into a shared-memory
+        ring; recordings read the ring from the moment they start (minus
+        `pre_roll_seconds`). Heavy work in the app process can then no longer
+        delay the audio callback.
+
+        Args:
+            enabled: Run the capture process
+            device_index: Microphone device index (None for system default)
+            pre_roll_seconds: Audio before start_recording() to keep (0 = off)
+        """
+        with self._stream_lock:
+            self._process_enabled = enabled
+            self._process_pre_roll_seconds = pre_roll_seconds
+            process = self._capture_process
+            if not enabled:
+                self._close_capture_process()
+            elif process is None or process.device_index != device_index or not process.is_alive():
+                self._open_capture_process(device_index)
+
+    def _open_capture_process(self, device_index: Optional[int]) -> None:
+        """(Re)start the capture process (stream lock held)."""
+        self._close_capture_process()
+        device = get_device_registry().by_index(device_index) if device_index is not None else None
+        try:
+            process = CaptureProcess(device_index, device.key if device is not None else "",
+                                     self.sample_rate, self.channels)
+        except Exception as e:
+            print(f"Could not start capture process: {e}")
+            return
+        self._capture_process = process
+        print(f"Capture process running. Sample rate: {process.sample_rate} Hz")
+
+    def _close_capture_process(self) -> None:
+        """Stop the capture process, if any (stream lock held)."""
+        process, self._capture_process = self._capture_process, None
+        if process is not None:
+            try:
+                process.close()
+            except Exception as e:
+                print(f"Warning: Could not stop capture process: {e}")
+
+    def start_recording(self, device_index: Optional[int] = None,
+                        on_segment: Optional[Callable[[RecordedSegment], None]] = None,
+                        min_segment_seconds: float = 30.0, stream_to_disk: bool = False,
+                        encode_in_memory: bool = False) -> None:
         """
         Start audio recording in a separate thread.
 
         Args:
             device_index: Microphone device index (None for system default)
+            on_segment: Called with each finished segment while recording
+                (cut at pauses) and with the tail on stop. Only called if the
+                recording gets long enough to be split.
+            min_segment_seconds: Shortest segment to cut off
+            stream_to_disk: Write audio to the WAV file while recording
+                (flat memory, crash-safe, near-instant stop)
+            encode_in_memory: Hand the recording and segments to the transcriber
+                as in-memory FLAC (written to disk in the background); not used
+                for the full file when streaming to disk
 
         Returns:
             None (returns immediately, recording happens in background)
@@ -54,40 +244,108 @@ class AudioRecorder:
         if self._is_recording:
             raise RuntimeError("Recording is already in progress")
 
+        self._start_requested_at = time.perf_counter()
+        self._first_block_at = None
         self._is_recording = True
-        self._recorded_frames = []
+        self._stop_event.clear()
         self._audio_file_path = None
-
-        # Start recording thread
-        self._recording_thread = threading.Thread(
-            target=self._record_thread,
-            args=(device_index,),
-            daemon=True
-        )
+        self._stream_to_disk = stream_to_disk
+        self._encode_in_memory = encode_in_memory
+        self._disk_writer = None
+        self._recording_stamp = int(time.time() * 1000)
+
+        self._on_segment = on_segment
+        self._min_segment_seconds = min_segment_seconds
+        self._segmenter = None
+        self._segment_index = 0
+        self._segment_start_sample = 0
+        self._segment_fed_frames = 0
+
+        capture_process = None
+        if self._process_enabled:
+            with self._stream_lock:
+                # Restart if the device changed or the process died
+                process = self._capture_process
+                if process is None or process.device_index != device_index or not process.is_alive():
+                    self._open_capture_process(device_index)
+                capture_process = self._capture_process
+        self._recording_process = capture_process
+        self._ring_stop = None
+        self._process_error = None
+
+        warm_stream = None
+        if capture_process is None and self._warm_enabled:
+            with self._stream_lock:
+                # Reopen if the device changed or the stream died (e.g. device unplugged)
+                if self._warm_stream is None or self._warm_device != device_index or not self._warm_stream.active:
+                    self._open_warm_stream(device_index)
+                warm_stream = self._warm_stream
+
+        self._pre_roll_frames = 0
+        if capture_process is not None:
+            # The child's stream is already running: read its ring from now (minus the pre-roll)
+            position = capture_process.ring.position
+            rate = capture_process.sample_rate
+            self._pre_roll_frames = min(position, int(self._process_pre_roll_seconds * rate))
+            self._ring_read = position - self._pre_roll_frames
+            self._ring_overruns = 0
+            self._ring_lost_frames = 0
+            capture_process.reset_health()
+            self._prepare_capture(rate)
+            self._recording_thread = threading.Thread(
+                target=self._capture_loop, args=(capture_process, device_index), daemon=True
+            )
+        elif warm_stream is not None:
+            # Stream is already running: just switch the callback from discarding to capturing
+            # (the callback first moves the pre-roll into the recording)
+            self._pre_roll_pending = self._pre_roll is not None
+            self._prepare_capture(int(warm_stream.samplerate))
+            self._recording_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        else:
+            self._recording_thread = threading.Thread(
+                target=self._record_thread,
+                args=(device_index,),
+                daemon=True
+            )
         self._recording_thread.start()
 
     def stop_recording(self) -> Optional[str]:
         """
-        Stop recording and save to temporary .wav file.
+        Stop recording and save to temporary .wav file (or in-memory .flac handoff).
 
         Returns:
-            Path to the saved .wav file, or None if recording wasn't active
+            Path to the saved file, or None if recording wasn't active
         """
         if not self._is_recording:
             return None
 
-        # Signal thread to stop
+        stop_requested_at = time.perf_counter()
+        self._stop_requested_at = stop_requested_at
+
+        # Audio in the capture process ring up to now belongs to the recording
+        if self._recording_process is not None:
+            self._ring_stop = self._recording_process.ring.position
+
+        # Signal thread to stop (wakes it immediately, no polling delay)
+        self._capturing = False
         self._is_recording = False
+        self._stop_event.set()
 
         # Wait for thread to finish
         if self._recording_thread:
             self._recording_thread.join(timeout=5.0)
             self._recording_thread = None
 
-        # Save to WAV file
-        if self._recorded_frames:
+        # Save to WAV file (already on disk when streaming)
+        if self._disk_writer is not None:
+            self._audio_file_path = self._close_disk_writer()
+        elif self._buffer.frames:
             self._audio_file_path = self._save_to_wav()
+        if self._audio_file_path:
+            self._finish_segments()
 
+        self._record_latency(stop_requested_at)
+        self._report_capture_problems()
         return self._audio_file_path
 
     def is_recording(self) -> bool:
@@ -98,135 +356,493 @@ class AudioRecorder:
         """Get the path to the most recently recorded file."""
         return self._audio_file_path
 
+    def _record_latency(self, stop_requested_at: float) -> None:
+        """Store start latency (request -> first captured block) and stop latency (request -> file ready)."""
+        stop_ms = (time.perf_counter() - stop_requested_at) * 1000
+        start_ms = None
+        if self._first_block_at is not None:
+            start_ms = (self._first_block_at - self._start_requested_at) * 1000
+        with self._latency_lock:
+            self._latencies.append((start_ms, stop_ms))
+        start_text = f"{start_ms:.0f} ms" if start_ms is not None else "n/a"
+        print(f"Recorder latency: start {start_text}, stop {stop_ms:.0f} ms"
+              f" (pre-roll {self._pre_roll_frames / self._actual_sample_rate:.2f} s)")
+
+    def get_latency_stats(self) -> dict:
+        """
+        Get recording start/stop latency of recent recordings.
+
+        Returns:
+            Dict with warm stream state, last and average latencies in ms
+        """
+        with self._latency_lock:
+            samples = list(self._latencies)
+        starts = [start for start, _ in samples if start is not None]
+        stops = [stop for _, stop in samples]
+        pre_roll_seconds = self._pre_roll_seconds if self._pre_roll is not None else 0.0
+        if self._capture_process is not None:
+            pre_roll_seconds = self._process_pre_roll_seconds
+        return {
+            "warm_stream": self._warm_stream is not None,
+            "capture_process": self._capture_process is not None,
+            "samples": len(samples),
+            "last_start_ms": round(starts[-1], 1) if starts else None,
+            "last_stop_ms": round(stops[-1], 1) if stops else None,
+            "avg_start_ms": round(sum(starts) / len(starts), 1) if starts else None,
+            "avg_stop_ms": round(sum(stops) / len(stops), 1) if stops else None,
+            "max_start_ms": round(max(starts), 1) if starts else None,
+            "pre_roll_seconds": pre_roll_seconds,
+            "last_pre_roll_ms": round(self._pre_roll_frames / self._actual_sample_rate * 1000, 1),
+        }
+
+    def get_capture_stats(self) -> dict:
+        """
+        Get audio callback health of the current recording (or the last one when idle).
+
+        Returns:
+            CaptureHealth snapshot plus callback-time page allocations; in
+            capture process mode the child's snapshot plus ring overruns
+        """
+        process = self._recording_process
+        if process is None:
+            return {
+                "recording": self._is_recording,
+                "capture_process": False,
+                "capture_process_error": self._process_error,
+                **self._health.snapshot(),
+                "buffer_allocations": self._buffer.callback_allocations,
+            }
+        # Read from shared memory (None until the child applied the reset for this recording)
+        stats = process.health_snapshot() if self._is_recording else self._process_stats
+        rate = process.sample_rate
+        return {
+            "recording": self._is_recording,
+            "capture_process": True,
+            "capture_process_error": None,
+            **(stats or {}),
+            "ring_overruns": self._ring_overruns,
+            "ring_lost_seconds": round(self._ring_lost_frames / rate, 3) if rate else 0.0,
+            "buffer_allocations": self._buffer.callback_allocations,
+        }
+
+    def _open_stream(self, device_index: Optional[int], callback: Optional[Callable] = None):
+        """
+        Create an input stream, falling back to the default microphone.
+
+        Args:
+            device_index: Microphone device index (None for system default)
+            callback: Stream callback (default: this recorder's)
+
+        Returns:
+            sd.InputStream (not started)
+        """
+        stream = None
+
+        # If specific device is selected, try to use it
+        if device_index is not None:
+            print(f"Opening stream for device {device_index}...")
+            try:
+                stream = self._create_input_stream(device_index, callback)
+            except Exception as device_error:
+                print(f"Device {device_index} init failed: {device_error}")
+                
+                # Try to find device by name if index failed (indices can change)
+                new_index = self._find_device_index_by_old_index(device_index)
+                if new_index is not None and new_index != device_index:
+                    print(f"Retrying with new device index: {new_index}")
+                    try:
+                        stream = self._create_input_stream(new_index, callback)
+                    except Exception as retry_error:
+                        print(f"Retry failed: {retry_error}")
+                        stream = None
+                
+                if stream is None:
+                    # Device not found or invalid - fallback to default
+                    print("Falling back to default system microphone...")
+                    stream = self._create_input_stream(None, callback)
+        else:
+            # Use configured sample rate for default device
+            stream = self._create_input_stream(None, callback)
+
+        return stream
+
+    def _create_input_stream(self, device: Optional[int], callback: Optional[Callable] = None):
+        """
+        Create an input stream at the configured rate, or the device's native rate if unsupported.
+
+        Supported rates come from the device registry cache (probed once per
+        device). Audio captured at another rate is resampled to the
+        configured rate when saved.
+
+        Args:
+            device: Device index (None for system default)
+            callback: Stream callback (default: this recorder's)
+
+        Returns:
+            sd.InputStream (not started)
+        """
+        registry = get_device_registry()
+        info = registry.by_index(device) if device is not None else registry.default_input()
+        rate = registry.pick_rate(info, self.sample_rate, self.channels)
+        if rate != self.sample_rate:
+            print(f"{self.sample_rate} Hz not supported by {info.name}, capturing at {rate} Hz")
+        return sd.InputStream(
+            samplerate=rate,
+            channels=self.channels,
+            dtype=np.float32,
+            device=device,
+            callback=callback or self._audio_callback
+        )
+
+    def _prepare_capture(self, sample_rate: int) -> None:
+        """Reset the buffer for the device's rate, start the disk writer, then enable capture."""
+        # Size the buffer pages for the device's rate before any block is captured
+        self._actual_sample_rate = sample_rate
+        self._buffer.reset(self._actual_sample_rate)
+        self._health.reset(sample_rate)
+        self._reported_problems = 0
+        if self._stream_to_disk:
+            self._start_disk_writer()
+        if self._on_segment is not None:
+            self._segmenter = PauseSegmenter(
+                self._actual_sample_rate, min_segment_seconds=self._min_segment_seconds
+            )
+        self._capturing = True
+
     def _record_thread(self, device_index: Optional[int]) -> None:
         """
-        Recording loop running in separate thread.
+        Recording loop running in separate thread (cold start: opens its own stream).
 
         Args:
             device_index: Microphone device index
         """
-        stream = None
-        
         try:
-            # If specific device is selected, try to use it
-            if device_index is not None:
-                print(f"Opening stream for device {device_index}...")
-                try:
-                    stream = sd.InputStream(
-                        samplerate=self.sample_rate,
-                        channels=self.channels,
-                        dtype=np.float32,
-                        device=device_index,
-                        callback=self._audio_callback
-                    )
-                except Exception as device_error:
-                    print(f"Device {device_index} init failed: {device_error}")
-                    
-                    # Try to find device by name if index failed (indices can change)
-                    new_index = self._find_device_index_by_old_index(device_index)
-                    if new_index is not None and new_index != device_index:
-                        print(f"Retrying with new device index: {new_index}")
-                        try:
-                            stream = sd.InputStream(
-                                samplerate=self.sample_rate,
-                                channels=self.channels,
-                                dtype=np.float32,
-                                device=new_index,
-                                callback=self._audio_callback
-                            )
-                        except Exception as retry_error:
-                            print(f"Retry failed: {retry_error}")
-                            stream = None
-                    
-                    if stream is None:
-                        # Device not found or invalid - fallback to default
-                        print("Falling back to default system microphone...")
-                        stream = sd.InputStream(
-                            samplerate=self.sample_rate,
-                            channels=self.channels,
-                            dtype=np.float32,
-                            callback=self._audio_callback
-                        )
-            else:
-                # Use configured sample rate for default device
-                stream = sd.InputStream(
-                    samplerate=self.sample_rate,
-                    channels=self.channels,
-                    dtype=np.float32,
-                    callback=self._audio_callback
-                )
-            
+            stream = self._open_stream(device_index)
+            self._prepare_capture(int(stream.samplerate))
+
             with stream:
-                self._actual_sample_rate = int(stream.samplerate)
-                print(f"Recording started. Sample rate: {self._actual_sample_rate} Hz")
-                
-                # Keep recording until stop is signaled
-                while self._is_recording:
-                    sd.sleep(100)  # Check every 100ms
+                self._capture_loop()
 
         except Exception as e:
             print(f"Recording error: {e}")
+            self._capturing = False
             self._is_recording = False
 
-    def _audio_callback(self, indata, frames, time, status) -> None:
+    def _capture_loop(self, process: Optional[CaptureProcess] = None,
+                      device_index: Optional[int] = None) -> None:
+        """
+        Housekeeping while capturing, until stop_recording() sets the stop event.
+
+        Args:
+            process: Capture process whose ring is copied into the buffer (None if
+                this process' callback fills the buffer)
+            device_index: Microphone to capture from in this process if the capture process fails
+        """
+        source = " (capture process)" if process is not None else ""
+        print(f"Recording started{source}. Sample rate: {self._actual_sample_rate} Hz")
+        fallback_stream = None
+        if process is not None:
+            self._ring_progress_at = time.perf_counter()
+            self._drain_ring(process)
+
+        # Wakes every 100ms, or immediately on stop
+        while not self._stop_event.wait(0.1):
+            if process is not None:
+                self._drain_ring(process)
+                error = self._capture_process_error(process)
+                if error is not None:
+                    fallback_stream = self._fall_back_from_process(process, device_index, error)
+                    process = None
+            self._buffer.reserve()  # Keep a spare page so the callback never allocates
+            if self._segmenter is not None:
+                self._emit_segments()
+            self._report_capture_problems()
+
+        if process is not None:
+            self._drain_ring(process, self._ring_stop)
+            self._process_stats = process.health_snapshot()
+        if fallback_stream is not None:
+            fallback_stream.stop()
+            fallback_stream.close()
+
+    def _capture_process_error(self, process: CaptureProcess) -> Optional[str]:
+        """Describe why the capture process stopped delivering audio, or None if it is fine."""
+        if not process.is_alive():
+            return "capture process exited"
+        if time.perf_counter() - self._ring_progress_at > self.RING_STALL_SECONDS:
+            return f"no audio from capture process for {self.RING_STALL_SECONDS:g} s"
+        return None
+
+    def _fall_back_from_process(self, process: CaptureProcess, device_index: Optional[int], error: str):
+        """
+        Continue a recording in this process after the capture process failed.
+
+        Args:
+            process: The failed capture process (stopped here)
+            device_index: Microphone device index
+            error: What went wrong
+
+        Returns:
+            The started input stream, or None if capture could not continue
+            (the recording keeps the audio captured so far)
+        """
+        print(f"[CAPTURE] {error}, continuing the recording in this process")
+        self._process_error = error
+        self._recording_process = None
+        with self._stream_lock:
+            if self._capture_process is process:
+                self._close_capture_process()
+        try:
+            stream = self._open_stream(device_index)
+            if int(stream.samplerate) != self._actual_sample_rate:
+                stream.close()
+                raise RuntimeError(f"microphone now captures at {int(stream.samplerate)} Hz")
+            # The stream is not started yet: the callback will be the only writer
+            self._health.reset(self._actual_sample_rate)
+            self._reported_problems = 0
+            stream.start()
+            return stream
+        except Exception as e:
+            print(f"[CAPTURE] Could not continue recording: {e}")
+            return None
+
+    def _drain_ring(self, process: CaptureProcess, end: Optional[int] = None) -> None:
+        """
+        Copy new audio from the capture process ring into the buffer.
+
+        Args:
+            process: Capture process
+            end: Ring position to stop at (default: everything written so far)
+        """
+        end = process.ring.position if end is None else end
+        start = self._ring_read
+        if end <= start:
+            return
+        views, lost = process.read_range(start, end)
+        for view in views:
+            self._buffer.write(view)
+        # Lapped before or while copying: this audio is gone or torn
+        if lost or process.ring.overwritten(start + lost):
+            self._ring_overruns += 1
+            self._ring_lost_frames += lost
+        self._ring_read = end
+        self._ring_progress_at = time.perf_counter()
+        if self._first_block_at is None:
+            self._first_block_at = time.perf_counter()
+
+    def _report_capture_problems(self) -> None:
+        """Log overflows/dropped blocks seen since the last check (never from the callback)."""
+        stats = self.get_capture_stats()
+        problems = (stats.get("overflows", 0) + stats.get("underflows", 0) + stats.get("dropped_blocks", 0)
+                    + stats.get("ring_overruns", 0))
+        if problems == self._reported_problems:
+            return
+        self._reported_problems = problems
+        overruns = f", {stats['ring_overruns']} ring overrun(s)" if stats.get("ring_overruns") else ""
+        print(f"[CAPTURE] Stream problems: {stats.get('overflows', 0)} overflow(s), "
+              f"{stats.get('underflows', 0)} underflow(s), {stats.get('dropped_blocks', 0)} dropped block(s){overruns}")
+
+    def _audio_callback(self, indata, frames, time_info, status) -> None:
         """
         Callback function for audio stream.
 
         Args:
             indata: Audio data chunk (numpy array)
             frames: Number of frames
-            time: Timestamp info
+            time_info: Timestamp info
             status: Stream status
         """
-        if status:
-            print(f"Stream status: {status}")
-
-        # Store audio chunk
-        if self._is_recording:
-            self._recorded_frames.append(indata.copy())
+        # Store audio chunk (converted to int16 in place, no allocation)
+        if self._capturing:
+            health = self._health
+            started = health.begin(frames, time_info, status)
+            if self._first_block_at is None:
+                self._first_block_at = time.perf_counter()
+            if self._pre_roll_pending:
+                # Audio from just before the hotkey goes first
+                self._pre_roll_pending = False
+                if self._pre_roll is not None:
+                    self._pre_roll_frames = self._pre_roll.drain_into(self._buffer)
+            self._buffer.write(indata)
+            health.end(started)
+        else:
+            # Warm stream while idle: keep only the pre-roll (if any), discard the rest
+            pre_roll = self._pre_roll
+            if pre_roll is not None:
+                pre_roll.write(indata)
+
+    def _start_disk_writer(self) -> None:
+        """Start draining the capture buffer into temp/recording_<ts>.wav."""
+        temp_file = str(self._temp_dir() / f"recording_{self._recording_stamp}.wav")
+        try:
+            self._disk_writer = DiskWriter(
+                self._buffer, temp_file, self.sample_rate, self.UPLOAD_CHANNELS,
+                resampler=self._create_resampler(),
+                # The current speculative segment is still read from memory
+                keep_from=lambda: self._segment_start_sample if self._segmenter is not None else self._buffer.frames
+            )
+            self._disk_writer.start()
+            print(f"Streaming recording to: {temp_file}")
+        except OSError as e:
+            print(f"Could not stream to disk, recording in memory: {e}")
+            self._disk_writer = None
+
+    def _close_disk_writer(self) -> Optional[str]:
+        """Flush the last frames and finalize the streamed file."""
+        writer, self._disk_writer = self._disk_writer, None
+        try:
+            path = writer.close()
+        except Exception as e:
+            # Whatever reached the disk is still a valid (shorter) recording
+            print(f"Disk writer failed, keeping partial recording: {e}")
+            path = writer.path
+        if not self._buffer.frames:
+            Path(path).unlink(missing_ok=True)
+            return None
+        return path
 
-    def _save_to_wav(self) -> str:
+    def _emit_segments(self) -> None:
         """
-        Save recorded audio to temporary WAV file.
+        Feed newly recorded audio to the segmenter and emit finished segments.
 
-        Returns:
-            Path to the saved .wav file
+        Runs in the recording thread (never in the audio callback).
         """
-        # Create temp directory in project root
+        with self._segment_lock:
+            end = self._buffer.frames
+            if end <= self._segment_fed_frames:
+                return
+
+            new_audio = self._buffer.read(self._segment_fed_frames, end)
+            self._segment_fed_frames = end
+            cuts = self._segmenter.feed(new_audio.mean(axis=1, dtype=np.float32) / 32767)
+
+            for cut in cuts:
+                self._write_segment(self._segment_start_sample, cut, final=False)
+                self._segment_start_sample = cut
+
+    def _finish_segments(self) -> None:
+        """After stop: emit the tail if the recording was split into segments."""
+        if self._segmenter is None:
+            return
+        self._emit_segments()
+        with self._segment_lock:
+            if self._segment_index == 0:
+                return  # Short recording: the full file is transcribed as usual
+            self._write_segment(self._segment_start_sample, self._buffer.frames, final=True)
+            self._segmenter = None
+
+    def _write_segment(self, start: int, end: int, final: bool) -> None:
+        """Save frames [start, end) as one segment and hand it to the on_segment callback (segment lock held)."""
+        temp_file = self._write_audio(
+            self._temp_dir() / f"recording_{self._recording_stamp}_part{self._segment_index:02d}", start, end, final
+        )
+
+        segment = RecordedSegment(
+            path=temp_file,
+            index=self._segment_index,
+            start_seconds=start / self._actual_sample_rate,
+            end_seconds=end / self._actual_sample_rate,
+            final=final,
+        )
+        self._segment_index += 1
+        try:
+            self._on_segment(segment)
+        except Exception as e:
+            print(f"Warning: Segment callback failed: {e}")
+
+    @staticmethod
+    def _temp_dir() -> Path:
+        """Get (and create) the temp directory in the project root."""
         project_root = Path(__file__).parent.parent.parent
         temp_dir = project_root / "temp"
         temp_dir.mkdir(exist_ok=True)
+        return temp_dir
 
-        # Generate unique filename with timestamp
-        import time
-        timestamp = int(time.time() * 1000)
-        temp_file = str(temp_dir / f"recording_{timestamp}.wav")
-
-        # Concatenate all frames
-        audio_data = np.concatenate(self._recorded_frames, axis=0)
+    def _create_resampler(self) -> Optional[PolyphaseResampler]:
+        """Resampler from the capture format to upload format (configured rate, mono), or None if they match."""
+        resampler = PolyphaseResampler(self._actual_sample_rate, self.sample_rate, self.channels)
+        return None if resampler.is_passthrough else resampler
 
-        # Convert float32 to int16 for WAV compatibility
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+    def _output_blocks(self, start: int = 0, end: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Yield captured frames [start, end) in upload format, block by block.
 
-        # Save as WAV (use actual sample rate from recording)
-        with wave.open(temp_file, 'wb') as wav_file:
-            wav_file.setnchannels(self.channels)
+        Buffer pages are already int16: in upload format they are yielded as
+        zero-copy views; otherwise each page is downmixed/resampled on the way.
+        """
+        resampler = self._create_resampler()
+        if resampler is None:
+            yield from self._buffer.views(start, end)
+            return
+        for view in self._buffer.views(start, end):
+            yield resampler.process(view)
+        yield resampler.flush()
+
+    def _write_wav(self, path: str, start: int = 0, end: Optional[int] = None) -> None:
+        """Write captured frames [start, end) as a 16-bit WAV file in upload format."""
+        with wave.open(path, 'wb') as wav_file:
+            wav_file.setnchannels(self.UPLOAD_CHANNELS)
             wav_file.setsampwidth(2)  # 2 bytes for int16
-            wav_file.setframerate(self._actual_sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+            wav_file.setframerate(self.sample_rate)
+            for block in self._output_blocks(start, end):
+                wav_file.writeframesraw(np.ascontiguousarray(block).data)
+
+    def _write_audio(self, stem: Path, start: int = 0, end: Optional[int] = None, final: bool = True) -> str:
+        """
+        Save frames [start, end), in memory as FLAC (handoff) or as a WAV file.
 
-        return temp_file
+        Args:
+            stem: Output path without extension
+            start: First frame
+            end: End frame (default: all captured frames)
+            final: Recording has stopped (the stop-to-upload gap is measured)
+
+        Returns:
+            Path of the audio (a FLAC path may still be being written to disk)
+        """
+        if not self._encode_in_memory:
+            path = str(stem.with_suffix(".wav"))
+            self._write_wav(path, start, end)
+            return path
+
+        # Encode in memory and hand over; the disk copy is written in the background
+        path = str(stem.with_suffix(".flac"))
+        data, frames = encode_flac_blocks(self._output_blocks(start, end), self.sample_rate, self.UPLOAD_CHANNELS)
+        get_audio_handoff().publish(
+            path,
+            data,
+            duration_seconds=frames / self.sample_rate,
+            raw_bytes=frames * self.UPLOAD_CHANNELS * 2 + 44,
+            stopped_at=self._stop_requested_at if final else None,
+        )
+        return path
 
-    def cleanup_temp_files(self) -> None:
+    def _save_to_wav(self) -> str:
+        """
+        Save recorded audio to temporary file (WAV, or FLAC when handed over in memory).
+
+        Returns:
+            Path to the saved file
+        """
+        # Same name as the recording's segments and disk stream (stamped when recording started)
+        return self._write_audio(self._temp_dir() / f"recording_{self._recording_stamp}")
+
+    def cleanup_temp_files(self, keep: Optional[Iterable[str]] = None) -> None:
         """
         Delete all recording files from the temp directory.
         Call this to free up disk space.
+
+        Args:
+            keep: Files to keep (e.g. recordings of unfinished queued jobs)
         """
         project_root = Path(__file__).parent.parent.parent
         temp_dir = project_root / "temp"
+        keep_paths = {Path(path).resolve() for path in keep or []}
 
         if temp_dir.exists():
-            for file in temp_dir.glob("recording_*.wav"):
+            for file in [*temp_dir.glob("recording_*.wav"), *temp_dir.glob("recording_*.flac")]:
+                if file.resolve() in keep_paths:
+                    continue
                 try:
                     file.unlink()
                 except Exception as e:
@@ -234,61 +850,58 @@ class AudioRecorder:
 
     def get_available_devices(self) -> list:
         """
-        Get list of available input devices.
+        Get list of available input devices (from the device registry cache).
 
         Returns:
             List of device names
         """
-        devices = []
-        try:
-            device_list = sd.query_devices()
-            for i, device in enumerate(device_list):
-                if device['max_input_channels'] > 0:
-                    devices.append(f"{i}: {device['name']}")
-        except Exception as e:
-            print(f"Error querying devices: {e}")
-            devices = ["Default Device"]
+        devices = [f"{device.index}: {device.name}" for device in get_device_registry().devices()]
+        return devices or ["Default Device"]
 
-        return devices
+    def refresh_devices(self) -> None:
+        """
+        Rescan audio devices (e.g. after plugging in a microphone).
+
+        PortAudio only sees new devices after a restart, which is done when no
+        stream is in use; the warm stream (or capture process) is closed for it
+        and reopened on the same microphone afterwards.
+        """
+        registry = get_device_registry()
+        with self._stream_lock:
+            if self._is_recording:
+                registry.refresh()
+                return
+            process = self._capture_process
+            open_index = process.device_index if process is not None else self._warm_device
+            reopen = process is not None or self._warm_stream is not None
+            open_device = registry.by_index(open_index) if reopen and open_index is not None else None
+            self._close_warm_stream()
+            self._close_capture_process()
+            registry.refresh(reinitialize=True)
+            if reopen:
+                device = registry.resolve(open_device.key) if open_device is not None else None
+                index = device.index if device is not None else None
+                if process is not None:
+                    self._open_capture_process(index)
+                else:
+                    self._open_warm_stream(index)
 
     def _find_device_index_by_old_index(self, old_index: int) -> Optional[int]:
         """
         Attempt to find a device's new index if check failed.
         This is useful because PortAudio device indices can shift.
+
+        The device's name is taken from the cached scan, then devices are
+        rescanned (restarting PortAudio if no stream is open) and the same
+        device is looked up by its stable key.
         """
-        try:
-            # We can't really know the old name if we only have the index,
-            # unless we stored it. But here we can try to guess or just refresh.
-            # Strategy: Refresh logs to see current state (this is a blind retry usually)
-            
-            # Better strategy: List all devices, if we are looking for 'AirPods' 
-            # and the user selected an index that WAS airpods, maybe we can find it again?
-            # Since we don't have the original name stored in this class instance easily
-            # (unless we change API), we will try a heuristic:
-            # Check if there is ANY device with the same name as what we expect? 
-            # No, we don't know the name. 
-            
-            # Alternative: Just return None for now unless we store names.
-            # BUT, we can try to query the device name using the OLD index 
-            # (often querying name works even if opening stream fails?)
-            # No, if device is gone, query might fail or return different device.
-            
-            # Let's try to query the failing index to see what it *thinks* it is
-            try:
-                bad_device = sd.query_devices(old_index)
-                target_name = bad_device['name']
-                # If we got a name, search for it in current list
-                current_devices = sd.query_devices()
-                for i, dev in enumerate(current_devices):
-                    if dev['name'] == target_name and dev['max_input_channels'] > 0:
-                        # Found a match with same name!
-                        return i
-            except:
-                pass
-                
-            return None
-        except Exception:
+        registry = get_device_registry()
+        old_device = registry.by_index(old_index)
+        registry.refresh(reinitialize=self._warm_stream is None)
+        if old_device is None:
             return None
+        device = registry.resolve(old_device.key)
+        return device.index if device is not None else None
 
 
 # Standalone test
@@ -317,7 +930,6 @@ def test_recorder():
     recorder.start_recording()
 
     # Record for 5 seconds
-    import time
     time.sleep(5)
 
     # Stop recording
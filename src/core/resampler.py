@@ -0,0 +1,145 @@
+"""
+Resampler Module - Streaming polyphase resampling and downmix to upload format.
+
+Devices that refuse 16 kHz are captured at their native rate (often 44.1
+or 48 kHz), sometimes in stereo. Whisper only needs 16 kHz mono, so the
+recorder converts captured audio block by block on its way to the WAV/FLAC
+file: channels are averaged, then a Kaiser-windowed sinc filter is applied
+in polyphase form (only the output samples are computed, never the
+upsampled signal). State is carried between blocks, so the output is the
+same however the input is split.
+"""
+
+import math
+
+import numpy as np
+
+
+class PolyphaseResampler:
+    """
+    Rational-ratio resampler (in_rate -> out_rate) with mono downmix.
+
+    Feed int16 blocks (frames x channels) to process(), call flush() once at
+    the end. Output is int16 (frames x 1), ceil(input_frames * out / in) frames in total.
+    """
+
+    # Filter half-length in zero crossings of the output-rate sinc
+    ZERO_CROSSINGS = 16
+
+    # Passband edge as a fraction of the output Nyquist frequency
+    ROLLOFF = 0.92
+
+    KAISER_BETA = 8.0
+
+    # Output frames computed per vectorized step (bounds temporary memory)
+    CHUNK_FRAMES = 8192
+
+    def __init__(self, in_rate: int, out_rate: int = 16000, channels: int = 1):
+        """
+        Design the filter.
+
+        Args:
+            in_rate: Input sample rate in Hz
+            out_rate: Output sample rate in Hz
+            channels: Input channels (averaged to mono)
+        """
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.channels = channels
+        divisor = math.gcd(in_rate, out_rate)
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+
+        # Longer filter when decimating, so the transition band stays narrow at the output rate
+        self.taps = 2 * int(math.ceil(self.ZERO_CROSSINGS * max(1.0, self.down / self.up)))
+        self._half = self.taps // 2
+        self._phases = self._design()
+
+        # Input history: absolute index of its first sample, zeros before the start
+        self._history = np.zeros(self._half - 1, dtype=np.float32)
+        self._history_start = -(self._half - 1)
+        self._input_frames = 0
+        self._next_output = 0
+
+    def _design(self) -> np.ndarray:
+        """
+        Build the polyphase filter bank.
+
+        Returns:
+            (up x taps) array; row p holds the taps for output phase p, in input order
+        """
+        length = self.taps * self.up
+        center = self._half * self.up
+        cutoff = self.ROLLOFF * 0.5 / max(self.up, self.down)  # cycles per upsampled sample
+        k = np.arange(length) - center
+        window = np.i0(self.KAISER_BETA * np.sqrt(np.clip(1 - (k / (center + 1)) ** 2, 0, None)))
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * k) * window / np.i0(self.KAISER_BETA)
+
+        # Tap i of phase p is prototype[p + i*up] and multiplies x[base + half - i]
+        phases = prototype.reshape(self.taps, self.up).T
+        phases = phases / phases.sum(axis=1, keepdims=True)  # unity gain at DC for every phase
+        return np.ascontiguousarray(phases[:, ::-1], dtype=np.float32)
+
+    @property
+    def is_passthrough(self) -> bool:
+        """True if input is already in the output format."""
+        return self.up == self.down and self.channels == 1
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block.
+
+        Args:
+            block: int16 audio (frames x channels)
+
+        Returns:
+            int16 output frames (frames x 1) that are complete so far
+        """
+        if len(block) == 0:
+            return np.zeros((0, 1), dtype=np.int16)
+        mono = block.mean(axis=1, dtype=np.float32) if block.ndim == 2 else block.astype(np.float32)
+        self._history = np.concatenate((self._history, mono))
+        self._input_frames += len(mono)
+        # Output n needs input up to floor(n * down / up) + half
+        end = math.ceil((self._input_frames - self._half) * self.up / self.down)
+        return self._produce(end)
+
+    def flush(self) -> np.ndarray:
+        """
+        Emit the remaining output (the input is padded with silence).
+
+        Returns:
+            int16 output frames (frames x 1)
+        """
+        end = math.ceil(self._input_frames * self.up / self.down)
+        self._history = np.concatenate((self._history, np.zeros(self.taps, dtype=np.float32)))
+        return self._produce(end)
+
+    def _produce(self, end: int) -> np.ndarray:
+        """Compute outputs [next_output, end) and drop history no longer needed."""
+        start = self._next_output
+        if end <= start:
+            return np.zeros((0, 1), dtype=np.int16)
+
+        windows = np.lib.stride_tricks.sliding_window_view(self._history, self.taps)
+        out = np.empty(end - start, dtype=np.float32)
+        for chunk_start in range(start, end, self.CHUNK_FRAMES):
+            n = np.arange(chunk_start, min(end, chunk_start + self.CHUNK_FRAMES))
+            positions = n * self.down
+            bases = positions // self.up
+            rows = windows[bases - self._half + 1 - self._history_start]
+            if self.up == 1:
+                # Integer decimation: a single phase
+                values = rows @ self._phases[0]
+            else:
+                values = np.einsum("ij,ij->i", rows, self._phases[positions % self.up])
+            out[chunk_start - start:chunk_start - start + len(n)] = values
+        self._next_output = end
+
+        # Keep the input the next output still needs
+        keep_from = (end * self.down) // self.up - self._half + 1
+        drop = max(0, keep_from - self._history_start)
+        self._history = self._history[drop:]
+        self._history_start += drop
+
+        return np.clip(np.rint(out), -32768, 32767).astype(np.int16)[:, None]
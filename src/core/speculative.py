@@ -0,0 +1,225 @@
+"""
+Speculative Module - Transcribe dictation segments while recording continues.
+
+The recorder feeds live audio to a PauseSegmenter, which cuts finished
+segments at natural pauses. Each segment is transcribed in the background
+by a SpeculativeSession, so when recording stops only the final tail has
+to be uploaded and the results are stitched in order.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from core.audio_handoff import get_audio_handoff
+from core.transcription_backend import TranscriptionResult
+
+
+@dataclass
+class RecordedSegment:
+    """
+    A finished piece of a live recording.
+
+    Attributes:
+        path: WAV file with the segment audio.
+        index: Position in the recording (0-based).
+        start_seconds: Start time within the full recording.
+        end_seconds: End time within the full recording.
+        final: True for the tail written when recording stopped.
+    """
+    path: str
+    index: int
+    start_seconds: float
+    end_seconds: float
+    final: bool = False
+
+
+class PauseSegmenter:
+    """
+    Finds cut points at pauses in a live audio stream.
+
+    Audio is analysed in 20 ms windows. A window is silent when its RMS is
+    below `silence_ratio` times the recent noise floor (10th percentile of
+    the last 10 s) and below half the recent median level. Once a segment
+    is at least `min_segment_seconds` long, it is cut inside the next pause
+    of `pause_seconds`, leaving half the pause on each side. If no
+    pause comes, it is cut at the quietest window of the last 2 s once it
+    reaches `max_segment_seconds`.
+    """
+
+    WINDOW_SECONDS = 0.02
+    NOISE_FLOOR_SECONDS = 10.0
+    NOISE_FLOOR_PERCENTILE = 10
+    # Absolute RMS below which audio always counts as silence (about -50 dBFS)
+    MIN_SILENCE_RMS = 0.003
+    FORCED_CUT_LOOKBACK_SECONDS = 2.0
+
+    def __init__(self, sample_rate: int, min_segment_seconds: float = 30.0,
+                 max_segment_seconds: Optional[float] = None, pause_seconds: float = 0.5,
+                 silence_ratio: float = 2.0):
+        """
+        Initialize the segmenter.
+
+        Args:
+            sample_rate: Sample rate of the fed audio
+            min_segment_seconds: Shortest segment worth transcribing on its own
+            max_segment_seconds: Force a cut after this long (default: 3x min)
+            pause_seconds: Silence needed for a natural cut
+            silence_ratio: Silence threshold relative to the noise floor
+        """
+        self.sample_rate = sample_rate
+        self.window = max(1, int(sample_rate * self.WINDOW_SECONDS))
+        self.min_segment = int(min_segment_seconds * sample_rate)
+        self.max_segment = int((max_segment_seconds or min_segment_seconds * 3) * sample_rate)
+        self.pause = int(pause_seconds * sample_rate)
+        self.silence_ratio = silence_ratio
+
+        self._leftover = np.zeros(0, dtype=np.float32)
+        self._position = 0  # absolute sample index of the next window
+        self._segment_start = 0
+        self._silence_start: Optional[int] = None
+        self._floor_history: deque = deque(maxlen=int(self.NOISE_FLOOR_SECONDS / self.WINDOW_SECONDS))
+        self._recent: deque = deque(maxlen=int(self.FORCED_CUT_LOOKBACK_SECONDS / self.WINDOW_SECONDS))
+
+    def _threshold(self) -> float:
+        """Current silence threshold."""
+        if not self._floor_history:
+            return self.MIN_SILENCE_RMS
+        floor, median = np.percentile(self._floor_history, [self.NOISE_FLOOR_PERCENTILE, 50])
+        # Without gaps in the history the floor is speech level; the median cap keeps speech loud
+        return max(self.MIN_SILENCE_RMS, min(float(floor) * self.silence_ratio, float(median) * 0.5))
+
+    def feed(self, samples: np.ndarray) -> List[int]:
+        """
+        Analyse new audio.
+
+        Args:
+            samples: New mono float32 samples (continuing the previous call)
+
+        Returns:
+            Absolute sample positions where the stream should be cut
+        """
+        data = np.concatenate([self._leftover, samples.astype(np.float32, copy=False)])
+        n_windows = len(data) // self.window
+        self._leftover = data[n_windows * self.window:]
+        if n_windows == 0:
+            return []
+
+        rms = np.sqrt(np.mean(data[:n_windows * self.window].reshape(n_windows, self.window) ** 2, axis=1))
+        cuts = []
+        for value in rms:
+            start = self._position
+            end = start + self.window
+            self._position = end
+            threshold = self._threshold()
+            self._floor_history.append(value)
+            self._recent.append((value, start))
+
+            if value < threshold:
+                if self._silence_start is None:
+                    self._silence_start = start
+                long_enough = end - self._segment_start >= self.min_segment
+                if long_enough and end - self._silence_start >= self.pause:
+                    cuts.append(self._cut(end - self.pause // 2))
+                continue
+
+            self._silence_start = None
+            if end - self._segment_start >= self.max_segment:
+                # No pause found: cut at the quietest recent window
+                quietest = min(self._recent, key=lambda item: item[0])[1]
+                cuts.append(self._cut(max(quietest + self.window // 2, self._segment_start + 1)))
+
+        return cuts
+
+    def _cut(self, position: int) -> int:
+        """Start a new segment at `position`."""
+        self._segment_start = position
+        self._silence_start = None
+        self._recent.clear()
+        return position
+
+
+class SpeculativeSession:
+    """
+    Collects background transcriptions of recorded segments.
+
+    on_segment() is called from the recorder thread; `submit` starts the
+    transcription (e.g. on the app's event loop) and returns a future.
+    """
+
+    def __init__(self, submit: Callable[[RecordedSegment], concurrent.futures.Future]):
+        """
+        Initialize the session.
+
+        Args:
+            submit: Starts transcription of a segment and returns a future of
+                TranscriptionResult (or None on failure)
+        """
+        self._submit = submit
+        self._lock = threading.Lock()
+        self._jobs: List[Tuple[RecordedSegment, concurrent.futures.Future]] = []
+
+    def on_segment(self, segment: RecordedSegment) -> None:
+        """Recorder callback: start transcribing a finished segment."""
+        kind = "tail" if segment.final else "segment"
+        print(f"[SPECULATIVE] {kind} {segment.index}: {segment.start_seconds:.1f}s - {segment.end_seconds:.1f}s")
+        future = self._submit(segment)
+        with self._lock:
+            self._jobs.append((segment, future))
+
+    @property
+    def has_segments(self) -> bool:
+        """True if the recording was split into background segments."""
+        with self._lock:
+            return bool(self._jobs)
+
+    def _ordered_jobs(self) -> List[Tuple[RecordedSegment, concurrent.futures.Future]]:
+        with self._lock:
+            return sorted(self._jobs, key=lambda job: job[0].index)
+
+    async def collect_async(self) -> Optional[TranscriptionResult]:
+        """
+        Wait for all segment transcriptions and stitch them in order.
+
+        Returns:
+            Stitched TranscriptionResult, or None if any segment failed
+        """
+        jobs = self._ordered_jobs()
+        results = await asyncio.gather(
+            *(asyncio.wrap_future(future) for _, future in jobs), return_exceptions=True
+        )
+        return self._stitch([(segment, result) for (segment, _), result in zip(jobs, results)])
+
+    @staticmethod
+    def _stitch(parts: List[Tuple[RecordedSegment, object]]) -> Optional[TranscriptionResult]:
+        """Join segment results; segment timestamps are moved to the full recording's timeline."""
+        texts = []
+        segments: Optional[list] = []
+        for segment, result in parts:
+            if not isinstance(result, TranscriptionResult):
+                print(f"[SPECULATIVE] Segment {segment.index} failed: {result}")
+                return None
+            if result.text.strip():
+                texts.append(result.text.strip())
+            if result.segments is None:
+                segments = None
+            elif segments is not None:
+                segments.extend(result.offset_segments(segment.start_seconds).segments)
+        return TranscriptionResult(text=" ".join(texts), segments=segments)
+
+    def cleanup(self) -> None:
+        """Delete the segment files (the full recording is kept)."""
+        for segment, future in self._ordered_jobs():
+            if not future.done():
+                continue
+            get_audio_handoff().discard(segment.path)
+            try:
+                Path(segment.path).unlink()
+            except OSError:
+                pass
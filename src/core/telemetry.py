@@ -0,0 +1,272 @@
+"""
+Telemetry Module - Per-request upload telemetry for Groq calls.
+
+Every transcription request records bytes uploaded, time-to-first-byte,
+total latency, retries, HTTP status and audio duration. Recent records
+are kept in a ring buffer with p50/p95/p99 aggregates.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass
+class RequestRecord:
+    """
+    Telemetry for one logical transcription request (including retries).
+
+    Attributes:
+        file_name: Name of the uploaded audio file.
+        endpoint: "transcriptions" or "translations".
+        started_at: Wall-clock start time (epoch seconds).
+        audio_seconds: Duration of the uploaded audio.
+        file_bytes: Size of the audio file.
+        bytes_uploaded: Bytes actually sent (sums all attempts).
+        ttfb_seconds: Time from sending the last attempt to its response headers.
+        latency_seconds: Total time including retries and rate-limit waits.
+        retries: Number of attempts after the first one.
+        status: HTTP status of the last response (None if no response).
+        success: True if a transcript was returned.
+        hedged: True if a duplicate (hedge) request was sent.
+    """
+    file_name: str
+    endpoint: str
+    started_at: float
+    audio_seconds: float = 0.0
+    file_bytes: int = 0
+    bytes_uploaded: int = 0
+    ttfb_seconds: Optional[float] = None
+    latency_seconds: float = 0.0
+    retries: int = 0
+    status: Optional[int] = None
+    success: bool = False
+    hedged: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for JSON (UI / job_meta.json)."""
+        data = asdict(self)
+        for key in ("audio_seconds", "latency_seconds"):
+            data[key] = round(data[key], 3)
+        if data["ttfb_seconds"] is not None:
+            data["ttfb_seconds"] = round(data["ttfb_seconds"], 3)
+        return data
+
+
+class RequestTrace:
+    """
+    Mutable in-flight state of a request, filled in by the httpx event hooks.
+
+    The active trace is held in a context variable, so concurrent requests on
+    different threads (or asyncio tasks) each update their own trace.
+    """
+
+    def __init__(self, record: RequestRecord):
+        self.record = record
+        self._start = time.perf_counter()
+        self._sent_at: Optional[float] = None
+
+    def on_request(self) -> None:
+        """Request is about to be sent (start of upload)."""
+        self._sent_at = time.perf_counter()
+
+    def on_response(self, status: int) -> None:
+        """Response headers received."""
+        if self._sent_at is not None:
+            self.record.ttfb_seconds = time.perf_counter() - self._sent_at
+        self.record.status = status
+
+    def elapsed(self) -> float:
+        """Seconds since the trace was started."""
+        return time.perf_counter() - self._start
+
+
+_active_trace: contextvars.ContextVar[Optional[RequestTrace]] = contextvars.ContextVar(
+    "groqwhisper_active_trace", default=None
+)
+_last_record: contextvars.ContextVar[Optional[RequestRecord]] = contextvars.ContextVar(
+    "groqwhisper_last_record", default=None
+)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Linear-interpolated percentile of a list of numbers.
+
+    Args:
+        values: Numbers (need not be sorted)
+        pct: Percentile in range 0-100
+
+    Returns:
+        Percentile value, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (pct / 100.0) * (len(ordered) - 1)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class UploadTelemetry:
+    """Ring buffer of recent request records with percentile aggregates."""
+
+    RING_SIZE = 500
+
+    def __init__(self, ring_size: int = RING_SIZE):
+        """
+        Initialize telemetry.
+
+        Args:
+            ring_size: Number of recent records to keep
+        """
+        self._lock = threading.Lock()
+        self._records: deque = deque(maxlen=ring_size)
+        self._total_requests = 0
+
+    def start(self, file_name: str, endpoint: str, audio_seconds: float = 0.0,
+              file_bytes: int = 0) -> RequestTrace:
+        """
+        Start tracing a request and make it the active trace for this context.
+
+        Returns:
+            RequestTrace to pass to finish()
+        """
+        record = RequestRecord(
+            file_name=file_name,
+            endpoint=endpoint,
+            started_at=time.time(),
+            audio_seconds=audio_seconds,
+            file_bytes=file_bytes,
+        )
+        trace = RequestTrace(record)
+        _active_trace.set(trace)
+        return trace
+
+    def finish(self, trace: RequestTrace, success: bool) -> RequestRecord:
+        """
+        Finish a trace and store its record in the ring buffer.
+
+        Returns:
+            The completed RequestRecord
+        """
+        record = trace.record
+        record.latency_seconds = trace.elapsed()
+        record.success = success
+        _active_trace.set(None)
+        _last_record.set(record)
+
+        with self._lock:
+            self._records.append(record)
+            self._total_requests += 1
+        return record
+
+    def get_records(self, limit: Optional[int] = None) -> List[RequestRecord]:
+        """Get recent records, oldest first."""
+        with self._lock:
+            records = list(self._records)
+        return records[-limit:] if limit else records
+
+    def summary(self, records: Optional[Iterable[RequestRecord]] = None) -> Dict[str, Any]:
+        """
+        Aggregate records into p50/p95/p99 latency and TTFB statistics.
+
+        Args:
+            records: Records or record dicts to aggregate (default: the whole ring buffer)
+
+        Returns:
+            Summary dict
+        """
+        records = self.get_records() if records is None else [
+            r if isinstance(r, RequestRecord) else RequestRecord(**r) for r in records
+        ]
+        latencies = [r.latency_seconds for r in records]
+        ttfbs = [r.ttfb_seconds for r in records if r.ttfb_seconds is not None]
+        uploaded = sum(r.bytes_uploaded for r in records)
+        upload_time = sum(r.latency_seconds for r in records if r.bytes_uploaded)
+
+        def pcts(values: List[float]) -> Dict[str, Optional[float]]:
+            return {
+                f"p{p}": (round(v, 3) if v is not None else None)
+                for p, v in ((50, percentile(values, 50)), (95, percentile(values, 95)), (99, percentile(values, 99)))
+            }
+
+        return {
+            "count": len(records),
+            "success_count": sum(1 for r in records if r.success),
+            "retries": sum(r.retries for r in records),
+            "hedged": sum(1 for r in records if r.hedged),
+            "bytes_uploaded": uploaded,
+            "audio_seconds": round(sum(r.audio_seconds for r in records), 1),
+            "throughput_mb_per_second": round(uploaded / (1024 * 1024) / upload_time, 3) if upload_time else None,
+            "latency_seconds": pcts(latencies),
+            "ttfb_seconds": pcts(ttfbs),
+        }
+
+    def get_stats(self, recent: int = 20) -> Dict[str, Any]:
+        """Get summary plus the most recent records (for the Api)."""
+        with self._lock:
+            total = self._total_requests
+        return {
+            "total_requests": total,
+            "summary": self.summary(),
+            "recent": [r.to_dict() for r in self.get_records(recent)],
+        }
+
+
+def get_active_trace() -> Optional[RequestTrace]:
+    """Get the trace of the request running in the current context."""
+    return _active_trace.get()
+
+
+def get_last_record() -> Optional[RequestRecord]:
+    """Get the record of the last request finished in the current context (thread/task)."""
+    return _last_record.get()
+
+
+def _on_request(request) -> None:
+    """httpx request hook: marks the start of the upload."""
+    trace = _active_trace.get()
+    if trace is not None:
+        trace.on_request()
+
+
+def _on_response(response) -> None:
+    """httpx response hook: marks arrival of the response headers."""
+    trace = _active_trace.get()
+    if trace is not None:
+        trace.on_response(response.status_code)
+
+
+def httpx_event_hooks() -> Dict[str, list]:
+    """Event hooks to install on the shared httpx client."""
+    return {"request": [_on_request], "response": [_on_response]}
+
+
+async def _on_request_async(request) -> None:
+    """httpx.AsyncClient request hook."""
+    _on_request(request)
+
+
+async def _on_response_async(response) -> None:
+    """httpx.AsyncClient response hook."""
+    _on_response(response)
+
+
+def async_httpx_event_hooks() -> Dict[str, list]:
+    """Event hooks to install on the shared httpx.AsyncClient (hooks must be coroutines)."""
+    return {"request": [_on_request_async], "response": [_on_response_async]}
+
+
+_telemetry = UploadTelemetry()
+
+
+def get_telemetry() -> UploadTelemetry:
+    """Get the process-wide upload telemetry."""
+    return _telemetry
@@ -3,35 +3,136 @@ Groq Transcriber Module - Speech-to-text conversion using Groq API.
 Uses whisper-large-v3 model for high accuracy transcription.
 """
 
+import asyncio
+import os
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-from groq import Groq
+from groq import APIStatusError, Groq, RateLimitError
 import sys
 
 # Add parent directory for config import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import Config
+from core.audio_handoff import get_audio_handoff
+from core.circuit_breaker import CircuitOpenError, get_adaptive_timeout, get_circuit_breaker
+from core.groq_client import get_async_groq_client, get_groq_client
+from core.hedging import get_hedge_policy
+from core.rate_limiter import get_scheduler
+from core.telemetry import get_active_trace, get_telemetry, RequestTrace
+from core.transcript_cache import get_transcript_cache
+from core.transcription_backend import TranscriptionBackend, TranscriptionResult
+
+
+def _parse_segments(raw_segments) -> list:
+    """Keep only the segment fields we use from a verbose_json response."""
+    segments = []
+    for seg in raw_segments or []:
+        if not isinstance(seg, dict):
+            seg = seg.model_dump() if hasattr(seg, "model_dump") else dict(seg)
+        segments.append({
+            "start": float(seg.get("start", 0.0)),
+            "end": float(seg.get("end", 0.0)),
+            "text": (seg.get("text") or "").strip(),
+            "no_speech_prob": float(seg.get("no_speech_prob", 0.0)),
+        })
+    return segments
+
+
+class UploadStream:
+    """
+    Read-only file wrapper handed to the SDK for streaming uploads.
+
+    httpx pulls the multipart body from this object in small chunks, so
+    the audio is streamed from disk instead of being copied into memory.
+    Each read is capped at MAX_READ_BYTES, which bounds the upload buffer
+    per request regardless of file size.
+    """
+
+    MAX_READ_BYTES = 1024 * 1024  # 1 MiB
+
+    def __init__(self, fileobj):
+        """
+        Wrap an open binary file.
+
+        Args:
+            fileobj: File opened in "rb" mode
+        """
+        self._file = fileobj
+        self.bytes_read = 0
+        self.peak_read_bytes = 0
+
+    @property
+    def name(self) -> str:
+        """Underlying file name."""
+        return self._file.name
+
+    def read(self, size: int = -1) -> bytes:
+        """Read at most MAX_READ_BYTES and track upload statistics."""
+        if size is None or size < 0 or size > self.MAX_READ_BYTES:
+            size = self.MAX_READ_BYTES
+        data = self._file.read(size)
+        self.bytes_read += len(data)
+        self.peak_read_bytes = max(self.peak_read_bytes, len(data))
+        return data
 
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Seek in the underlying file (httpx rewinds before sending)."""
+        return self._file.seek(offset, whence)
 
-class GroqTranscriber:
+    def tell(self) -> int:
+        """Current position in the underlying file."""
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        """File descriptor (lets httpx get Content-Length via fstat; in-memory audio raises, httpx then seeks)."""
+        return self._file.fileno()
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+
+@dataclass
+class RetryState:
+    """Attempts used by one transcription request."""
+    attempt: int = 0  # Failed attempts (network/server errors)
+    rate_limit_waits: int = 0  # 429 responses (do not use up an attempt)
+
+
+class GroqTranscriber(TranscriptionBackend):
     """
     Transcribes audio files using Groq's Whisper API.
 
     Features:
     - Uses whisper-large-v3 model (best accuracy)
     - Automatic API key loading from .env
+    - Shared pooled HTTP client (warm connections across instances)
     - Retry logic for network failures
+    - Shared rate-limit scheduler (429s are queued, not failed)
+    - Content-addressed transcript cache (identical audio is never re-uploaded)
+    - Streaming uploads from disk (bounded memory per request), or from
+      in-memory FLAC handed over by the recorder
+    - Per-request upload telemetry (latency, TTFB, bytes, retries)
+    - Optional segment timestamps (verbose_json) at no extra API cost
+    - Optional hedged requests for short latency-sensitive dictations
+    - Circuit breaker (fails fast or reroutes to the local backend while Groq is down)
+    - Adaptive per-request timeouts from observed latency per MB
     - Turkish language support
     - Error handling for invalid API keys
     """
 
+    NAME = "groq"
+
     # Groq model to use
     MODEL = "whisper-large-v3"
 
     # Retry configuration
     MAX_RETRIES = 3
     RETRY_DELAY = 1.0  # seconds
+    MAX_RATE_LIMIT_WAITS = 10  # 429 responses tolerated per request before giving up
 
     # Groq API file size limit (25 MB)
     MAX_FILE_SIZE_MB = 25
@@ -44,6 +145,7 @@ class GroqTranscriber:
         Args:
             api_key: Groq API key (if None, loads from Config)
         """
+        explicit_key = api_key is not None
         if api_key is None:
             config = Config()
             api_key = config.get_api_key()
@@ -54,7 +156,26 @@ class GroqTranscriber:
                 "or pass api_key parameter."
             )
 
-        self.client = Groq(api_key=api_key)
+        # Explicit keys are pinned; otherwise follow the configured key
+        self._api_key = api_key if explicit_key else None
+        self.scheduler = get_scheduler()
+        self.telemetry = get_telemetry()
+        self.hedge_policy = get_hedge_policy()
+        self.breaker = get_circuit_breaker()
+        self.adaptive_timeout = get_adaptive_timeout()
+
+        # Backend used while the circuit is open (CIRCUIT_FALLBACK=local), created on first use
+        self._fallback = None
+        self._fallback_unavailable = False
+        self._fallback_lock = threading.Lock()
+
+        # Upload statistics of the last request, per calling thread
+        self._local = threading.local()
+
+    @property
+    def client(self) -> Groq:
+        """Shared pooled Groq client (rebuilt by the registry when the key changes)."""
+        return get_groq_client(self._api_key)
 
     def _check_file_size(self, audio_file_path: str) -> bool:
         """
@@ -66,7 +187,7 @@ class GroqTranscriber:
         Returns:
             True if file size is acceptable, False if too large
         """
-        file_size_bytes = Path(audio_file_path).stat().st_size
+        file_size_bytes = get_audio_handoff().size(audio_file_path)
         file_size_mb = file_size_bytes / (1024 * 1024)
 
         print(f"[INFO] Audio file size: {file_size_mb:.2f} MB")
@@ -91,6 +212,11 @@ class GroqTranscriber:
         Returns:
             Duration in seconds
         """
+        # Recordings handed over in memory know their duration
+        duration = get_audio_handoff().duration(filepath)
+        if duration is not None:
+            return duration
+
         file_ext = Path(filepath).suffix.lower()
         print(f"[DEBUG] Getting duration for: {filepath} (format: {file_ext})")
 
@@ -134,53 +260,306 @@ class GroqTranscriber:
             print(f"[ERROR] soundfile failed: {e}")
             return 0.0
 
-    def transcribe(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False) -> Optional[str]:
+    def transcribe_detailed(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False,
+                            with_segments: bool = False, latency_sensitive: bool = False) -> Optional[TranscriptionResult]:
         """
-        Transcribe an audio file using Groq's Whisper API.
+        Transcribe an audio file, optionally with segment timestamps.
 
         Args:
             audio_file_path: Path to the audio file (.wav, .mp3, etc.)
             language: Language code (default: "tr" for Turkish)
             translate: If True, translate to English instead of transcribing
+            with_segments: If True, request verbose_json and keep segment timings
+            latency_sensitive: If True, small uploads may be hedged (see HedgePolicy)
 
         Returns:
-            Transcribed/translated text as string, or None if failed
+            TranscriptionResult, or None if failed
         """
         # Validate file exists
-        if not Path(audio_file_path).exists():
+        if not get_audio_handoff().exists(audio_file_path):
             print(f"Error: Audio file not found: {audio_file_path}")
             return None
 
+        # Return cached transcript for identical audio + options
+        cache, cache_key, cached = self._lookup_cache(audio_file_path, language, translate, with_segments)
+        if cached is not None:
+            return cached
+
         # Check file size before attempting transcription
         if not self._check_file_size(audio_file_path):
             return None
 
-        # Try transcription with retry logic
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                result = self._transcribe_once(audio_file_path, language, translate)
-                return result
+        # Audio duration counts against the audio-seconds-per-hour budget
+        audio_seconds = self.get_audio_duration(audio_file_path)
+
+        file_bytes = get_audio_handoff().size(audio_file_path)
+        trace = self._start_trace(audio_file_path, translate, audio_seconds, file_bytes)
+        response_format = "verbose_json" if with_segments else "text"
+        circuit_open = False
+        try:
+            if latency_sensitive and self.hedge_policy.applies_to(file_bytes):
+                result = self.hedge_policy.run(
+                    primary=lambda: self._transcribe_with_retries(
+                        audio_file_path, language, translate, audio_seconds, trace, response_format
+                    ),
+                    hedge=lambda: self._transcribe_hedge(audio_file_path, language, translate, response_format),
+                    audio_seconds=audio_seconds,
+                    on_hedge=lambda: setattr(trace.record, "hedged", True),
+                )
+            else:
+                result = self._transcribe_with_retries(
+                    audio_file_path, language, translate, audio_seconds, trace, response_format
+                )
+        except CircuitOpenError as e:
+            print(f"[CIRCUIT] {e}")
+            result = None
+            circuit_open = True
+        self._finish_trace(trace, result)
+
+        if circuit_open:
+            return self._transcribe_fallback(audio_file_path, language, translate, with_segments)
+
+        if cache_key is not None and result:
+            cache.put(cache_key, {"text": result.text, "segments": result.segments})
+        return result
+
+    def _lookup_cache(self, audio_file_path: str, language: Optional[str], translate: bool,
+                      with_segments: bool) -> tuple:
+        """
+        Look up the transcript cache for identical audio + options.
+
+        Returns:
+            Tuple (cache or None, cache key or None, cached TranscriptionResult or None)
+        """
+        cache = get_transcript_cache()
+        if cache is None:
+            return None, None, None
+        try:
+            data = get_audio_handoff().get_bytes(audio_file_path)
+            content_hash = cache.hash_bytes(data) if data is not None else cache.hash_file(audio_file_path)
+            cache_key = cache.make_key(content_hash, self.MODEL, language, translate)
+        except OSError as e:
+            print(f"[CACHE] Warning: Could not hash audio file: {e}")
+            return cache, None, None
+
+        cached = cache.get(cache_key, required_field="segments" if with_segments else None)
+        if cached is None:
+            return cache, cache_key, None
+        print(f"[CACHE] Hit for {Path(audio_file_path).name}, skipping upload")
+        return cache, cache_key, TranscriptionResult(text=cached["text"], segments=cached.get("segments"))
+
+    def _start_trace(self, audio_file_path: str, translate: bool, audio_seconds: float,
+                     file_bytes: int) -> RequestTrace:
+        """Start the telemetry trace of a request in the current context."""
+        return self.telemetry.start(
+            file_name=Path(audio_file_path).name,
+            endpoint="translations" if translate else "transcriptions",
+            audio_seconds=audio_seconds,
+            file_bytes=file_bytes,
+        )
+
+    def _transcribe_with_retries(self, audio_file_path: str, language: Optional[str], translate: bool,
+                                 audio_seconds: float, trace: RequestTrace,
+                                 response_format: str = "text") -> Optional[TranscriptionResult]:
+        """
+        Run the request/retry loop for one transcription.
+
+        Args:
+            audio_file_path: Path to the audio file
+            language: Language code for transcription
+            translate: If True, translate to English
+            audio_seconds: Audio duration (for the rate-limit budget)
+            trace: Telemetry trace of this request
+            response_format: "text" or "verbose_json"
 
+        Returns:
+            TranscriptionResult, or None if failed
+
+        Raises:
+            CircuitOpenError: If the circuit is open (no further attempts are made)
+        """
+        retry = RetryState()
+        while True:
+            try:
+                return self._guarded_attempt(audio_file_path, language, translate, response_format, audio_seconds)
+            except CircuitOpenError:
+                raise
             except Exception as e:
-                error_msg = str(e).lower()
-
-                # API key error - don't retry
-                if "unauthorized" in error_msg or "api key" in error_msg or "401" in error_msg:
-                    print(f"Error: Invalid Groq API key. Please check your GROQ_API_KEY.")
-                    return None
-
-                # Network error - retry with backoff
-                if attempt < self.MAX_RETRIES - 1:
-                    wait_time = self.RETRY_DELAY * (2 ** attempt)  # Exponential backoff
-                    print(f"Network error, retrying in {wait_time}s... (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                    time.sleep(wait_time)
+                delay = self._retry_delay(e, retry, trace)
+            if delay is None:
+                return None
+            if delay > 0:
+                time.sleep(delay)
+
+    def _retry_delay(self, error: Exception, retry: RetryState, trace: RequestTrace) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt (shared by the sync and async loops).
+
+        Args:
+            error: Exception raised by the attempt
+            retry: Retry counters of this request (updated)
+            trace: Telemetry trace of this request
+
+        Returns:
+            Seconds to sleep before the next attempt (0 after a rate limit, whose pause the
+            scheduler applies), or None to give up
+
+        Raises:
+            CircuitOpenError: If the circuit opened (no further attempts are made)
+        """
+        if isinstance(error, RateLimitError):
+            # Rate limit - wait as long as the server asks, without using up a retry
+            retry.rate_limit_waits += 1
+            if retry.rate_limit_waits > self.MAX_RATE_LIMIT_WAITS:
+                print(f"Error: Still rate limited after {self.MAX_RATE_LIMIT_WAITS} waits, giving up.")
+                return None
+            self.scheduler.report_rate_limited(error.response.headers)
+            trace.record.retries += 1
+            return 0.0
+
+        error_msg = str(error).lower()
+
+        # API key error - don't retry
+        if "unauthorized" in error_msg or "api key" in error_msg or "401" in error_msg:
+            print(f"Error: Invalid Groq API key. Please check your GROQ_API_KEY.")
+            return None
+
+        # Circuit opened by this or a parallel failure - stop instead of sleeping
+        if self.breaker.state == self.breaker.OPEN:
+            raise CircuitOpenError(f"Groq circuit opened after: {error}")
+
+        # Network error - retry with backoff
+        retry.attempt += 1
+        if retry.attempt >= self.MAX_RETRIES:
+            print(f"Error: Transcription failed after {self.MAX_RETRIES} attempts: {error}")
+            return None
+        wait_time = self.RETRY_DELAY * (2 ** (retry.attempt - 1))  # Exponential backoff
+        print(f"Network error, retrying in {wait_time}s... (attempt {retry.attempt}/{self.MAX_RETRIES})")
+        trace.record.retries += 1
+        return wait_time
+
+    def _guarded_attempt(self, audio_file_path: str, language: Optional[str], translate: bool,
+                         response_format: str = "text", audio_seconds: Optional[float] = None) -> TranscriptionResult:
+        """
+        One attempt through the circuit breaker, with an adaptive timeout.
+
+        Args:
+            audio_file_path: Path to the audio file
+            language: Language code for transcription
+            translate: If True, translate to English
+            response_format: "text" or "verbose_json"
+            audio_seconds: Audio duration to charge to the rate-limit budget (None if already charged)
+
+        Returns:
+            TranscriptionResult
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+            Exception: If the API call fails
+        """
+        self._check_circuit()
+
+        try:
+            if audio_seconds is not None:
+                self.scheduler.acquire(audio_seconds)
+            timeout = self.adaptive_timeout.timeout_for(get_audio_handoff().size(audio_file_path))
+            result = self._transcribe_once(audio_file_path, language, translate, response_format, timeout)
+        except Exception as e:
+            self._record_attempt_error(e)
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    def _check_circuit(self) -> None:
+        """
+        Raise if the circuit breaker rejects a new attempt.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a half-open probe is running)
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(
+                f"Groq circuit is {self.breaker.state}, failing fast "
+                f"(next probe in {self.breaker.retry_in():.0f}s)"
+            )
+
+    def _record_attempt_error(self, error: BaseException) -> None:
+        """Report a failed attempt to the circuit breaker."""
+        if isinstance(error, APIStatusError):
+            # 4xx (incl. 429): the service answered, so it is up
+            if error.status_code < 500:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure(error)
+        elif isinstance(error, (OSError, ValueError)):
+            # Local file problem, says nothing about the service
+            self.breaker.release()
+        else:
+            # Connection errors and timeouts
+            self.breaker.record_failure(error)
+
+    def _transcribe_fallback(self, audio_file_path: str, language: Optional[str], translate: bool,
+                             with_segments: bool) -> Optional[TranscriptionResult]:
+        """
+        Reroute a request rejected by the open circuit.
+
+        Uses the local backend if CIRCUIT_FALLBACK=local, otherwise fails fast.
+
+        Returns:
+            TranscriptionResult from the fallback backend, or None
+        """
+        with self._fallback_lock:
+            if self._fallback is None and not self._fallback_unavailable:
+                config = Config()
+                if config.get_circuit_fallback() == "local":
+                    try:
+                        from core.local_transcriber import LocalWhisperTranscriber
+                        self._fallback = LocalWhisperTranscriber(
+                            model_size=config.get_local_model(),
+                            compute_type=config.get_local_compute_type(),
+                            workers=config.get_local_workers(),
+                        )
+                    except ValueError as e:
+                        print(f"[CIRCUIT] Local fallback unavailable: {e}")
+                        self._fallback_unavailable = True
                 else:
-                    print(f"Error: Transcription failed after {self.MAX_RETRIES} attempts: {e}")
-                    return None
+                    self._fallback_unavailable = True
+            fallback = self._fallback
+
+        if fallback is None:
+            print(f"[CIRCUIT] No fallback backend, {Path(audio_file_path).name} failed fast")
+            return None
 
+        print(f"[CIRCUIT] Rerouting {Path(audio_file_path).name} to local backend")
+        return fallback.transcribe_detailed(audio_file_path, language, translate, with_segments)
+
+    def _transcribe_hedge(self, audio_file_path: str, language: Optional[str], translate: bool,
+                          response_format: str = "text") -> Optional[TranscriptionResult]:
+        """
+        Single duplicate attempt sent by the hedge policy (budget already taken).
+
+        Returns:
+            TranscriptionResult, or None if the attempt failed
+        """
+        try:
+            return self._guarded_attempt(audio_file_path, language, translate, response_format)
+        except RateLimitError as e:
+            self.scheduler.report_rate_limited(e.response.headers)
+        except Exception as e:
+            print(f"[HEDGE] Hedge request failed: {e}")
         return None
 
-    def _transcribe_once(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False) -> str:
+    def _finish_trace(self, trace: RequestTrace, result) -> None:
+        """Store the request record in telemetry and log a one-line summary."""
+        record = self.telemetry.finish(trace, success=bool(result))
+        ttfb = f"{record.ttfb_seconds:.2f}s" if record.ttfb_seconds is not None else "n/a"
+        print(f"[TELEMETRY] {record.file_name}: {record.bytes_uploaded / (1024 * 1024):.2f} MB, "
+              f"latency {record.latency_seconds:.2f}s, ttfb {ttfb}, retries {record.retries}, "
+              f"status {record.status}")
+
+    def _transcribe_once(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False,
+                         response_format: str = "text", timeout: Optional[float] = None) -> TranscriptionResult:
         """
         Perform a single transcription/translation attempt.
 
@@ -188,48 +567,256 @@ class GroqTranscriber:
             audio_file_path: Path to the audio file
             language: Language code for transcription
             translate: If True, translate to English
+            response_format: "text", or "verbose_json" to also get segment timings
+            timeout: Request timeout in seconds (None for the client default)
 
         Returns:
-            Transcribed or translated text
+            TranscriptionResult with transcribed or translated text
 
         Raises:
             Exception: If API call fails
         """
         print(f"[DEBUG] Transcriber: Processing file: {audio_file_path}")
 
-        # Read audio file
-        with open(audio_file_path, "rb") as audio_file:
+        # Open audio file (streamed to the API, never read into memory as a whole),
+        # or the in-memory FLAC handed over by the recorder
+        with get_audio_handoff().open(audio_file_path) as audio_file:
             # Get file size for validation
-            audio_file.seek(0, 2)
-            file_size = audio_file.tell()
-            audio_file.seek(0)
+            file_size = get_audio_handoff().size(audio_file_path)
 
             if file_size == 0:
                 raise ValueError("Audio file is empty")
 
             # Create filename for API (Groq needs the original filename)
             filename = Path(audio_file_path).name
+            upload = UploadStream(audio_file)
+
+            api_params = self._build_api_params(filename, upload, language, translate, response_format, timeout)
+
+            try:
+                # Use translations API if translate is True, otherwise transcriptions
+                if translate:
+                    result = self.client.audio.translations.create(**api_params)
+                else:
+                    result = self.client.audio.transcriptions.create(**api_params)
+            finally:
+                self._record_upload(upload)
+
+        return self._to_result(result, response_format)
+
+    def _build_api_params(self, filename: str, upload: UploadStream, language: Optional[str], translate: bool,
+                          response_format: str, timeout: Optional[float]) -> dict:
+        """Build keyword arguments for the transcriptions/translations create() call."""
+        api_params = {
+            "file": (filename, upload),
+            "model": self.MODEL,
+            "response_format": response_format
+        }
+        if timeout is not None:
+            api_params["timeout"] = timeout
+
+        # Translations API converts to English (doesn't accept language param)
+        # Transcriptions API: only include language parameter if not None (auto-detect)
+        if not translate and language is not None:
+            api_params["language"] = language
+        return api_params
+
+    @staticmethod
+    def _to_result(response, response_format: str) -> TranscriptionResult:
+        """Convert an API response (str or verbose_json object) to a TranscriptionResult."""
+        if response_format == "verbose_json":
+            return TranscriptionResult(text=response.text.strip(), segments=_parse_segments(getattr(response, "segments", None)))
+        return TranscriptionResult(text=response)
+
+    async def transcribe_detailed_async(self, audio_file_path: str, language: Optional[str] = "tr",
+                                        translate: bool = False, with_segments: bool = False,
+                                        latency_sensitive: bool = False) -> Optional[TranscriptionResult]:
+        """
+        Coroutine version of transcribe_detailed() using the shared AsyncGroq client.
+
+        Hashing and duration probing run in worker threads; the upload itself
+        is a task on the event loop, so concurrent requests cost no threads.
+
+        Args:
+            audio_file_path: Path to the audio file (.wav, .mp3, etc.)
+            language: Language code (default: "tr" for Turkish)
+            translate: If True, translate to English instead of transcribing
+            with_segments: If True, request verbose_json and keep segment timings
+            latency_sensitive: If True, small uploads may be hedged (the losing request is cancelled)
+
+        Returns:
+            TranscriptionResult, or None if failed
+        """
+        if not get_audio_handoff().exists(audio_file_path):
+            print(f"Error: Audio file not found: {audio_file_path}")
+            return None
+
+        cache, cache_key, cached = await asyncio.to_thread(
+            self._lookup_cache, audio_file_path, language, translate, with_segments
+        )
+        if cached is not None:
+            return cached
+
+        if not self._check_file_size(audio_file_path):
+            return None
 
-            # Build API parameters
-            api_params = {
-                "file": (filename, audio_file.read()),
-                "model": self.MODEL,
-                "response_format": "text"
-            }
-
-            # Use translations API if translate is True, otherwise transcriptions
-            if translate:
-                # Translations API converts to English (doesn't accept language param)
-                result = self.client.audio.translations.create(**api_params)
+        audio_seconds = await asyncio.to_thread(self.get_audio_duration, audio_file_path)
+
+        file_bytes = get_audio_handoff().size(audio_file_path)
+        trace = self._start_trace(audio_file_path, translate, audio_seconds, file_bytes)
+        response_format = "verbose_json" if with_segments else "text"
+        circuit_open = False
+        try:
+            if latency_sensitive and self.hedge_policy.applies_to(file_bytes):
+                result = await self.hedge_policy.run_async(
+                    primary=lambda: self._transcribe_with_retries_async(
+                        audio_file_path, language, translate, audio_seconds, trace, response_format
+                    ),
+                    hedge=lambda: self._transcribe_hedge_async(audio_file_path, language, translate, response_format),
+                    audio_seconds=audio_seconds,
+                    on_hedge=lambda: setattr(trace.record, "hedged", True),
+                )
             else:
-                # Transcriptions API returns verbatim text
-                # Only include language parameter if not None (auto-detect)
-                if language is not None:
-                    api_params["language"] = language
-                result = self.client.audio.transcriptions.create(**api_params)
+                result = await self._transcribe_with_retries_async(
+                    audio_file_path, language, translate, audio_seconds, trace, response_format
+                )
+        except CircuitOpenError as e:
+            print(f"[CIRCUIT] {e}")
+            result = None
+            circuit_open = True
+        except asyncio.CancelledError:
+            self._finish_trace(trace, None)
+            raise
+        self._finish_trace(trace, result)
+
+        if circuit_open:
+            return await asyncio.to_thread(
+                self._transcribe_fallback, audio_file_path, language, translate, with_segments
+            )
 
+        if cache_key is not None and result:
+            await asyncio.to_thread(cache.put, cache_key, {"text": result.text, "segments": result.segments})
         return result
 
+    async def _transcribe_with_retries_async(self, audio_file_path: str, language: Optional[str], translate: bool,
+                                             audio_seconds: float, trace: RequestTrace,
+                                             response_format: str = "text") -> Optional[TranscriptionResult]:
+        """
+        Coroutine version of _transcribe_with_retries().
+
+        Raises:
+            CircuitOpenError: If the circuit is open (no further attempts are made)
+        """
+        retry = RetryState()
+        while True:
+            try:
+                return await self._guarded_attempt_async(
+                    audio_file_path, language, translate, response_format, audio_seconds
+                )
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                delay = self._retry_delay(e, retry, trace)
+            if delay is None:
+                return None
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _guarded_attempt_async(self, audio_file_path: str, language: Optional[str], translate: bool,
+                                     response_format: str = "text",
+                                     audio_seconds: Optional[float] = None) -> TranscriptionResult:
+        """
+        Coroutine version of _guarded_attempt().
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+            Exception: If the API call fails
+        """
+        self._check_circuit()
+
+        try:
+            if audio_seconds is not None:
+                await self.scheduler.acquire_async(audio_seconds)
+            timeout = self.adaptive_timeout.timeout_for(get_audio_handoff().size(audio_file_path))
+            result = await self._transcribe_once_async(audio_file_path, language, translate, response_format, timeout)
+        except asyncio.CancelledError:
+            # Cancelled (e.g. lost a hedge race): says nothing about the service
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self._record_attempt_error(e)
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    async def _transcribe_hedge_async(self, audio_file_path: str, language: Optional[str], translate: bool,
+                                      response_format: str = "text") -> Optional[TranscriptionResult]:
+        """Coroutine version of _transcribe_hedge()."""
+        try:
+            return await self._guarded_attempt_async(audio_file_path, language, translate, response_format)
+        except RateLimitError as e:
+            self.scheduler.report_rate_limited(e.response.headers)
+        except Exception as e:
+            print(f"[HEDGE] Hedge request failed: {e}")
+        return None
+
+    async def _transcribe_once_async(self, audio_file_path: str, language: Optional[str] = "tr",
+                                     translate: bool = False, response_format: str = "text",
+                                     timeout: Optional[float] = None) -> TranscriptionResult:
+        """
+        Coroutine version of _transcribe_once() (streams the file with the async client).
+
+        Raises:
+            Exception: If API call fails
+        """
+        print(f"[DEBUG] Transcriber (async): Processing file: {audio_file_path}")
+        client = get_async_groq_client(self._api_key)
+
+        with get_audio_handoff().open(audio_file_path) as audio_file:
+            if get_audio_handoff().size(audio_file_path) == 0:
+                raise ValueError("Audio file is empty")
+
+            filename = Path(audio_file_path).name
+            upload = UploadStream(audio_file)
+            api_params = self._build_api_params(filename, upload, language, translate, response_format, timeout)
+
+            try:
+                if translate:
+                    result = await client.audio.translations.create(**api_params)
+                else:
+                    result = await client.audio.transcriptions.create(**api_params)
+            finally:
+                self._record_upload(upload)
+
+        return self._to_result(result, response_format)
+
+    def _record_upload(self, upload: UploadStream) -> None:
+        """Remember upload statistics of the last request on this thread."""
+        trace = get_active_trace()
+        if trace is not None:
+            trace.record.bytes_uploaded += upload.bytes_read
+
+        self._local.last_upload = {
+            "bytes_uploaded": upload.bytes_read,
+            "peak_buffer_bytes": upload.peak_read_bytes,
+        }
+        print(f"[DEBUG] Uploaded {upload.bytes_read / (1024 * 1024):.2f} MB "
+              f"(peak buffer: {upload.peak_read_bytes / 1024:.0f} KB)")
+
+    def size_limit_mb(self) -> Optional[float]:
+        """Largest upload accepted, with a 1 MB safety margin below the API limit."""
+        return self.MAX_FILE_SIZE_MB - 1
+
+    def get_last_upload_stats(self) -> Optional[dict]:
+        """
+        Get upload statistics of the last request made on the calling thread.
+
+        Returns:
+            Dict with bytes_uploaded and peak_buffer_bytes, or None
+        """
+        return getattr(self._local, "last_upload", None)
+
     def transcribe_with_language(self, audio_file_path: str, language: str = "tr") -> Optional[str]:
         """
         Transcribe with explicit language specification.
@@ -241,26 +828,33 @@ class GroqTranscriber:
         Returns:
             Transcribed text, or None if failed
         """
-        if not Path(audio_file_path).exists():
+        if not get_audio_handoff().exists(audio_file_path):
             print(f"Error: Audio file not found: {audio_file_path}")
             return None
 
-        try:
-            with open(audio_file_path, "rb") as audio_file:
-                filename = Path(audio_file_path).name
-
-                transcription = self.client.audio.transcriptions.create(
-                    file=(filename, audio_file.read()),
-                    model=self.MODEL,
-                    response_format="text",
-                    language=language
-                )
+        audio_seconds = self.get_audio_duration(audio_file_path)
+
+        trace = self.telemetry.start(
+            file_name=Path(audio_file_path).name,
+            endpoint="transcriptions",
+            audio_seconds=audio_seconds,
+            file_bytes=get_audio_handoff().size(audio_file_path),
+        )
+        transcription = None
 
+        try:
+            transcription = self._guarded_attempt(audio_file_path, language, False, "text", audio_seconds).text
             return transcription
 
+        except RateLimitError as e:
+            self.scheduler.report_rate_limited(e.response.headers)
+            print(f"Transcription error: {e}")
+            return None
         except Exception as e:
             print(f"Transcription error: {e}")
             return None
+        finally:
+            self._finish_trace(trace, transcription)
 
     def test_api_key(self) -> bool:
         """
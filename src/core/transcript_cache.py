@@ -0,0 +1,252 @@
+"""
+Transcript Cache Module - Persistent content-addressed transcript cache.
+
+Transcripts are stored on disk keyed by a hash of the audio content plus
+the request options (model, language, translate), so re-uploading or
+re-running the same audio never hits the Groq API twice.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class TranscriptCache:
+    """
+    Size-bounded on-disk LRU cache for transcripts.
+
+    Each entry is a small JSON file named after its key. The file's
+    modification time is the LRU timestamp: hits touch the file, and the
+    oldest entries are evicted once the total size exceeds the limit.
+    """
+
+    # Read size for hashing audio files
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 100):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            max_size_mb: Maximum total size of all entries in megabytes
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        # key -> [size_bytes, last_access]
+        self._index: Dict[str, list] = {}
+        self._total_size = 0
+
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Build the in-memory index from existing entries on disk."""
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            self._index[entry.stem] = [stat.st_size, stat.st_mtime]
+            self._total_size += stat.st_size
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def hash_file(self, audio_file_path: str) -> str:
+        """
+        Hash audio file content (streamed, never fully loaded in memory).
+
+        Args:
+            audio_file_path: Path to the audio file
+
+        Returns:
+            SHA-256 hex digest of the file content
+        """
+        digest = hashlib.sha256()
+        with open(audio_file_path, "rb") as f:
+            while True:
+                block = f.read(self.HASH_CHUNK_SIZE)
+                if not block:
+                    break
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """
+        Hash in-memory audio content (same digest as hash_file() of the written file).
+
+        Args:
+            data: Audio file content
+
+        Returns:
+            SHA-256 hex digest of the content
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    def make_key(self, content_hash: str, model: str, language: Optional[str], translate: bool) -> str:
+        """
+        Build a cache key from content hash and request options.
+
+        Args:
+            content_hash: Hash of the audio content
+            model: Whisper model name
+            language: Language code (None for auto-detect)
+            translate: Whether translation to English was requested
+
+        Returns:
+            Cache key (hex string)
+        """
+        options = f"{content_hash}|{model}|{language or 'auto'}|{'translate' if translate else 'transcribe'}"
+        return hashlib.sha256(options.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, required_field: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cache entry.
+
+        Args:
+            key: Cache key from make_key()
+            required_field: Entry field that must be present (e.g. "segments"),
+                entries without it count as a miss
+
+        Returns:
+            Cached entry dict (with "text"), or None on miss
+        """
+        with self._lock:
+            if key not in self._index:
+                self._misses += 1
+                return None
+
+            path = self._entry_path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                # Touch for LRU ordering
+                now = time.time()
+                os.utime(path, (now, now))
+                self._index[key][1] = now
+            except (OSError, ValueError) as e:
+                print(f"[CACHE] Warning: Dropping unreadable entry {key[:12]}: {e}")
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            if required_field is not None and entry.get(required_field) is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store a cache entry and evict least recently used entries if needed.
+
+        Args:
+            key: Cache key from make_key()
+            entry: JSON-serializable dict (must contain "text")
+        """
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        if len(data) > self.max_size_bytes:
+            return
+
+        with self._lock:
+            path = self._entry_path(key)
+            tmp_path = path.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"[CACHE] Warning: Could not write cache entry: {e}")
+                return
+
+            if key in self._index:
+                self._total_size -= self._index[key][0]
+            self._index[key] = [len(data), time.time()]
+            self._total_size += len(data)
+            self._stores += 1
+
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under the size limit (lock held)."""
+        if self._total_size <= self.max_size_bytes:
+            return
+
+        for key in sorted(self._index, key=lambda k: self._index[k][1]):
+            if self._total_size <= self.max_size_bytes:
+                break
+            self._remove(key)
+            self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Delete an entry from disk and index (lock held)."""
+        size, _ = self._index.pop(key, (0, 0))
+        self._total_size -= size
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Delete all cache entries."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and size information."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "entries": len(self._index),
+                "size_mb": round(self._total_size / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 2),
+            }
+
+
+_cache: Optional[TranscriptCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_transcript_cache() -> Optional[TranscriptCache]:
+    """
+    Get the process-wide transcript cache (created from Config on first use).
+
+    Returns:
+        Shared TranscriptCache, or None if caching is disabled
+    """
+    global _cache
+    from config import Config
+    config = Config()
+    if not config.transcript_cache_enabled():
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            project_root = Path(__file__).parent.parent.parent
+            _cache = TranscriptCache(
+                cache_dir=str(project_root / "cache" / "transcripts"),
+                max_size_mb=config.get_transcript_cache_max_mb(),
+            )
+        return _cache
@@ -0,0 +1,242 @@
+"""
+Transcript Merger Module - Merges overlapping split-chunk transcripts.
+
+Chunks produced by AudioSplitter overlap by OVERLAP_SECONDS, so the same
+words appear at the end of one chunk and the start of the next. The merger
+removes that duplication at every seam:
+- Segment mode: when timestamps exist, each seam is cut in the middle of
+  the overlap and segments are kept on one side only (by their midpoint;
+  merge_segments() applies the same rule to the segment list).
+- Token alignment: the tail of the merged text is aligned against the head
+  of the next chunk and the duplicated run is dropped (also catches any
+  residual duplication in segment mode).
+
+Output is produced as a stream of text pieces, so a long job can be
+written to disk without building one giant string.
+"""
+
+import math
+import re
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from models.recording import Recording
+
+
+_PUNCTUATION = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def _normalize(token: str) -> str:
+    """Lowercase a token and strip punctuation for comparison."""
+    return _PUNCTUATION.sub("", token.casefold())
+
+
+class TranscriptMerger:
+    """Merge split-chunk transcripts into one deduplicated transcript."""
+
+    # Tokens compared on each side of a seam
+    ALIGN_WINDOW_TOKENS = 40
+    # Minimum matching run to treat as duplicated overlap (shorter runs are common phrases)
+    MIN_MATCH_TOKENS = 4
+    # Upper bound of speech rate: an overlap of N seconds holds at most N * this many words
+    WORDS_PER_SECOND = 4.0
+    # Tokens allowed between the match and the seam (partial words at the cut do not match)
+    EDGE_SLACK_TOKENS = 2
+
+    def __init__(self, overlap_seconds: float = 3.0):
+        """
+        Initialize the merger.
+
+        Args:
+            overlap_seconds: Overlap between consecutive chunks (from job_meta.json)
+        """
+        self.overlap_seconds = overlap_seconds
+        # Most tokens a seam can drop (the duplicated run plus the partial words around it)
+        self.max_overlap_tokens = math.ceil(overlap_seconds * self.WORDS_PER_SECOND)
+        self.last_stats = {"seams": 0, "aligned_seams": 0, "dropped_tokens": 0, "segment_seams": 0}
+
+    def _chunk_tokens(self, chunks: List[Recording]) -> Iterator[List[str]]:
+        """
+        Yield each chunk's text as tokens, trimmed to its own time range when segments exist.
+
+        Args:
+            chunks: Transcribed chunks sorted by part
+        """
+        for i, chunk in enumerate(chunks):
+            nxt = chunks[i + 1] if i + 1 < len(chunks) else None
+            prev = chunks[i - 1] if i > 0 else None
+
+            if self._has_timeline(chunk) and (nxt is None or self._has_timeline(nxt)) \
+                    and (prev is None or self._has_timeline(prev)):
+                texts = [seg["text"] for seg in self._own_segments(chunks, i)]
+                if nxt is not None:
+                    self.last_stats["segment_seams"] += 1
+                yield " ".join(texts).split()
+            else:
+                yield (chunk.transcript or "").split()
+
+    def _own_segments(self, chunks: List[Recording], i: int) -> List[dict]:
+        """
+        Get the segments of chunks[i] that belong to it rather than to a neighbour.
+
+        Seams are cut in the middle of the overlap; a segment belongs to the
+        chunk its midpoint falls in, so a segment straddling a seam is kept
+        exactly once.
+
+        Args:
+            chunks: Chunks sorted by part, segments on the original file's timeline
+            i: Index of the chunk
+        """
+        chunk = chunks[i]
+        lower = chunk.chunk_start_seconds + self.overlap_seconds / 2 if i > 0 else float("-inf")
+        upper = chunks[i + 1].chunk_start_seconds + self.overlap_seconds / 2 if i + 1 < len(chunks) else float("inf")
+        return [seg for seg in chunk.segments or [] if lower <= (seg["start"] + seg["end"]) / 2 < upper]
+
+    @staticmethod
+    def _ordered(chunks: Iterable[Recording]) -> List[Recording]:
+        """Transcribed, non-empty chunks sorted by part."""
+        return sorted(
+            (c for c in chunks if c.transcribed and c.transcript),
+            key=lambda c: c.chunk_part or 0
+        )
+
+    def merge_segments(self, chunks: Iterable[Recording]) -> List[dict]:
+        """
+        Join chunk segments with the same seam rule as the text merge.
+
+        Args:
+            chunks: Transcribed chunks with segments on the original file's timeline
+
+        Returns:
+            Segments in time order, without the overlap duplicates
+        """
+        chunks = self._ordered(chunks)
+        merged = []
+        for i in range(len(chunks)):
+            merged.extend(self._own_segments(chunks, i))
+        return merged
+
+    @staticmethod
+    def _has_timeline(chunk: Recording) -> bool:
+        """True if the chunk has segments on the original file's timeline."""
+        return bool(chunk.segments) and chunk.chunk_start_seconds is not None
+
+    def _align(self, tail: List[str], head: List[str]) -> tuple[int, int]:
+        """
+        Find the duplicated run between the merged tail and the next chunk's head.
+
+        Only a run that ends at the tail's end and starts at the head's start
+        (give or take EDGE_SLACK_TOKENS partial words) counts as overlap, and a
+        seam never drops more than max_overlap_tokens. Anything else (e.g. a
+        phrase that merely repeats later in the speech) is left alone.
+
+        Args:
+            tail: Last tokens of the merged text
+            head: First tokens of the next chunk
+
+        Returns:
+            Tuple (tokens of tail to keep, tokens of head to skip); (len(tail), 0) if no overlap found
+        """
+        tail_norm = [_normalize(t) for t in tail]
+        head_norm = [_normalize(t) for t in head]
+
+        best = None  # (meaningful tokens, -dropped tokens, keep, skip)
+        for b in range(min(self.EDGE_SLACK_TOKENS + 1, len(head_norm))):
+            for a in range(max(0, len(tail_norm) - self.max_overlap_tokens), len(tail_norm)):
+                size = 0
+                while a + size < len(tail_norm) and b + size < len(head_norm) \
+                        and tail_norm[a + size] == head_norm[b + size]:
+                    size += 1
+                keep, skip = a + size, b + size
+                dropped = (len(tail) - keep) + skip
+                if size == 0 or len(tail) - keep > self.EDGE_SLACK_TOKENS or dropped > self.max_overlap_tokens:
+                    continue
+                # Only words actually spoken count (ignore punctuation-only tokens)
+                meaningful = sum(1 for t in tail_norm[a:keep] if t)
+                if meaningful < self.MIN_MATCH_TOKENS:
+                    continue
+                candidate = (meaningful, -dropped, keep, skip)
+                if best is None or candidate > best:
+                    best = candidate
+
+        if best is None:
+            return len(tail), 0
+        # Keep the tail up to the end of the match, continue the head after it
+        return best[2], best[3]
+
+    def iter_merged(self, chunks: Iterable[Recording]) -> Iterator[str]:
+        """
+        Merge chunks and yield the result as text pieces.
+
+        Args:
+            chunks: Transcribed chunks (any order, sorted by chunk_part here)
+
+        Yields:
+            Pieces of the merged transcript (concatenate to get the full text)
+        """
+        chunks = self._ordered(chunks)
+        self.last_stats = {"seams": 0, "aligned_seams": 0, "dropped_tokens": 0, "segment_seams": 0}
+
+        # Last ALIGN_WINDOW_TOKENS tokens are held back until the next seam is resolved
+        pending: List[str] = []
+        started = False
+
+        for tokens in self._chunk_tokens(chunks):
+            if not tokens:
+                continue
+
+            if pending:
+                self.last_stats["seams"] += 1
+                keep, skip = self._align(pending, tokens[:self.ALIGN_WINDOW_TOKENS])
+                if skip:
+                    self.last_stats["aligned_seams"] += 1
+                    self.last_stats["dropped_tokens"] += (len(pending) - keep) + skip
+                pending = pending[:keep]
+                tokens = tokens[skip:]
+
+            merged = pending + tokens
+            flush, pending = merged[:-self.ALIGN_WINDOW_TOKENS], merged[-self.ALIGN_WINDOW_TOKENS:]
+            if flush:
+                yield (" " if started else "") + " ".join(flush)
+                started = True
+
+        if pending:
+            yield (" " if started else "") + " ".join(pending)
+
+    def merge(self, chunks: Iterable[Recording]) -> str:
+        """Merge chunks into a single string."""
+        return "".join(self.iter_merged(chunks))
+
+    def write(self, chunks: Iterable[Recording], out: TextIO) -> int:
+        """
+        Stream the merged transcript into an open text file.
+
+        Args:
+            chunks: Transcribed chunks
+            out: Writable text stream
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for piece in self.iter_merged(chunks):
+            out.write(piece)
+            written += len(piece)
+        return written
+
+
+def load_overlap_seconds(parent_recording_id: str, temp_dir: str = "temp") -> Optional[float]:
+    """
+    Read the overlap used for a split job from its job_meta.json.
+
+    Returns:
+        Overlap in seconds, or None if the metadata is not available
+    """
+    import json
+    from pathlib import Path
+
+    meta_path = Path(temp_dir) / f"{parent_recording_id}_job_meta.json"
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return float(json.load(f).get("overlap_seconds"))
+    except (OSError, ValueError, TypeError):
+        return None
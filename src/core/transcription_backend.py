@@ -0,0 +1,163 @@
+"""
+Transcription Backend Module - Common interface for speech-to-text engines.
+
+The app talks to a TranscriptionBackend instead of a concrete engine, so
+the Groq cloud API and the offline CPU engine are interchangeable in the
+recording, file and split/merge workflows.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class TranscriptionResult:
+    """
+    Result of a transcription request.
+
+    Attributes:
+        text: Transcribed/translated text.
+        segments: Segment timings (start, end, text, no_speech_prob) in seconds,
+            or None if only plain text was requested.
+    """
+    text: str
+    segments: Optional[list] = None
+
+    def offset_segments(self, offset_seconds: float) -> "TranscriptionResult":
+        """
+        Shift all segment timestamps (e.g. by a split chunk's start time).
+
+        Args:
+            offset_seconds: Seconds to add to every start/end
+
+        Returns:
+            New result with shifted segments
+        """
+        if not self.segments or not offset_seconds:
+            return self
+        shifted = [
+            {**seg, "start": seg["start"] + offset_seconds, "end": seg["end"] + offset_seconds}
+            for seg in self.segments
+        ]
+        return TranscriptionResult(text=self.text, segments=shifted)
+
+    def map_segment_times(self, mapping: Callable[[float], float]) -> "TranscriptionResult":
+        """
+        Move all segment timestamps through a mapping (e.g. from trimmed to original audio).
+
+        Args:
+            mapping: Function from a timestamp to the new timestamp
+
+        Returns:
+            New result with mapped segments
+        """
+        if not self.segments:
+            return self
+        mapped = [{**seg, "start": mapping(seg["start"]), "end": mapping(seg["end"])} for seg in self.segments]
+        return TranscriptionResult(text=self.text, segments=mapped)
+
+
+class TranscriptionBackend(ABC):
+    """
+    Interface implemented by every transcription engine.
+
+    Subclasses implement transcribe_detailed(); transcribe() is provided.
+    """
+
+    # Short backend identifier (matches TRANSCRIPTION_BACKEND in .env)
+    NAME = "base"
+
+    @abstractmethod
+    def transcribe_detailed(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False,
+                            with_segments: bool = False, latency_sensitive: bool = False) -> Optional[TranscriptionResult]:
+        """
+        Transcribe an audio file, optionally with segment timestamps.
+
+        Args:
+            audio_file_path: Path to the audio file (.wav, .mp3, etc.)
+            language: Language code (None for auto-detect)
+            translate: If True, translate to English instead of transcribing
+            with_segments: If True, also return segment timings
+            latency_sensitive: Hint that a user is waiting on the result (e.g. hotkey dictation)
+
+        Returns:
+            TranscriptionResult, or None if failed
+        """
+
+    async def transcribe_detailed_async(self, audio_file_path: str, language: Optional[str] = "tr",
+                                        translate: bool = False, with_segments: bool = False,
+                                        latency_sensitive: bool = False) -> Optional[TranscriptionResult]:
+        """
+        Coroutine version of transcribe_detailed() for the app's event loop.
+
+        The default runs transcribe_detailed() in a worker thread (right for
+        CPU-bound engines); network backends override it with native async I/O.
+        """
+        return await asyncio.to_thread(
+            self.transcribe_detailed, audio_file_path, language, translate, with_segments, latency_sensitive
+        )
+
+    def transcribe(self, audio_file_path: str, language: Optional[str] = "tr", translate: bool = False) -> Optional[str]:
+        """
+        Transcribe an audio file.
+
+        Args:
+            audio_file_path: Path to the audio file (.wav, .mp3, etc.)
+            language: Language code (default: "tr" for Turkish)
+            translate: If True, translate to English instead of transcribing
+
+        Returns:
+            Transcribed/translated text as string, or None if failed
+        """
+        result = self.transcribe_detailed(audio_file_path, language, translate)
+        return result.text if result else None
+
+    def max_concurrency(self) -> Optional[int]:
+        """
+        Get the number of files this backend can process in parallel.
+
+        Returns:
+            Worker count, or None to use the configured SPLIT_CONCURRENCY
+        """
+        return None
+
+    def size_limit_mb(self) -> Optional[float]:
+        """
+        Get the largest file size this backend accepts.
+
+        Returns:
+            Limit in megabytes, or None if unlimited
+        """
+        return None
+
+
+def create_transcriber(config=None) -> TranscriptionBackend:
+    """
+    Create the transcription backend selected in Config.
+
+    Args:
+        config: Config instance (if None, a new one is loaded)
+
+    Returns:
+        GroqTranscriber or LocalWhisperTranscriber
+
+    Raises:
+        ValueError: If the selected backend cannot be initialized
+    """
+    if config is None:
+        from config import Config
+        config = Config()
+
+    backend = config.get_transcription_backend()
+    if backend == "local":
+        from core.local_transcriber import LocalWhisperTranscriber
+        return LocalWhisperTranscriber(
+            model_size=config.get_local_model(),
+            compute_type=config.get_local_compute_type(),
+            workers=config.get_local_workers(),
+        )
+
+    from core.transcriber import GroqTranscriber
+    return GroqTranscriber()
@@ -0,0 +1,314 @@
+"""
+VAD Module - Voice-activity trimming of recordings before upload.
+
+A vectorized NumPy energy / zero-crossing detector classifies 20ms frames
+as speech or not. Leading and trailing silence is trimmed and long pauses
+inside the recording can be shortened, so less upload time and API quota
+is spent on silence. Nothing is ever dropped: if no speech is found (e.g.
+a very quiet speaker or a noisy room) the untrimmed recording is uploaded.
+"""
+
+import threading
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from core.audio_handoff import encode_flac, get_audio_handoff
+
+
+@dataclass
+class VadResult:
+    """
+    Outcome of trimming one recording.
+
+    Attributes:
+        path: File to transcribe (the original if nothing worth trimming was found)
+        has_speech: False if no speech was found (the original is uploaded untrimmed)
+        original_seconds: Duration of the original recording
+        kept_seconds: Duration of the audio that will be uploaded
+        bytes_saved: Upload bytes saved by trimming/skipping
+        time_map: [trimmed_start, original_start] pairs (seconds) for each kept
+            range, to move segment timestamps back to the original timeline
+    """
+    path: str
+    has_speech: bool = True
+    original_seconds: float = 0.0
+    kept_seconds: float = 0.0
+    bytes_saved: int = 0
+    time_map: List[List[float]] = field(default_factory=list)
+
+    @property
+    def trimmed(self) -> bool:
+        """True if a trimmed copy was written."""
+        return bool(self.time_map)
+
+
+def to_original_time(seconds: float, time_map: List[List[float]]) -> float:
+    """
+    Map a timestamp in the trimmed audio to the original recording.
+
+    Args:
+        seconds: Time in the trimmed audio
+        time_map: VadResult.time_map
+
+    Returns:
+        Time in the original recording
+    """
+    if not time_map:
+        return seconds
+    trimmed_starts = [start for start, _ in time_map]
+    index = max(0, int(np.searchsorted(trimmed_starts, seconds, side="right")) - 1)
+    trimmed_start, original_start = time_map[index]
+    return original_start + (seconds - trimmed_start)
+
+
+class VoiceActivityDetector:
+    """
+    Energy + zero-crossing-rate VAD working on whole recordings.
+
+    A frame is speech if its RMS is above the threshold, or above half the
+    threshold with a high zero-crossing rate (unvoiced sounds like "s", "f").
+    The threshold adapts to the recording's noise floor when it has one.
+    """
+
+    FRAME_SECONDS = 0.02
+
+    # Frames above this zero-crossing rate count as unvoiced speech at half the energy
+    ZCR_THRESHOLD = 0.25
+
+    # Speech bursts shorter than this are treated as clicks/bumps
+    MIN_BURST_SECONDS = 0.06
+
+    # Trimming less than this is not worth rewriting the file
+    MIN_SAVING_SECONDS = 0.25
+
+    def __init__(self, threshold_db: float = -45.0, min_speech_seconds: float = 0.3,
+                 padding_seconds: float = 0.3, max_pause_seconds: float = 0.0,
+                 noise_ratio: float = 3.0):
+        """
+        Initialize the detector.
+
+        Args:
+            threshold_db: Lowest RMS level (dBFS) that counts as speech
+            min_speech_seconds: Recordings with less speech than this are not trimmed
+            padding_seconds: Audio kept around speech (so word edges are not cut)
+            max_pause_seconds: Pauses longer than this are shortened to it (0 = keep pauses)
+            noise_ratio: Speech must also be this many times louder than the noise floor
+        """
+        self.threshold = 10 ** (threshold_db / 20)
+        self.min_speech_seconds = min_speech_seconds
+        self.padding_seconds = padding_seconds
+        self.max_pause_seconds = max_pause_seconds
+        self.noise_ratio = noise_ratio
+
+    def detect(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Classify frames as speech.
+
+        Args:
+            samples: int16 audio (frames, or frames x channels)
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Boolean array with one entry per FRAME_SECONDS frame
+        """
+        frame = max(1, int(sample_rate * self.FRAME_SECONDS))
+        count = len(samples) // frame
+        if count == 0:
+            return np.zeros(0, dtype=bool)
+        mono = samples if samples.ndim == 1 else samples.mean(axis=1)
+        frames = mono[:count * frame].reshape(count, frame).astype(np.float32) / 32768.0
+
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+        # Adapt to the noise floor only if the recording has quiet parts at all
+        # (otherwise it is speech throughout, or silence throughout)
+        floor, peak = np.percentile(rms, [10, 90])
+        adaptive = floor * self.noise_ratio if peak >= floor * self.noise_ratio else 0.0
+        threshold = max(self.threshold, float(adaptive))
+        speech = (rms >= threshold) | ((rms >= threshold * 0.5) & (zcr >= self.ZCR_THRESHOLD))
+
+        # Drop isolated bursts (clicks, desk bumps)
+        min_burst = max(1, int(round(self.MIN_BURST_SECONDS / self.FRAME_SECONDS)))
+        starts, ends = _runs(speech)
+        for start, end in zip(starts, ends):
+            if end - start < min_burst:
+                speech[start:end] = False
+        return speech
+
+    def plan(self, speech: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Turn a speech mask into frame ranges to keep.
+
+        Args:
+            speech: Output of detect()
+
+        Returns:
+            (start_frame, end_frame) ranges; empty if there is not enough speech
+        """
+        if speech.sum() * self.FRAME_SECONDS < self.min_speech_seconds:
+            return []
+
+        # Pad speech so word onsets/endings survive
+        pad = int(round(self.padding_seconds / self.FRAME_SECONDS))
+        if pad:
+            speech = np.convolve(speech, np.ones(2 * pad + 1), mode="same") > 0
+        starts, ends = _runs(speech)
+
+        max_pause = int(round(self.max_pause_seconds / self.FRAME_SECONDS))
+        if not max_pause:
+            return [(int(starts[0]), int(ends[-1]))]
+
+        # Shorten long pauses to max_pause, keeping half of it on each side
+        ranges = [[int(starts[0]), int(ends[0])]]
+        for start, end in zip(starts[1:], ends[1:]):
+            if start - ranges[-1][1] <= max_pause:
+                ranges[-1][1] = int(end)
+            else:
+                ranges[-1][1] += max_pause // 2
+                ranges.append([int(start) - (max_pause - max_pause // 2), int(end)])
+        return [(start, end) for start, end in ranges]
+
+    def process_file(self, filepath: str) -> VadResult:
+        """
+        Trim a WAV or FLAC recording.
+
+        Writes `<name>_vad.wav` next to the original when trimming saves at
+        least MIN_SAVING_SECONDS; the original file is never modified. FLAC
+        recordings handed over in memory stay in memory (`<name>_vad.flac`).
+
+        Args:
+            filepath: Recording to analyse
+
+        Returns:
+            VadResult (unchanged original path if the file can't be analysed)
+        """
+        handoff = get_audio_handoff()
+        try:
+            samples, sample_rate = handoff.read_pcm16(filepath)
+        except Exception as e:
+            print(f"[VAD] Could not read {filepath}: {e}")
+            return VadResult(path=filepath)
+
+        channels = samples.shape[1]
+        total = len(samples)
+        original_seconds = total / sample_rate
+        original_bytes = handoff.size(filepath)
+
+        ranges = self.plan(self.detect(samples, sample_rate))
+        if not ranges:
+            # Better to upload silence than to lose a quiet dictation
+            result = VadResult(path=filepath, has_speech=False, original_seconds=original_seconds,
+                               kept_seconds=original_seconds)
+            get_vad_stats().record(result)
+            return result
+
+        frame = max(1, int(sample_rate * self.FRAME_SECONDS))
+        frame_count = total // frame
+        sample_ranges = [
+            (max(0, start) * frame, total if end >= frame_count else min(total, end * frame))
+            for start, end in ranges
+        ]
+        kept = sum(end - start for start, end in sample_ranges)
+        if (total - kept) / sample_rate < self.MIN_SAVING_SECONDS:
+            return VadResult(path=filepath, original_seconds=original_seconds, kept_seconds=original_seconds)
+
+        time_map = []
+        position = 0
+        for start, end in sample_ranges:
+            time_map.append([position / sample_rate, start / sample_rate])
+            position += end - start
+        kept_samples = np.concatenate([samples[start:end] for start, end in sample_ranges])
+
+        path = Path(filepath)
+        if path.suffix.lower() == ".flac":
+            trimmed_path = str(path.with_name(f"{path.stem}_vad.flac"))
+            handoff.publish(
+                trimmed_path,
+                encode_flac(kept_samples, sample_rate),
+                duration_seconds=kept / sample_rate,
+                raw_bytes=kept_samples.nbytes + 44,
+                stopped_at=handoff.stopped_at(filepath),
+            )
+        else:
+            trimmed_path = str(path.with_name(f"{path.stem}_vad.wav"))
+            with wave.open(trimmed_path, "wb") as wav:
+                wav.setnchannels(channels)
+                wav.setsampwidth(2)
+                wav.setframerate(sample_rate)
+                wav.writeframes(kept_samples.tobytes())
+
+        result = VadResult(
+            path=trimmed_path,
+            original_seconds=original_seconds,
+            kept_seconds=kept / sample_rate,
+            bytes_saved=max(0, original_bytes - handoff.size(trimmed_path)),
+            time_map=time_map,
+        )
+        get_vad_stats().record(result)
+        print(f"[VAD] Trimmed {original_seconds:.1f}s -> {result.kept_seconds:.1f}s")
+        return result
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive) indices of the True runs in a boolean array."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return edges[0::2], edges[1::2]
+
+
+class VadStats:
+    """Thread-safe counters of what trimming saved."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self._trimmed = 0
+        self._no_speech = 0
+        self._seconds_saved = 0.0
+        self._bytes_saved = 0
+
+    def record(self, result: VadResult) -> None:
+        """
+        Count one trimmed recording, or one where no speech was found.
+
+        Args:
+            result: Outcome of VoiceActivityDetector.process_file()
+        """
+        with self._lock:
+            if result.has_speech:
+                self._trimmed += 1
+            else:
+                self._no_speech += 1
+            self._seconds_saved += result.original_seconds - result.kept_seconds
+            self._bytes_saved += result.bytes_saved
+
+    def get_stats(self) -> dict:
+        """
+        Get counters.
+
+        Returns:
+            Dict with trimmed recordings, recordings uploaded untrimmed because
+            no speech was found, and seconds/bytes saved
+        """
+        with self._lock:
+            return {
+                "trimmed": self._trimmed,
+                "no_speech": self._no_speech,
+                "seconds_saved": round(self._seconds_saved, 1),
+                "bytes_saved": self._bytes_saved,
+            }
+
+
+_vad_stats = VadStats()
+
+
+def get_vad_stats() -> VadStats:
+    """Get the process-wide VAD counters."""
+    return _vad_stats
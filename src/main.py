@@ -4,6 +4,7 @@ Integrates all components into a functional desktop application using PyWebview.
 """
 
 import webview
+from pynput import keyboard
 from pynput.keyboard import GlobalHotKeys
 import sys
 import signal
@@ -12,17 +13,30 @@ import threading
 import pyperclip
 import pyautogui
 import time
+import asyncio
+import socket
+import multiprocessing
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import Config
 from core.recorder import AudioRecorder
-from core.transcriber import GroqTranscriber
+from core.transcription_backend import create_transcriber
 from core.input_simulator import TextInjector
 from core.history_manager import HistoryManager
 from core.api import Api
+from core.telemetry import get_last_record, get_telemetry
+from core.circuit_breaker import get_circuit_breaker
+from core.async_runtime import get_runtime
+from core.audio_handoff import get_audio_handoff
+from core.speculative import RecordedSegment, SpeculativeSession
+from core.device_registry import resolve_input_device
+from core.job_queue import Job, JobDrainer, JobQueue, get_job_queue
+from core.vad import VoiceActivityDetector, to_original_time
+from models.recording import SourceType
 from ui.tray import SystemTray
 from utils.sound_feedback import SoundFeedback
 
@@ -38,6 +52,7 @@ class GroqWhisperApp:
         self.config = Config()
         self._is_recording = False
         self._shutdown_flag = False
+        self._speculative = None
         
         # Window
         self.dashboard_window = None
@@ -56,14 +71,32 @@ class GroqWhisperApp:
 
     def _setup_components(self) -> None:
         """Initialize core application components."""
+        # Event loop thread that runs all transcription workflows
+        self.runtime = get_runtime()
         self.recorder = AudioRecorder(
             sample_rate=self.config.get_sample_rate(),
             channels=self.config.get_channels()
         )
-        self.transcriber = GroqTranscriber()
+        self.transcriber = create_transcriber(self.config)
+        get_circuit_breaker().add_listener(self._on_circuit_state_change)
         self.injector = TextInjector()
         self.history = HistoryManager()
         self.sound = SoundFeedback(self.config.play_beep)
+
+        # Durable job journal: work left over from a previous run (or deferred
+        # while offline) is drained in the background
+        self.jobs = get_job_queue()
+        self.job_drainer = JobDrainer(
+            self.jobs,
+            execute=self._execute_job,
+            on_done=self._on_queued_job_done,
+            is_offline=self._service_offline,
+            workers=self.config.get_split_concurrency(),
+            max_attempts=self.config.get_job_max_attempts(),
+            retry_seconds=self.config.get_job_retry_seconds()
+        )
+        self._resume_jobs()
+        self._apply_warm_stream()
         
         # Reuse existing tray (might need adjustments if it relies on tkinter loop, 
         # but pystray usually has its own loop or runs in thread. 
@@ -108,6 +141,9 @@ class GroqWhisperApp:
     def _setup_hotkeys(self) -> None:
         """Setup global hotkey listener."""
         recording_hotkey = '<ctrl>+<alt>+k' # Could be configurable
+        if self.config.get_hotkey_mode() == "hold":
+            self._setup_push_to_talk(recording_hotkey)
+            return
         try:
             hotkeys = {
                 recording_hotkey: self.toggle_recording,
@@ -119,6 +155,46 @@ class GroqWhisperApp:
         except Exception as e:
             print(f"Warning: Could not register hotkeys: {e}")
 
+    def _setup_push_to_talk(self, recording_hotkey: str) -> None:
+        """
+        Setup hold-to-record: recording runs while the hotkey is held down.
+
+        Args:
+            recording_hotkey: Hotkey combination in pynput format
+        """
+        try:
+            hold_keys = set(keyboard.HotKey.parse(recording_hotkey))
+            record = keyboard.HotKey(hold_keys, self._on_push_to_talk_pressed)
+            quit_hotkey = keyboard.HotKey(keyboard.HotKey.parse('<ctrl>+<alt>+q'), self.shutdown_wrapper)
+
+            def on_press(key):
+                key = self.hotkey_listener.canonical(key)
+                record.press(key)
+                quit_hotkey.press(key)
+
+            def on_release(key):
+                key = self.hotkey_listener.canonical(key)
+                record.release(key)
+                quit_hotkey.release(key)
+                # Letting go of any key of the combination ends the recording
+                if key in hold_keys and self._push_to_talk_active:
+                    self._push_to_talk_active = False
+                    if self._is_recording:
+                        self._stop_recording()
+
+            self._push_to_talk_active = False
+            self.hotkey_listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+            self.hotkey_listener.start()
+            print(f"Hotkeys registered: {recording_hotkey} (hold to record)")
+        except Exception as e:
+            print(f"Warning: Could not register hotkeys: {e}")
+
+    def _on_push_to_talk_pressed(self) -> None:
+        """Start recording when the push-to-talk combination goes down."""
+        if not self._is_recording:
+            self._push_to_talk_active = True
+            self._start_recording()
+
     def toggle_recording(self) -> None:
         """Toggle recording state."""
         if not self._is_recording:
@@ -126,6 +202,29 @@ class GroqWhisperApp:
         else:
             self._stop_recording()
 
+    def _recording_device(self):
+        """Get the configured input device's current index (None for system default), resolved by stable name."""
+        return resolve_input_device(self.config.get_input_device_key(), self.config.get_input_device())
+
+    def _apply_warm_stream(self) -> None:
+        """Open/close the warm input stream or capture process to match the config (in background, opening takes a while)."""
+        # Pre-roll needs the stream running while idle
+        pre_roll = self.config.get_pre_roll_seconds()
+        isolated = self.config.capture_process_enabled()
+        warm = (self.config.warm_input_stream_enabled() or pre_roll > 0) and not isolated
+        device = self._recording_device()
+
+        def apply():
+            # Close the unused one first, so the microphone is not opened twice
+            if isolated:
+                self.recorder.set_warm_stream(False)
+                self.recorder.set_capture_process(True, device, pre_roll)
+            else:
+                self.recorder.set_capture_process(False)
+                self.recorder.set_warm_stream(warm, device, pre_roll)
+
+        threading.Thread(target=apply, daemon=True).start()
+
     def _start_recording(self) -> None:
         """Start audio recording."""
         print("Starting recording...")
@@ -133,15 +232,26 @@ class GroqWhisperApp:
         self.sound.play_start_beep()
         
         # Get configured input device
-        device_index = self.config.get_input_device()
-        if device_index == -1:
-            device_index = None
+        device_index = self._recording_device()
             
         print(f"Recording using device index: {device_index}")
+
+        # Transcribe long dictations in segments while still recording
+        self._speculative = None
+        on_segment = None
+        if self.config.speculative_transcription_enabled():
+            self._speculative = self._create_speculative_session()
+            on_segment = self._speculative.on_segment
         
         # Start recording
         try:
-            self.recorder.start_recording(device_index=device_index)
+            self.recorder.start_recording(
+                device_index=device_index,
+                on_segment=on_segment,
+                min_segment_seconds=self.config.get_speculative_min_segment_seconds(),
+                stream_to_disk=self.config.record_to_disk_enabled(),
+                encode_in_memory=self.config.in_memory_handoff_enabled()
+            )
             self.tray.update_tooltip("Recording...")
             self._update_ui_recording_state(True)
         except Exception as e:
@@ -159,19 +269,52 @@ class GroqWhisperApp:
         
         if audio_file:
             # Add to history
-            recording_id = self.history.add_recording(audio_file)
+            recording_id = self.history.add_recording(
+                audio_file, capture_stats=self.recorder.get_capture_stats()
+            )
             
             # Update History UI
             self._update_history_ui()
             
             # Transcribe (Async)
-            threading.Thread(target=self._process_transcription, args=(recording_id,), daemon=True).start()
+            self.runtime.submit(self._process_transcription(recording_id, self._speculative))
         
-        self.tray.update_tooltip("Ready")
+        self._speculative = None
+        self.tray.update_tooltip(self._ready_tooltip())
         self._update_ui_recording_state(False)
 
-    def _process_transcription(self, recording_id):
-        """Handle transcription in background."""
+    def _create_speculative_session(self) -> SpeculativeSession:
+        """Create a session that transcribes recorded segments on the event loop."""
+        lang = self.config.get_language()
+        if lang == "auto":
+            lang = None
+        translate = self.config.translate_enabled()
+
+        def submit(segment: RecordedSegment):
+            # Only the tail is waited on right after stop
+            return self.runtime.submit(
+                self._run_transcription(segment.path, lang, translate, latency_sensitive=segment.final)
+            )
+
+        return SpeculativeSession(submit)
+
+    def _create_vad(self) -> VoiceActivityDetector:
+        """Create a voice-activity detector from the current config."""
+        return VoiceActivityDetector(
+            threshold_db=self.config.get_vad_threshold_db(),
+            min_speech_seconds=self.config.get_vad_min_speech_seconds(),
+            padding_seconds=self.config.get_vad_padding_seconds(),
+            max_pause_seconds=self.config.get_vad_max_pause_seconds()
+        )
+
+    async def _process_transcription(self, recording_id, speculative: SpeculativeSession = None):
+        """
+        Handle transcription on the event loop.
+
+        Args:
+            recording_id: History entry of the recording
+            speculative: Session holding segments transcribed while recording, if any
+        """
         recording = self.history.get_recording(recording_id)
         if not recording:
             return
@@ -182,27 +325,61 @@ class GroqWhisperApp:
         
         # Check if translate to English is enabled
         translate = self.config.translate_enabled()
-            
-        text = self.transcriber.transcribe(recording.filepath, language=lang, translate=translate)
-        
+
+        # Trim silence before upload (segments transcribed while recording were already sent)
+        filepath = recording.filepath
+        extra = {}
+        try:
+            if self.config.vad_enabled() and not (speculative is not None and speculative.has_segments):
+                vad = await asyncio.to_thread(self._create_vad().process_file, filepath)
+                if not vad.has_speech:
+                    print("[VAD] No speech detected, uploading the untrimmed recording")
+                filepath = vad.path
+                if vad.trimmed:
+                    extra["vad_time_map"] = vad.time_map
+
+            if recording.capture_stats:
+                extra["capture_stats"] = recording.capture_stats
+            job = self._enqueue_job(JobQueue.KIND_RECORDING, recording_id, filepath, lang, translate, **extra)
+
+            result = None
+            if speculative is not None and speculative.has_segments:
+                result = await speculative.collect_async()
+                speculative.cleanup()
+                if result is not None:
+                    self.jobs.complete(job.id, result)
+                else:
+                    print("[SPECULATIVE] Falling back to full recording")
+            if result is None:
+                result = await self.job_drainer.execute(job)
+            text = result.text if result else None
+        finally:
+            # Upload is over: drop the in-memory copies (retries read the files on disk)
+            get_audio_handoff().release(recording.filepath)
+            get_audio_handoff().release(filepath)
+
         if text:
-            self.history.update_transcript(recording_id, text)
+            self.history.update_transcript(recording_id, text, result.segments)
             # Auto-paste if enabled (simulate Ctrl+V)
             if self.config.auto_paste_enabled():
-                pyperclip.copy(text)
-                time.sleep(0.1)  # Small delay for clipboard
-                pyautogui.hotkey('ctrl', 'v')
-                print("Text auto-pasted.")
+                await asyncio.to_thread(self._auto_paste, text)
                 self._show_toast("🚀 Text Pasted & Saved", "success")
             else:
                 self._show_toast("✅ Transcription completed", "success")
             self._update_history_ui()
         else:
              print("Transcription failed.")
-             self._show_toast("❌ Transcription failed", "error")
+             self._show_job_failed_toast(job)
+
+    def _auto_paste(self, text: str) -> None:
+        """Copy text and simulate Ctrl+V (blocking, run off the event loop)."""
+        pyperclip.copy(text)
+        time.sleep(0.1)  # Small delay for clipboard
+        pyautogui.hotkey('ctrl', 'v')
+        print("Text auto-pasted.")
 
-    def process_file_transcription(self, filepath):
-        """Handle file transcription (called from API)."""
+    async def process_file_transcription(self, filepath):
+        """Handle file transcription (submitted to the event loop by the API)."""
         print(f"Processing file: {filepath}")
         
         # Add to history as FILE source
@@ -213,7 +390,6 @@ class GroqWhisperApp:
         # For now, let's just add it.
         
         # Check source type support in history manager
-        from models.recording import SourceType
         recording_id = self.history.add_recording(filepath, source=SourceType.FILE)
         
         self._update_history_ui()
@@ -225,36 +401,37 @@ class GroqWhisperApp:
         
         # Check if translate to English is enabled
         translate = self.config.translate_enabled()
-            
-        text = self.transcriber.transcribe(filepath, language=lang, translate=translate)
+
+        job = self._enqueue_job(JobQueue.KIND_FILE, recording_id, filepath, lang, translate)
+        result = await self.job_drainer.execute(job)
+        text = result.text if result else None
         
         if text:
-            self.history.update_transcript(recording_id, text)
+            self.history.update_transcript(recording_id, text, result.segments)
             # Auto-paste if enabled (simulate Ctrl+V)
             if self.config.auto_paste_enabled():
-                pyperclip.copy(text)
-                time.sleep(0.1)  # Small delay for clipboard
-                pyautogui.hotkey('ctrl', 'v')
-                print("Text auto-pasted.")
+                await asyncio.to_thread(self._auto_paste, text)
                 self._show_toast("🚀 Text Pasted & Saved", "success")
             else:
                 self._show_toast("✅ Transcription completed", "success")
             self._update_history_ui()
         else:
             print("File transcription failed.")
-            self._show_toast("❌ Transcription failed", "error")
+            self._show_job_failed_toast(job)
 
-    def process_split_transcription_workflow(self, filepath: str):
+    async def process_split_transcription_workflow(self, filepath: str):
         """
-        Split audio file and transcribe chunks sequentially.
+        Split audio file and transcribe chunks concurrently on the event loop.
 
         Workflow:
-        1. Split file into chunks
+        1. Split file into chunks (ffmpeg, in a worker thread)
         2. Create history entries for each chunk
-        3. Transcribe chunks sequentially (1 → N)
+        3. Transcribe chunks concurrently (at most SPLIT_CONCURRENCY at once, results in any order)
         4. User manually merges using existing merge button
+
+        Every chunk is journaled in the job queue, so chunks that were not
+        transcribed yet are resumed after a restart.
         """
-        from models.recording import SourceType
         import time
 
         # Track total transcription time
@@ -270,7 +447,7 @@ class GroqWhisperApp:
 
         # Split file into chunks
         try:
-            job_metadata = self.api.split_audio_file(filepath, recording_id)
+            job_metadata = await asyncio.to_thread(self.api.split_audio_file, filepath, recording_id)
             print(f"[SPLIT] Created {job_metadata['total_parts']} chunks")
         except ValueError as e:
             # User-friendly error (format not supported, etc.)
@@ -304,6 +481,7 @@ class GroqWhisperApp:
                 recording.is_split = True
                 recording.chunk_part = chunk_info['part']
                 recording.parent_recording_id = recording_id
+                recording.chunk_start_seconds = chunk_info['start_seconds']
             else:
                 print(f"[SPLIT] WARNING: Could not get recording {chunk_recording_id} for metadata")
                 print(f"[SPLIT] WARNING: Chunk will still be transcribed (not skipping)")
@@ -312,7 +490,8 @@ class GroqWhisperApp:
             chunk_recordings.append({
                 "id": chunk_recording_id,
                 "part": chunk_info['part'],
-                "path": chunk_path
+                "path": chunk_path,
+                "start_seconds": chunk_info['start_seconds']
             })
 
         # Debug logging
@@ -323,67 +502,69 @@ class GroqWhisperApp:
         # Update UI with new chunk recordings
         self._update_history_ui()
 
-        # Sequential transcription
+        # Concurrent transcription (bounded by a semaphore, one task per chunk)
         lang = self.config.get_language()
         if lang == "auto":
             lang = None
         translate = self.config.translate_enabled()
 
+        # Journal all chunks up front (durable even before their turn comes)
+        for chunk in chunk_recordings:
+            chunk['job'] = self._enqueue_job(
+                JobQueue.KIND_CHUNK, chunk['id'], str(Path(chunk['path']).resolve()), lang, translate,
+                parent_recording_id=recording_id,
+                chunk_part=chunk['part'],
+                chunk_start_seconds=chunk['start_seconds']
+            )
+        # Local backend runs one chunk per model worker; Groq uses SPLIT_CONCURRENCY
+        concurrency = self.transcriber.max_concurrency() or self.config.get_split_concurrency()
+        total_chunks = len(chunk_recordings)
+
         success_count = 0
         failed_chunks = []
+        chunk_timings = []
+
+        print(f"[SPLIT] Transcribing {total_chunks} chunks, {concurrency} at a time")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_chunk(chunk: dict) -> tuple:
+            async with semaphore:
+                try:
+                    result, timing = await self._transcribe_split_chunk(
+                        chunk, total_chunks, lang, translate, workflow_start_time
+                    )
+                except Exception as e:
+                    print(f"[SPLIT] Chunk {chunk['part']} task error: {e}")
+                    result, timing = None, {"part": chunk['part'], "status": "error"}
+                return chunk, result, timing
+
+        # Handle results as they finish (any order)
+        for next_done in asyncio.as_completed([run_chunk(chunk) for chunk in chunk_recordings]):
+            chunk, result, timing = await next_done
+            chunk_timings.append(timing)
+
+            if result and result.text:
+                # Segment times are already on the original file's timeline (see _execute_job)
+                self.history.update_transcript(chunk['id'], result.text, result.segments)
+                success_count += 1
+                print(f"[SPLIT] Chunk {chunk['part']} transcribed successfully")
+                # Update only this chunk in UI (not full re-render to avoid overwriting other chunks)
+                self._update_single_chunk_in_history(chunk['id'])
+            else:
+                failed_chunks.append(chunk['part'])
+                print(f"[SPLIT] Chunk {chunk['part']} transcription failed (status: {timing.get('status')})")
 
-        for i, chunk in enumerate(chunk_recordings):
-            print(f"[SPLIT] Transcribing chunk {i+1}/{len(chunk_recordings)}")
-
-            # Check chunk file size before transcribing
-            from pathlib import Path
-            chunk_path = Path(chunk['path'])
-            chunk_size_mb = chunk_path.stat().st_size / (1024 * 1024)
-            print(f"[SPLIT] Chunk {i+1} size: {chunk_size_mb:.2f} MB")
-
-            # Skip if chunk is too large for API (use 24 MB to be safe, API limit is 25 MB)
-            if chunk_size_mb >= 24:
-                print(f"[SPLIT] WARNING: Chunk {i+1} is too large ({chunk_size_mb:.2f} MB >= 24 MB), skipping...")
-                failed_chunks.append(i+1)
+            if timing.get("status") != "too_large":
+                # Update UI progress bar
                 self._evaluate_js(f"""
-                    if (typeof showSplitProgress === 'function') {{
-                        showSplitProgress({i+1}, {len(chunk_recordings)}, "{chunk['id']}");
-                    }}
                     if (typeof updateChunkComplete === 'function') {{
-                        document.getElementById('chunk-{chunk['id']}').querySelector('.chunk-status').textContent = '⚠️ Çok büyük';
-                        document.getElementById('chunk-{chunk['id']}').querySelector('.chunk-status').classList.add('text-red-400');
+                        updateChunkComplete("{chunk['id']}");
                     }}
                 """)
-                continue
 
-            # Update UI progress
-            self._evaluate_js(f"""
-                if (typeof showSplitProgress === 'function') {{
-                    showSplitProgress({i+1}, {len(chunk_recordings)}, "{chunk['id']}");
-                }}
-            """)
-
-            # Transcribe
-            print(f"[SPLIT] Calling transcriber for chunk {i+1}...")
-            text = self.transcriber.transcribe(chunk['path'], language=lang, translate=translate)
-            print(f"[SPLIT] Transcriber returned for chunk {i+1}: {len(text) if text else 0} chars")
-
-            if text:
-                self.history.update_transcript(chunk['id'], text)
-                success_count += 1
-                print(f"[SPLIT] Chunk {i+1} transcribed successfully")
-                # Update only this chunk in UI (not full re-render to avoid overwriting other chunks)
-                self._update_single_chunk_in_history(chunk['id'])
-            else:
-                failed_chunks.append(i+1)
-                print(f"[SPLIT] Chunk {i+1} transcription failed (no text returned)")
-
-            # Update UI progress bar
-            self._evaluate_js(f"""
-                if (typeof updateChunkComplete === 'function') {{
-                    updateChunkComplete("{chunk['id']}");
-                }}
-            """)
+        failed_chunks.sort()
+        chunk_timings.sort(key=lambda t: t["part"])
 
         # Hide progress modal
         self._evaluate_js("if (typeof hideSplitProgress === 'function') { hideSplitProgress(); }")
@@ -395,7 +576,6 @@ class GroqWhisperApp:
         # Update meta.json with transcription time
         try:
             import json
-            from pathlib import Path
             meta_path = Path("temp") / f"{recording_id}_job_meta.json"
             if meta_path.exists():
                 with open(meta_path, 'r', encoding='utf-8') as f:
@@ -406,6 +586,11 @@ class GroqWhisperApp:
                 metadata['transcription_completed_at'] = time.strftime("%d.%m.%Y %H:%M:%S")
                 metadata['success_count'] = success_count
                 metadata['failed_count'] = len(failed_chunks)
+                metadata['concurrency'] = concurrency
+                metadata['chunk_timings'] = chunk_timings
+                metadata['upload_telemetry'] = get_telemetry().summary(
+                    [t["request"] for t in chunk_timings if "request" in t]
+                )
                 
                 with open(meta_path, 'w', encoding='utf-8') as f:
                     json.dump(metadata, f, indent=2, ensure_ascii=False)
@@ -423,6 +608,171 @@ class GroqWhisperApp:
 
         self._update_history_ui()
 
+    async def _transcribe_split_chunk(self, chunk: dict, total_chunks: int, lang, translate: bool,
+                                      workflow_start_time: float) -> tuple:
+        """
+        Transcribe a single split chunk (one task per chunk).
+
+        Args:
+            chunk: Chunk entry with id, part and path.
+            total_chunks: Total number of chunks in the job (for UI progress).
+            lang: Language code, or None for auto-detect.
+            translate: If True, translate to English.
+            workflow_start_time: Workflow start time, used for relative timings.
+
+        Returns:
+            Tuple of (TranscriptionResult or None, timing dict for job_meta.json).
+        """
+        part = chunk['part']
+        timing = {"part": part}
+
+        # Check chunk file size before transcribing
+        chunk_size_mb = Path(chunk['path']).stat().st_size / (1024 * 1024)
+        timing["size_mb"] = round(chunk_size_mb, 2)
+        print(f"[SPLIT] Chunk {part} size: {chunk_size_mb:.2f} MB")
+
+        # Update UI progress
+        self._evaluate_js(f"""
+            if (typeof showSplitProgress === 'function') {{
+                showSplitProgress({part}, {total_chunks}, "{chunk['id']}");
+            }}
+        """)
+
+        # Skip if chunk is too large for the backend (Groq: 24 MB to be safe, API limit is 25 MB)
+        size_limit_mb = self.transcriber.size_limit_mb()
+        if size_limit_mb is not None and chunk_size_mb >= size_limit_mb:
+            print(f"[SPLIT] WARNING: Chunk {part} is too large ({chunk_size_mb:.2f} MB >= {size_limit_mb} MB), skipping...")
+            timing["status"] = "too_large"
+            self.jobs.fail(chunk['job'].id, "chunk too large")
+            self._evaluate_js(f"""
+                if (typeof updateChunkComplete === 'function') {{
+                    document.getElementById('chunk-{chunk['id']}').querySelector('.chunk-status').textContent = '⚠️ Çok büyük';
+                    document.getElementById('chunk-{chunk['id']}').querySelector('.chunk-status').classList.add('text-red-400');
+                }}
+            """)
+            return None, timing
+
+        # Transcribe
+        started_at = time.time()
+        previous_record = get_last_record()
+        print(f"[SPLIT] Calling transcriber for chunk {part}...")
+        result = await self.job_drainer.execute(chunk['job'])
+        finished_at = time.time()
+        print(f"[SPLIT] Transcriber returned for chunk {part}: {len(result.text) if result else 0} chars")
+
+        # Upload telemetry of this chunk's request (none for cache hits)
+        record = get_last_record()
+        if record is not None and record is not previous_record:
+            timing["request"] = record.to_dict()
+
+        timing["started_offset_seconds"] = round(started_at - workflow_start_time, 2)
+        timing["finished_offset_seconds"] = round(finished_at - workflow_start_time, 2)
+        timing["transcription_seconds"] = round(finished_at - started_at, 2)
+        timing["status"] = "success" if result and result.text else "failed"
+        return result, timing
+
+    def _enqueue_job(self, kind: str, recording_id: str, filepath: str, lang, translate: bool, **extra) -> Job:
+        """
+        Journal a job that the calling workflow runs right away.
+
+        Args:
+            kind: JobQueue.KIND_RECORDING, KIND_FILE or KIND_CHUNK
+            recording_id: History entry the result belongs to
+            filepath: Audio file to transcribe
+            lang: Language code, or None for auto-detect
+            translate: If True, translate to English
+            **extra: Chunk metadata (parent_recording_id, chunk_part, chunk_start_seconds),
+                or the VAD time map of a trimmed recording (vad_time_map) and its capture health (capture_stats)
+
+        Returns:
+            The claimed Job
+        """
+        source = SourceType.RECORDING if kind == JobQueue.KIND_RECORDING else SourceType.FILE
+        params = {"language": lang, "translate": translate, "source": source.value, **extra}
+        job_id = self.jobs.enqueue(kind, recording_id, filepath, params, claimed=True)
+        return Job(id=job_id, kind=kind, recording_id=recording_id, filepath=filepath, params=params,
+                   status=JobQueue.RUNNING)
+
+    async def _execute_job(self, job: Job):
+        """Transcribe a queued job (chunk and trimmed segment times are moved to the original file's timeline)."""
+        result = await self._run_transcription(
+            job.filepath,
+            job.params.get("language"),
+            job.params.get("translate", False),
+            latency_sensitive=job.kind == JobQueue.KIND_RECORDING
+        )
+        if result is not None and job.kind == JobQueue.KIND_CHUNK:
+            result = result.offset_segments(job.params.get("chunk_start_seconds") or 0.0)
+        time_map = job.params.get("vad_time_map")
+        if result is not None and time_map:
+            result = result.map_segment_times(lambda seconds: to_original_time(seconds, time_map))
+        return result
+
+    def _resume_jobs(self) -> None:
+        """Put unfinished jobs of a previous run back into history and start the drainer."""
+        self.jobs.purge()
+        self.jobs.recover()
+        resumed = 0
+        for job in self.jobs.unfinished():
+            if not Path(job.filepath).exists():
+                self.jobs.fail(job.id, "audio file missing")
+                continue
+            if self.history.get_recording(job.recording_id) is None:
+                source = SourceType(job.params.get("source", SourceType.RECORDING.value))
+                self.history.add_recording(job.filepath, source=source, recording_id=job.recording_id,
+                                           capture_stats=job.params.get("capture_stats"))
+                recording = self.history.get_recording(job.recording_id)
+                if job.kind == JobQueue.KIND_CHUNK:
+                    recording.is_split = True
+                    recording.chunk_part = job.params.get("chunk_part")
+                    recording.parent_recording_id = job.params.get("parent_recording_id")
+                    recording.chunk_start_seconds = job.params.get("chunk_start_seconds")
+            resumed += 1
+        if resumed:
+            print(f"[QUEUE] Resuming {resumed} unfinished job(s) from the previous run")
+        self.runtime.submit(self.job_drainer.run())
+
+    def _on_queued_job_done(self, job: Job, result) -> None:
+        """Deliver a job finished by the background drainer (no auto-paste: the user has moved on)."""
+        if result is not None and result.text:
+            self.history.update_transcript(job.recording_id, result.text, result.segments)
+            self._show_toast("✅ Queued transcription completed", "success")
+        else:
+            self._show_toast("❌ Queued transcription failed", "error")
+        self._update_history_ui()
+
+    def _show_job_failed_toast(self, job: Job) -> None:
+        """Tell the user whether a failed job will be retried in the background."""
+        current = self.jobs.get(job.id)
+        if current is not None and current.status == JobQueue.PENDING:
+            self._show_toast("⏳ Transcription queued, will retry automatically", "warning")
+        else:
+            self._show_toast("❌ Transcription failed", "error")
+
+    def _service_offline(self) -> bool:
+        """True while the transcription service is unreachable (the local backend never is)."""
+        if self.transcriber.NAME != "groq":
+            return False
+        if get_circuit_breaker().state == "open":
+            return True
+        url = urlparse(os.getenv("GROQ_BASE_URL") or "https://api.groq.com")
+        port = url.port or (80 if url.scheme == "http" else 443)
+        try:
+            socket.create_connection((url.hostname, port), timeout=3).close()
+            return False
+        except OSError:
+            return True
+
+    async def _run_transcription(self, filepath: str, lang, translate: bool, latency_sensitive: bool = False):
+        """Transcribe a file, with segment timestamps if enabled in config."""
+        return await self.transcriber.transcribe_detailed_async(
+            filepath,
+            language=lang,
+            translate=translate,
+            with_segments=self.config.segment_timestamps_enabled(),
+            latency_sensitive=latency_sensitive
+        )
+
     def _evaluate_js(self, code: str):
         """Safely evaluate JavaScript code."""
         if self.dashboard_window:
@@ -440,6 +790,32 @@ class GroqWhisperApp:
             except Exception as e:
                 print(f"Warning: Could not update dashboard UI state: {e}")
 
+    def _ready_tooltip(self) -> str:
+        """Idle tray tooltip, including Groq availability."""
+        state = get_circuit_breaker().state
+        if state == "open":
+            return "Ready (Groq unavailable)"
+        if state == "half_open":
+            return "Ready (Groq recovering)"
+        return "Ready"
+
+    def _on_circuit_state_change(self, state: str) -> None:
+        """Reflect Groq circuit breaker state in the tray and dashboard."""
+        if not self._is_recording:
+            self.tray.update_tooltip(self._ready_tooltip())
+        retry_in = get_circuit_breaker().retry_in()
+        self._evaluate_js(f"""
+            if (typeof updateServiceStatus === 'function') {{
+                updateServiceStatus('{state}', {retry_in:.0f});
+            }}
+        """)
+        if state == "open":
+            self._show_toast("⚠️ Groq yanıt vermiyor, istekler geçici olarak durduruldu", "error")
+        elif state == "closed":
+            self._show_toast("✓ Groq bağlantısı düzeldi", "success")
+            # Jobs deferred while Groq was down can run now
+            self.job_drainer.wake()
+
     def _show_toast(self, message: str, toast_type: str = "success"):
         """Show toast notification in UI."""
         if self.dashboard_window:
@@ -498,6 +874,19 @@ class GroqWhisperApp:
     def reload_config(self):
         """Reload configuration called from API."""
         self.config.reload_env()
+
+        # Switch transcription backend if it was changed in .env
+        backend = self.config.get_transcription_backend()
+        if backend != self.transcriber.NAME:
+            try:
+                self.transcriber = create_transcriber(self.config)
+                print(f"Transcription backend switched to: {backend}")
+            except ValueError as e:
+                print(f"[ERROR] Could not switch transcription backend: {e}")
+
+        # Warm stream follows the setting and the selected microphone
+        if not self.recorder.is_recording():
+            self._apply_warm_stream()
         print("Config reloaded.")
 
     def show_dashboard(self):
@@ -532,7 +921,16 @@ class GroqWhisperApp:
             
         if hasattr(self, 'recorder'):
             try:
-                self.recorder.cleanup_temp_files()
+                # Keep audio of unfinished jobs: they resume on the next start
+                self.recorder.set_warm_stream(False)
+                self.recorder.set_capture_process(False)
+                self.recorder.cleanup_temp_files(keep=[job.filepath for job in self.jobs.unfinished()])
+            except:
+                pass
+
+        if hasattr(self, 'runtime'):
+            try:
+                self.runtime.stop()
             except:
                 pass
             
@@ -562,4 +960,6 @@ def main():
     app.run()
 
 if __name__ == "__main__":
+    # The capture process (CAPTURE_PROCESS) is started with multiprocessing
+    multiprocessing.freeze_support()
     main()
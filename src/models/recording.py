@@ -31,6 +31,11 @@ class Recording:
         chunk_job_id: ID of the split job (original recording ID).
         chunk_part: Part number if this is a chunk (1, 2, 3...).
         parent_recording_id: Parent ID if this is a chunk.
+        chunk_start_seconds: Start offset of the chunk in the original file.
+        segments: Timestamped segments (start, end, text, no_speech_prob), if requested.
+            Chunk segments are already offset to the original file's timeline.
+        capture_stats: Audio callback health while recording (overflows, dropped
+            blocks, callback timing), None for file uploads.
     """
     id: str
     filepath: str
@@ -44,6 +49,13 @@ class Recording:
     chunk_job_id: str | None = None  # ID of the split job (original recording ID)
     chunk_part: int | None = None  # Part number if this is a chunk (1, 2, 3...)
     parent_recording_id: str | None = None  # Parent ID if this is a chunk
+    chunk_start_seconds: float | None = None  # Chunk start in the original file
+
+    # Segment timestamps (verbose_json mode)
+    segments: list[dict] | None = None
+
+    # Capture health (microphone recordings only)
+    capture_stats: dict | None = None
 
     @property
     def filename(self) -> str:
@@ -0,0 +1,26 @@
+"""Tests for the CLI's output file naming."""
+
+import cli
+
+
+def test_outputs_use_the_stem(tmp_path):
+    audio = tmp_path / "talk.wav"
+    audio.touch()
+    assert cli.output_paths(audio, ["txt", "json"]) == [tmp_path / "talk.txt", tmp_path / "talk.json"]
+
+
+def test_outputs_keep_the_suffix_when_stems_collide(tmp_path):
+    wav, mp3 = tmp_path / "talk.wav", tmp_path / "talk.mp3"
+    wav.touch()
+    mp3.touch()
+    assert cli.output_paths(wav, ["txt"]) == [tmp_path / "talk.wav.txt"]
+    assert cli.output_paths(mp3, ["txt"]) == [tmp_path / "talk.mp3.txt"]
+
+
+def test_other_files_with_the_stem_do_not_collide(tmp_path):
+    audio = tmp_path / "talk.wav"
+    audio.touch()
+    (tmp_path / "talk.txt").touch()
+    (tmp_path / "talk.json").touch()
+    assert cli.output_paths(audio, ["txt"]) == [tmp_path / "talk.txt"]
+    assert cli.is_done(audio, ["txt", "json"])
@@ -0,0 +1,49 @@
+"""Seam handling of TranscriptMerger."""
+
+from datetime import datetime
+
+from core.transcript_merger import TranscriptMerger
+from models.recording import Recording
+
+
+def make_chunk(part: int, text: str) -> Recording:
+    return Recording(id=str(part), filepath=f"chunk_{part}.wav", created_at=datetime.now(),
+                     transcribed=True, transcript=text, chunk_part=part)
+
+
+def test_removes_duplicated_overlap():
+    merger = TranscriptMerger(overlap_seconds=3.0)
+    text = merger.merge([
+        make_chunk(1, "we talked about the numbers and then we decided to move on"),
+        make_chunk(2, "we decided to move on to the hiring plan"),
+    ])
+    assert text == "we talked about the numbers and then we decided to move on to the hiring plan"
+    assert merger.last_stats["aligned_seams"] == 1
+
+
+def test_repeated_phrase_later_in_head_is_not_overlap():
+    merger = TranscriptMerger(overlap_seconds=3.0)
+    tail = "We reviewed the budget. The rest of the plan is in the appendix."
+    head = ("Appendix. Next, the team discussed hiring, and the rest of the plan "
+            "will be revisited next week.")
+    text = merger.merge([make_chunk(1, tail), make_chunk(2, head)])
+    assert text == f"{tail} {head}"
+    assert merger.last_stats["dropped_tokens"] == 0
+
+
+def test_short_common_run_is_not_overlap():
+    merger = TranscriptMerger(overlap_seconds=3.0)
+    text = merger.merge([
+        make_chunk(1, "I said yes yes. Then we left"),
+        make_chunk(2, "we left. And then yes yes we came back"),
+    ])
+    assert text == "I said yes yes. Then we left we left. And then yes yes we came back"
+    assert merger.last_stats["dropped_tokens"] == 0
+
+
+def test_seam_never_drops_more_than_the_overlap_holds():
+    # A long identical run cannot all be overlap of a 1 s seam
+    merger = TranscriptMerger(overlap_seconds=1.0)
+    phrase = "one two three four five six seven eight"
+    text = merger.merge([make_chunk(1, f"start {phrase}"), make_chunk(2, f"{phrase} end")])
+    assert text == f"start {phrase} {phrase} end"
@@ -0,0 +1,83 @@
+"""VoiceActivityDetector on synthetic quiet-speech and noise signals."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from core.vad import VoiceActivityDetector, to_original_time
+
+RATE = 16000
+
+
+def db(level_db: float) -> float:
+    return 10 ** (level_db / 20)
+
+
+def noise(seconds: float, level_db: float, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0, db(level_db), int(seconds * RATE))
+
+
+def speech(seconds: float, level_db: float) -> np.ndarray:
+    """Voiced harmonics with a syllable-rate envelope, scaled to an RMS of level_db."""
+    t = np.arange(int(seconds * RATE)) / RATE
+    voice = sum(np.sin(2 * np.pi * 130 * k * t) / k for k in range(1, 10))
+    signal = voice * (0.55 + 0.45 * np.sin(2 * np.pi * 4 * t))
+    return signal / np.sqrt(np.mean(signal ** 2)) * db(level_db)
+
+
+def write_wav(path, signal: np.ndarray) -> str:
+    samples = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes(samples.tobytes())
+    return str(path)
+
+
+def kept_original_range(result):
+    """Original-timeline (start, end) of the uploaded audio."""
+    if not result.trimmed:
+        return 0.0, result.original_seconds
+    return to_original_time(0.0, result.time_map), to_original_time(result.kept_seconds - 1e-6, result.time_map)
+
+
+@pytest.mark.parametrize("speech_db", [-30, -40])
+def test_quiet_speech_in_silence_is_kept(tmp_path, speech_db):
+    # 1 s room tone, 2 s quiet speech, 1.5 s room tone
+    signal = np.concatenate([noise(1.0, -70), speech(2.0, speech_db) + noise(2.0, -70, 1), noise(1.5, -70, 2)])
+    result = VoiceActivityDetector().process_file(write_wav(tmp_path / "quiet.wav", signal))
+
+    assert result.has_speech
+    start, end = kept_original_range(result)
+    assert start <= 1.0 and end >= 3.0
+    assert result.trimmed  # the long trailing room tone is cut
+
+
+def test_quiet_speech_in_noisy_room_is_kept(tmp_path):
+    # Speech only ~10 dB above a steady noise floor
+    signal = np.concatenate([noise(1.0, -50), speech(2.0, -40) + noise(2.0, -50, 1), noise(1.0, -50, 2)])
+    result = VoiceActivityDetector().process_file(write_wav(tmp_path / "noisy.wav", signal))
+
+    assert result.has_speech
+    start, end = kept_original_range(result)
+    assert start <= 1.0 and end >= 3.0
+
+
+def test_steady_noise_is_uploaded_untrimmed(tmp_path):
+    path = write_wav(tmp_path / "fan.wav", noise(3.0, -35))
+    result = VoiceActivityDetector().process_file(path)
+
+    # Nothing is dropped: either all of it is kept or it is uploaded as it is
+    assert result.path == path
+    assert result.kept_seconds == pytest.approx(result.original_seconds)
+
+
+def test_silence_is_never_skipped(tmp_path):
+    path = write_wav(tmp_path / "silence.wav", noise(2.0, -80))
+    result = VoiceActivityDetector().process_file(path)
+
+    assert not result.has_speech
+    assert result.path == path
+    assert result.bytes_saved == 0